@@ -2,7 +2,11 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module import
-from plane.db.models import WorkspaceMember, ProjectMember
+from plane.utils.membership import (
+    get_workspace_role,
+    get_project_role,
+    is_project_member,
+)
 
 # Permission Mappings
 Admin = 20
@@ -19,25 +23,16 @@ class ProjectBasePermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) is not None
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Admin,
-            project_id=view.project_id,
-        ).exists()
+        return (
+            get_project_role(request, view.workspace_slug, view.project_id) == Admin
+        )
 
 
 class ProjectMemberPermission(BasePermission):
@@ -48,24 +43,16 @@ class ProjectMemberPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug, member=request.user
-            ).exists()
+            return is_project_member(request, view.workspace_slug)
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) in [Admin, Member]
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-        ).exists()
+        return get_project_role(request, view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 
 class ProjectEntityPermission(BasePermission):
@@ -76,19 +63,16 @@ class ProjectEntityPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-            ).exists()
+            return (
+                get_project_role(request, view.workspace_slug, view.project_id)
+                is not None
+            )
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-        ).exists()
+        return get_project_role(request, view.workspace_slug, view.project_id) in [
+            Admin,
+            Member,
+        ]
 
 
 class ProjectLitePermission(BasePermission):
@@ -97,8 +81,7 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
         
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-        ).exists()
\ No newline at end of file
+        return (
+            get_project_role(request, view.workspace_slug, view.project_id)
+            is not None
+        )
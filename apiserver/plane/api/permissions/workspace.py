@@ -2,7 +2,7 @@
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
-from plane.db.models import WorkspaceMember
+from plane.utils.membership import get_workspace_role
 
 
 # Permission Mappings
@@ -28,17 +28,11 @@ class WorkSpaceBasePermission(BasePermission):
 
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Owner, Admin],
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) in [Owner, Admin]
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user, workspace__slug=view.workspace_slug, role=Owner
-            ).exists()
+            return get_workspace_role(request, view.workspace_slug) == Owner
 
 
 class WorkSpaceAdminPermission(BasePermission):
@@ -46,11 +40,7 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Owner, Admin],
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) in [Owner, Admin]
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -58,6 +48,4 @@ class WorkspaceEntityPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user, workspace__slug=view.workspace_slug
-        ).exists()
+        return get_workspace_role(request, view.workspace_slug) is not None
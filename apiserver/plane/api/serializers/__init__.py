@@ -29,6 +29,7 @@ from .cycle import CycleSerializer, CycleIssueSerializer, CycleFavoriteSerialize
 from .asset import FileAssetSerializer
 from .issue import (
     IssueCreateSerializer,
+    IssueBulkUpdateSerializer,
     IssueActivitySerializer,
     IssueCommentSerializer,
     IssuePropertySerializer,
@@ -1,6 +1,13 @@
+# Django imports
+from django.core.exceptions import FieldError, ValidationError
+
+# Third party imports
+from rest_framework import serializers
+
+# Module imports
 from .base import BaseSerializer
 from plane.db.models import AnalyticView
-from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_filters import compile_issue_filters
 
 
 class AnalyticViewSerializer(BaseSerializer):
@@ -10,21 +17,20 @@ class AnalyticViewSerializer(BaseSerializer):
         read_only_fields = [
             "workspace",
             "query",
+            "query_columns",
         ]
 
+    def validate(self, data):
+        # The filters are compiled once here instead of on every read
+        if "query_dict" in data:
+            try:
+                data["query"], data["query_columns"] = compile_issue_filters(
+                    data["query_dict"]
+                )
+            except (FieldError, ValidationError, ValueError):
+                raise serializers.ValidationError({"query_dict": "Invalid filters"})
+        return data
+
     def create(self, validated_data):
-        query_params = validated_data.get("query_dict", {})
-        if bool(query_params):
-            validated_data["query"] = issue_filters(query_params, "POST")
-        else:
-            validated_data["query"] = dict()
+        validated_data.setdefault("query", dict())
         return AnalyticView.objects.create(**validated_data)
-
-    def update(self, instance, validated_data):
-        query_params = validated_data.get("query_data", {})
-        if bool(query_params):
-            validated_data["query"] = issue_filters(query_params, "POST")
-        else:
-            validated_data["query"] = dict()
-        validated_data["query"] = issue_filters(query_params, "PATCH")
-        return super().update(instance, validated_data)
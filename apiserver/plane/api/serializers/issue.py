@@ -30,6 +30,7 @@ from plane.db.models import (
     IssueLink,
     IssueAttachment,
 )
+from plane.utils.issue_relations import set_issue_relations
 
 
 class IssueFlatSerializer(BaseSerializer):
@@ -208,83 +209,67 @@ class IssueCreateSerializer(BaseSerializer):
         labels = validated_data.pop("labels_list", None)
         blocks = validated_data.pop("blocks_list", None)
 
-        # Related models
-        project_id = instance.project_id
-        workspace_id = instance.workspace_id
-        created_by_id = instance.created_by_id
-        updated_by_id = instance.updated_by_id
+        # Only the changed relations are written
+        set_issue_relations(
+            {
+                field: {instance.id: [related.id for related in values]}
+                for field, values in [
+                    ("blockers_list", blockers),
+                    ("assignees_list", assignees),
+                    ("labels_list", labels),
+                    ("blocks_list", blocks),
+                ]
+                if values is not None
+            },
+            project_id=instance.project_id,
+            workspace_id=instance.workspace_id,
+            created_by_id=instance.created_by_id,
+            updated_by_id=instance.updated_by_id,
+        )
 
-        if blockers is not None:
-            IssueBlocker.objects.filter(block=instance).delete()
-            IssueBlocker.objects.bulk_create(
-                [
-                    IssueBlocker(
-                        block=instance,
-                        blocked_by=blocker,
-                        project_id=project_id,
-                        workspace_id=workspace_id,
-                        created_by_id=created_by_id,
-                        updated_by_id=updated_by_id,
-                    )
-                    for blocker in blockers
-                ],
-                batch_size=10,
-            )
+        # Time updation occues even when other related models are updated
+        instance.updated_at = timezone.now()
+        return super().update(instance, validated_data)
 
-        if assignees is not None:
-            IssueAssignee.objects.filter(issue=instance).delete()
-            IssueAssignee.objects.bulk_create(
-                [
-                    IssueAssignee(
-                        assignee=user,
-                        issue=instance,
-                        project_id=project_id,
-                        workspace_id=workspace_id,
-                        created_by_id=created_by_id,
-                        updated_by_id=updated_by_id,
-                    )
-                    for user in assignees
-                ],
-                batch_size=10,
-            )
 
-        if labels is not None:
-            IssueLabel.objects.filter(issue=instance).delete()
-            IssueLabel.objects.bulk_create(
-                [
-                    IssueLabel(
-                        label=label,
-                        issue=instance,
-                        project_id=project_id,
-                        workspace_id=workspace_id,
-                        created_by_id=created_by_id,
-                        updated_by_id=updated_by_id,
-                    )
-                    for label in labels
-                ],
-                batch_size=10,
-            )
+class IssueBulkUpdateSerializer(BaseSerializer):
+    """Changes of a single issue in a batch update, references are checked in bulk"""
 
-        if blocks is not None:
-            IssueBlocker.objects.filter(blocked_by=instance).delete()
-            IssueBlocker.objects.bulk_create(
-                [
-                    IssueBlocker(
-                        block=block,
-                        blocked_by=instance,
-                        project_id=project_id,
-                        workspace_id=workspace_id,
-                        created_by_id=created_by_id,
-                        updated_by_id=updated_by_id,
-                    )
-                    for block in blocks
-                ],
-                batch_size=10,
-            )
+    id = serializers.UUIDField()
+    state = serializers.UUIDField(required=False)
+    parent = serializers.UUIDField(required=False, allow_null=True)
+    assignees_list = serializers.ListField(
+        child=serializers.UUIDField(), required=False
+    )
+    labels_list = serializers.ListField(child=serializers.UUIDField(), required=False)
+    blockers_list = serializers.ListField(
+        child=serializers.UUIDField(), required=False
+    )
+    blocks_list = serializers.ListField(child=serializers.UUIDField(), required=False)
 
-        # Time updation occues even when other related models are updated
-        instance.updated_at = timezone.now()
-        return super().update(instance, validated_data)
+    class Meta:
+        model = Issue
+        fields = [
+            "id",
+            "name",
+            "state",
+            "parent",
+            "priority",
+            "start_date",
+            "target_date",
+            "estimate_point",
+            "sort_order",
+            "assignees_list",
+            "labels_list",
+            "blockers_list",
+            "blocks_list",
+        ]
+
+    def validate(self, data):
+        # Partial updates skip the required check of the id
+        if "id" not in data:
+            raise serializers.ValidationError(detail="Issue id is required")
+        return data
 
 
 class IssueActivitySerializer(BaseSerializer):
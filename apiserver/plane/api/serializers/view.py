@@ -1,3 +1,6 @@
+# Django imports
+from django.core.exceptions import FieldError, ValidationError
+
 # Third party imports
 from rest_framework import serializers
 
@@ -6,7 +9,7 @@ from .base import BaseSerializer
 from .workspace import WorkspaceLiteSerializer
 from .project import ProjectLiteSerializer
 from plane.db.models import IssueView, IssueViewFavorite
-from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_filters import compile_issue_filters
 
 
 class IssueViewSerializer(BaseSerializer):
@@ -21,25 +24,24 @@ class IssueViewSerializer(BaseSerializer):
             "workspace",
             "project",
             "query",
+            "query_columns",
         ]
 
+    def validate(self, data):
+        # The filters are compiled once here instead of on every read
+        if "query_data" in data:
+            try:
+                data["query"], data["query_columns"] = compile_issue_filters(
+                    data["query_data"]
+                )
+            except (FieldError, ValidationError, ValueError):
+                raise serializers.ValidationError({"query_data": "Invalid filters"})
+        return data
+
     def create(self, validated_data):
-        query_params = validated_data.get("query_data", {})
-        if bool(query_params):
-            validated_data["query"] = issue_filters(query_params, "POST")
-        else:
-            validated_data["query"] = dict()
+        validated_data.setdefault("query", dict())
         return IssueView.objects.create(**validated_data)
 
-    def update(self, instance, validated_data):
-        query_params = validated_data.get("query_data", {})
-        if bool(query_params):
-            validated_data["query"] = issue_filters(query_params, "POST")
-        else:
-            validated_data["query"] = dict()
-        validated_data["query"] = issue_filters(query_params, "PATCH")
-        return super().update(instance, validated_data)
-
 
 class IssueViewFavoriteSerializer(BaseSerializer):
     view_detail = IssueViewSerializer(source="issue_view", read_only=True)
@@ -71,11 +71,16 @@ from plane.api.views import (
     IssueViewSet,
     WorkSpaceIssuesEndpoint,
     IssueActivityEndpoint,
+    IssueTimelineEndpoint,
     IssueCommentViewSet,
     UserWorkSpaceIssues,
+    IssueSyncEndpoint,
+    UserWorkSpaceIssuesSyncEndpoint,
     BulkDeleteIssuesEndpoint,
+    BulkUpdateIssuesEndpoint,
     BulkImportIssuesEndpoint,
     ProjectUserViewsEndpoint,
+    ProjectEventTicketEndpoint,
     IssuePropertyViewSet,
     LabelViewSet,
     SubIssuesEndpoint,
@@ -505,6 +510,11 @@ urlpatterns = [
         ProjectMemberUserEndpoint.as_view(),
         name="project-view",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/event-tickets/",
+        ProjectEventTicketEndpoint.as_view(),
+        name="project-event-tickets",
+    ),
     path(
         "workspaces/<str:slug>/user-favorite-projects/",
         ProjectFavoritesViewSet.as_view(
@@ -722,6 +732,11 @@ urlpatterns = [
         ),
         name="project-issue",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/sync/",
+        IssueSyncEndpoint.as_view(),
+        name="project-issue-sync",
+    ),
     path(
         "workspaces/<str:slug>/issues/",
         WorkSpaceIssuesEndpoint.as_view(),
@@ -759,6 +774,11 @@ urlpatterns = [
         BulkDeleteIssuesEndpoint.as_view(),
         name="project-issues-bulk",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-update-issues/",
+        BulkUpdateIssuesEndpoint.as_view(),
+        name="project-issues-bulk-update",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/bulk-import-issues/<str:service>/",
         BulkImportIssuesEndpoint.as_view(),
@@ -769,6 +789,11 @@ urlpatterns = [
         UserWorkSpaceIssues.as_view(),
         name="workspace-issues",
     ),
+    path(
+        "workspaces/<str:slug>/my-issues/sync/",
+        UserWorkSpaceIssuesSyncEndpoint.as_view(),
+        name="workspace-issues-sync",
+    ),
     path(
         "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/sub-issues/",
         SubIssuesEndpoint.as_view(),
@@ -813,6 +838,11 @@ urlpatterns = [
         IssueActivityEndpoint.as_view(),
         name="project-issue-history",
     ),
+    path(
+        "workspaces/<str:slug>/projects/<uuid:project_id>/issues/<uuid:issue_id>/timeline/",
+        IssueTimelineEndpoint.as_view(),
+        name="project-issue-timeline",
+    ),
     ## Issue Activity
     ## IssueComments
     path(
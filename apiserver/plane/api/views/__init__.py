@@ -11,6 +11,7 @@ from .project import (
     ProjectJoinEndpoint,
     ProjectUserViewsEndpoint,
     ProjectMemberUserEndpoint,
+    ProjectEventTicketEndpoint,
     ProjectFavoritesViewSet,
 )
 from .people import (
@@ -62,11 +63,15 @@ from .issue import (
     IssueViewSet,
     WorkSpaceIssuesEndpoint,
     IssueActivityEndpoint,
+    IssueTimelineEndpoint,
     IssueCommentViewSet,
     IssuePropertyViewSet,
     LabelViewSet,
     BulkDeleteIssuesEndpoint,
+    BulkUpdateIssuesEndpoint,
     UserWorkSpaceIssues,
+    IssueSyncEndpoint,
+    UserWorkSpaceIssuesSyncEndpoint,
     SubIssuesEndpoint,
     IssueLinkViewSet,
     BulkCreateIssueLabelsEndpoint,
@@ -17,7 +17,12 @@ from plane.api.views import BaseAPIView, BaseViewSet
 from plane.api.permissions import WorkSpaceAdminPermission
 from plane.db.models import Issue, AnalyticView, Workspace, State, Label
 from plane.api.serializers import AnalyticViewSerializer
-from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_plot import (
+    build_graph_plot,
+    build_rollup_plot,
+    count_rollup_issues,
+    get_cached_analytics,
+)
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.utils.issue_filters import issue_filters
 
@@ -41,59 +46,72 @@ class AnalyticsEndpoint(BaseAPIView):
             segment = request.GET.get("segment", False)
             filters = issue_filters(request.GET, "GET")
 
-            queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
+            workspace = Workspace.objects.only("id").get(slug=slug)
 
-            total_issues = queryset.count()
-            distribution = build_graph_plot(
-                queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
-            )
+            def get_analytics():
+                queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
+
+                total_issues = count_rollup_issues(workspace.id, filters)
+                if total_issues is None:
+                    total_issues = queryset.count()
 
-            colors = dict()
-            if x_axis in ["state__name", "state__group"] or segment in [
-                "state__name",
-                "state__group",
-            ]:
-                if x_axis in ["state__name", "state__group"]:
-                    key = "name" if x_axis == "state__name" else "group"
-                else:
-                    key = "name" if segment == "state__name" else "group"
-
-                colors = (
-                    State.objects.filter(
-                        ~Q(name="Triage"),
-                        workspace__slug=slug, project_id__in=filters.get("project__in")
-                    ).values(key, "color")
-                    if filters.get("project__in", False)
-                    else State.objects.filter(~Q(name="Triage"), workspace__slug=slug).values(key, "color")
+                distribution = build_rollup_plot(
+                    workspace.id, filters, x_axis=x_axis, y_axis=y_axis, segment=segment
                 )
+                if distribution is None:
+                    distribution = build_graph_plot(
+                        queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
+                    )
 
-            if x_axis in ["labels__name"] or segment in ["labels__name"]:
-                colors = (
-                    Label.objects.filter(
-                        workspace__slug=slug, project_id__in=filters.get("project__in")
-                    ).values("name", "color")
-                    if filters.get("project__in", False)
-                    else Label.objects.filter(workspace__slug=slug).values(
-                        "name", "color"
+                colors = dict()
+                if x_axis in ["state__name", "state__group"] or segment in [
+                    "state__name",
+                    "state__group",
+                ]:
+                    if x_axis in ["state__name", "state__group"]:
+                        key = "name" if x_axis == "state__name" else "group"
+                    else:
+                        key = "name" if segment == "state__name" else "group"
+
+                    colors = list(
+                        State.objects.filter(
+                            ~Q(name="Triage"),
+                            workspace__slug=slug, project_id__in=filters.get("project__in")
+                        ).values(key, "color")
+                        if filters.get("project__in", False)
+                        else State.objects.filter(~Q(name="Triage"), workspace__slug=slug).values(key, "color")
                     )
-                )
 
-            assignee_details = {}
-            if x_axis in ["assignees__email"] or segment in ["assignees__email"]:
-                assignee_details = (
-                    Issue.issue_objects.filter(workspace__slug=slug, **filters, assignees__avatar__isnull=False)
-                    .order_by("assignees__id")
-                    .distinct("assignees__id")
-                    .values("assignees__avatar", "assignees__email", "assignees__first_name", "assignees__last_name")
-                )
+                if x_axis in ["labels__name"] or segment in ["labels__name"]:
+                    colors = list(
+                        Label.objects.filter(
+                            workspace__slug=slug, project_id__in=filters.get("project__in")
+                        ).values("name", "color")
+                        if filters.get("project__in", False)
+                        else Label.objects.filter(workspace__slug=slug).values(
+                            "name", "color"
+                        )
+                    )
 
+                assignee_details = {}
+                if x_axis in ["assignees__email"] or segment in ["assignees__email"]:
+                    assignee_details = list(
+                        Issue.issue_objects.filter(workspace__slug=slug, **filters, assignees__avatar__isnull=False)
+                        .order_by("assignees__id")
+                        .distinct("assignees__id")
+                        .values("assignees__avatar", "assignees__email", "assignees__first_name", "assignees__last_name")
+                    )
 
-            return Response(
-                {
+                return {
                     "total": total_issues,
                     "distribution": distribution,
                     "extras": {"colors": colors, "assignee_details": assignee_details},
-                },
+                }
+
+            return Response(
+                get_cached_analytics(
+                    workspace.id, "analytics", request.GET.lists(), get_analytics
+                ),
                 status=status.HTTP_200_OK,
             )
 
@@ -133,8 +151,10 @@ class SavedAnalyticEndpoint(BaseAPIView):
                 pk=analytic_id, workspace__slug=slug
             )
 
-            filter = analytic_view.query
-            queryset = Issue.issue_objects.filter(**filter)
+            # The saved query is compiled when the view is saved
+            queryset = Issue.issue_objects.filter(
+                **analytic_view.query, workspace_id=analytic_view.workspace_id
+            )
 
             x_axis = analytic_view.query_dict.get("x_axis", False)
             y_axis = analytic_view.query_dict.get("y_axis", False)
@@ -146,12 +166,21 @@ class SavedAnalyticEndpoint(BaseAPIView):
                 )
 
             segment = request.GET.get("segment", False)
-            distribution = build_graph_plot(
-                queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
-            )
-            total_issues = queryset.count()
+
+            def get_analytics():
+                distribution = build_graph_plot(
+                    queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
+                )
+                total_issues = queryset.count()
+                return {"total": total_issues, "distribution": distribution}
+
             return Response(
-                {"total": total_issues, "distribution": distribution},
+                get_cached_analytics(
+                    analytic_view.workspace_id,
+                    "saved_analytics",
+                    [analytic_view.id, analytic_view.updated_at, segment],
+                    get_analytics,
+                ),
                 status=status.HTTP_200_OK,
             )
 
@@ -184,6 +213,12 @@ class ExportAnalyticsEndpoint(BaseAPIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            if request.data.get("format", "csv") not in ["csv", "xlsx"]:
+                return Response(
+                    {"error": "Export format must be csv or xlsx"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
             analytic_export_task.delay(
                 email=request.user.email, data=request.data, slug=slug
             )
@@ -211,81 +246,87 @@ class DefaultAnalyticsEndpoint(BaseAPIView):
         try:
             filters = issue_filters(request.GET, "GET")
 
-            queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
+            workspace = Workspace.objects.only("id").get(slug=slug)
 
-            total_issues = queryset.count()
+            def get_analytics():
+                queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
-            total_issues_classified = (
-                queryset.annotate(state_group=F("state__group"))
-                .values("state_group")
-                .annotate(state_count=Count("state_group"))
-                .order_by("state_group")
-            )
+                total_issues = queryset.count()
 
-            open_issues = queryset.filter(
-                state__group__in=["backlog", "unstarted", "started"]
-            ).count()
+                total_issues_classified = (
+                    queryset.annotate(state_group=F("state__group"))
+                    .values("state_group")
+                    .annotate(state_count=Count("state_group"))
+                    .order_by("state_group")
+                )
 
-            open_issues_classified = (
-                queryset.filter(state__group__in=["backlog", "unstarted", "started"])
-                .annotate(state_group=F("state__group"))
-                .values("state_group")
-                .annotate(state_count=Count("state_group"))
-                .order_by("state_group")
-            )
+                open_issues = queryset.filter(
+                    state__group__in=["backlog", "unstarted", "started"]
+                ).count()
+
+                open_issues_classified = (
+                    queryset.filter(state__group__in=["backlog", "unstarted", "started"])
+                    .annotate(state_group=F("state__group"))
+                    .values("state_group")
+                    .annotate(state_count=Count("state_group"))
+                    .order_by("state_group")
+                )
 
-            issue_completed_month_wise = (
-                queryset.filter(completed_at__isnull=False)
-                .annotate(month=ExtractMonth("completed_at"))
-                .values("month")
-                .annotate(count=Count("*"))
-                .order_by("month")
-            )
-            most_issue_created_user = (
-                queryset.exclude(created_by=None)
-                .values("created_by__first_name", "created_by__last_name", "created_by__avatar", "created_by__email")
-                .annotate(count=Count("id"))
-                .order_by("-count")
-            )[:5]
-
-            most_issue_closed_user = (
-                queryset.filter(completed_at__isnull=False, assignees__isnull=False)
-                .values("assignees__first_name", "assignees__last_name", "assignees__avatar", "assignees__email")
-                .annotate(count=Count("id"))
-                .order_by("-count")
-            )[:5]
-
-            pending_issue_user = (
-                queryset.filter(completed_at__isnull=True)
-                .values("assignees__first_name", "assignees__last_name", "assignees__avatar", "assignees__email")
-                .annotate(count=Count("id"))
-                .order_by("-count")
-            )
+                issue_completed_month_wise = (
+                    queryset.filter(completed_at__isnull=False)
+                    .annotate(month=ExtractMonth("completed_at"))
+                    .values("month")
+                    .annotate(count=Count("*"))
+                    .order_by("month")
+                )
+                most_issue_created_user = (
+                    queryset.exclude(created_by=None)
+                    .values("created_by__first_name", "created_by__last_name", "created_by__avatar", "created_by__email")
+                    .annotate(count=Count("id"))
+                    .order_by("-count")
+                )[:5]
+
+                most_issue_closed_user = (
+                    queryset.filter(completed_at__isnull=False, assignees__isnull=False)
+                    .values("assignees__first_name", "assignees__last_name", "assignees__avatar", "assignees__email")
+                    .annotate(count=Count("id"))
+                    .order_by("-count")
+                )[:5]
+
+                pending_issue_user = (
+                    queryset.filter(completed_at__isnull=True)
+                    .values("assignees__first_name", "assignees__last_name", "assignees__avatar", "assignees__email")
+                    .annotate(count=Count("id"))
+                    .order_by("-count")
+                )
 
-            open_estimate_sum = (
-                queryset.filter(
-                    state__group__in=["backlog", "unstarted", "started"]
-                ).aggregate(open_estimate_sum=Sum("estimate_point"))
-            )["open_estimate_sum"]
-            print(open_estimate_sum)
-            
-            total_estimate_sum = queryset.aggregate(
-                total_estimate_sum=Sum("estimate_point")
-            )["total_estimate_sum"]
+                open_estimate_sum = (
+                    queryset.filter(
+                        state__group__in=["backlog", "unstarted", "started"]
+                    ).aggregate(open_estimate_sum=Sum("estimate_point"))
+                )["open_estimate_sum"]
 
-            return Response(
-                {
+                total_estimate_sum = queryset.aggregate(
+                    total_estimate_sum=Sum("estimate_point")
+                )["total_estimate_sum"]
+
+                return {
                     "total_issues": total_issues,
-                    "total_issues_classified": total_issues_classified,
+                    "total_issues_classified": list(total_issues_classified),
                     "open_issues": open_issues,
-                    "open_issues_classified": open_issues_classified,
-                    "issue_completed_month_wise": issue_completed_month_wise,
-                    "most_issue_created_user": most_issue_created_user,
-                    "most_issue_closed_user": most_issue_closed_user,
-                    "pending_issue_user": pending_issue_user,
+                    "open_issues_classified": list(open_issues_classified),
+                    "issue_completed_month_wise": list(issue_completed_month_wise),
+                    "most_issue_created_user": list(most_issue_created_user),
+                    "most_issue_closed_user": list(most_issue_closed_user),
+                    "pending_issue_user": list(pending_issue_user),
                     "open_estimate_sum": open_estimate_sum,
                     "total_estimate_sum": total_estimate_sum,
-                },
+                }
+
+            return Response(
+                get_cached_analytics(
+                    workspace.id, "default_analytics", request.GET.lists(), get_analytics
+                ),
                 status=status.HTTP_200_OK,
             )
 
@@ -5,15 +5,15 @@ import json
 from django.db import IntegrityError
 from django.db.models import (
     OuterRef,
-    Func,
     F,
     Q,
     Exists,
     OuterRef,
     Count,
     Prefetch,
-    Sum,
+    Value,
 )
+from django.db.models.functions import Coalesce
 from django.core import serializers
 from django.utils import timezone
 from django.utils.decorators import method_decorator
@@ -40,14 +40,15 @@ from plane.db.models import (
     CycleIssue,
     Issue,
     CycleFavorite,
-    IssueLink,
-    IssueAttachment,
     Label,
+    CycleProgress,
 )
+from plane.db.models.progress import PROGRESS_FIELDS
 from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.membership import get_member_project_ids
 
 
 class CycleViewSet(BaseViewSet):
@@ -96,54 +97,16 @@ class CycleViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("owned_by")
             .annotate(is_favorite=Exists(subquery))
-            .annotate(total_issues=Count("issue_cycle"))
             .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="completed"),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="cancelled"),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="started"),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="unstarted"),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(issue_cycle__issue__state__group="backlog"),
-                )
-            )
-            .annotate(total_estimates=Sum("issue_cycle__issue__estimate_point"))
-            .annotate(
-                completed_estimates=Sum(
-                    "issue_cycle__issue__estimate_point",
-                    filter=Q(issue_cycle__issue__state__group="completed"),
-                )
-            )
-            .annotate(
-                started_estimates=Sum(
-                    "issue_cycle__issue__estimate_point",
-                    filter=Q(issue_cycle__issue__state__group="started"),
-                )
+                **{
+                    field: Coalesce(F(f"progress__{field}"), Value(0))
+                    for field in PROGRESS_FIELDS
+                }
             )
             .prefetch_related(
                 Prefetch(
@@ -158,7 +121,6 @@ class CycleViewSet(BaseViewSet):
                 )
             )
             .order_by("-is_favorite", "name")
-            .distinct()
         )
 
     def list(self, request, slug, project_id):
@@ -481,15 +443,10 @@ class CycleIssueViewSet(BaseViewSet):
         return self.filter_queryset(
             super()
             .get_queryset()
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue_id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(sub_issues_count=F("issue__sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .filter(cycle_id=self.kwargs.get("cycle_id"))
             .select_related("project")
             .select_related("workspace")
@@ -507,12 +464,6 @@ class CycleIssueViewSet(BaseViewSet):
             filters = issue_filters(request.query_params, "GET")
             issues = (
                 Issue.issue_objects.filter(issue_cycle__cycle_id=cycle_id)
-                .annotate(
-                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .annotate(bridge_id=F("issue_cycle__id"))
                 .filter(project_id=project_id)
                 .filter(workspace__slug=slug)
@@ -524,20 +475,6 @@ class CycleIssueViewSet(BaseViewSet):
                 .prefetch_related("labels")
                 .order_by(order_by)
                 .filter(**filters)
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
             )
 
             issues_data = IssueStateSerializer(issues, many=True).data
@@ -627,6 +564,15 @@ class CycleIssueViewSet(BaseViewSet):
                 batch_size=10,
             )
 
+            # Bulk writes skip the signals, refresh the progress of the cycles
+            CycleProgress.refresh(
+                [cycle_id]
+                + [
+                    activity["old_cycle_id"]
+                    for activity in update_cycle_issue_activity
+                ]
+            )
+
             # Capture Issue Activity
             issue_activity.delay(
                 type="cycle.activity.created",
@@ -814,6 +760,8 @@ class TransferCycleIssueEndpoint(BaseAPIView):
                 updated_cycles, ["cycle_id"], batch_size=100
             )
 
+            CycleProgress.refresh([cycle_id, new_cycle_id])
+
             return Response({"message": "Success"}, status=status.HTTP_200_OK)
         except Cycle.DoesNotExist:
             return Response(
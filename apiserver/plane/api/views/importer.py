@@ -7,7 +7,7 @@ from rest_framework.response import Response
 from sentry_sdk import capture_exception
 
 # Django imports
-from django.db.models import Max, Q
+from django.db.models import Q
 
 # Module imports
 from plane.api.views import BaseAPIView
@@ -17,17 +17,12 @@ from plane.db.models import (
     APIToken,
     Project,
     State,
-    IssueSequence,
     Issue,
-    IssueActivity,
-    IssueComment,
-    IssueLink,
-    IssueLabel,
     Workspace,
-    IssueAssignee,
     Module,
     ModuleLink,
     ModuleIssue,
+    ModuleProgress,
     Label,
 )
 from plane.api.serializers import (
@@ -38,7 +33,7 @@ from plane.api.serializers import (
 from plane.utils.integrations.github import get_github_repo_details
 from plane.utils.importers.jira import jira_project_issue_summary
 from plane.bgtasks.importer_task import service_importer
-from plane.utils.html_processor import strip_tags
+from plane.utils.issue_import import import_issues, iter_ndjson
 
 
 class ServiceIssueImportSummaryEndpoint(BaseAPIView):
@@ -332,24 +327,54 @@ class BulkImportIssuesEndpoint(BaseAPIView):
             # if there is no default state assign any random state
             if default_state is None:
                 default_state = State.objects.filter(
-                    ~Q(name="Triage"), sproject_id=project_id
+                    ~Q(name="Triage"), project_id=project_id
                 ).first()
 
-            # Get the maximum sequence_id
-            last_id = IssueSequence.objects.filter(project_id=project_id).aggregate(
-                largest=Max("sequence")
-            )["largest"]
-
-            last_id = 1 if last_id is None else last_id + 1
-
-            # Get the maximum sort order
-            largest_sort_order = Issue.objects.filter(
-                project_id=project_id, state=default_state
-            ).aggregate(largest=Max("sort_order"))["largest"]
-
-            largest_sort_order = (
-                65535 if largest_sort_order is None else largest_sort_order + 10000
-            )
+            # Progress is counted on the importer when it is passed
+            importer_id = request.GET.get("importer_id", None)
+
+            # Newline delimited bodies are streamed, one issue per line. The
+            # body is read from the django request, the stream of the rest
+            # framework request is empty without a Content-Length header
+            if request.content_type == "application/x-ndjson":
+                issues = []
+                try:
+                    for issue in import_issues(
+                        project,
+                        default_state,
+                        request.user,
+                        service,
+                        iter_ndjson(request._request),
+                        importer_id=importer_id,
+                    ):
+                        issues.append({"id": issue.id, "sequence_id": issue.sequence_id})
+                # The chunks before the failing one are committed, the
+                # response tells which issues were imported
+                except ValueError:
+                    return Response(
+                        {
+                            "error": "Invalid issue data",
+                            "imported_issues": len(issues),
+                            "issues": issues,
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                except Exception as e:
+                    capture_exception(e)
+                    return Response(
+                        {
+                            "error": "Something went wrong please try again later",
+                            "imported_issues": len(issues),
+                            "issues": issues,
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if not len(issues):
+                    return Response(
+                        {"error": "Issue data is required"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                return Response({"issues": issues}, status=status.HTTP_201_CREATED)
 
             # Get the issues_data
             issues_data = request.data.get("issues_data", [])
@@ -360,144 +385,15 @@ class BulkImportIssuesEndpoint(BaseAPIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Issues
-            bulk_issues = []
-            for issue_data in issues_data:
-                bulk_issues.append(
-                    Issue(
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        state_id=issue_data.get("state")
-                        if issue_data.get("state", False)
-                        else default_state.id,
-                        name=issue_data.get("name", "Issue Created through Bulk"),
-                        description_html=issue_data.get("description_html", "<p></p>"),
-                        description_stripped=(
-                            None
-                            if (
-                                issue_data.get("description_html") == ""
-                                or issue_data.get("description_html") is None
-                            )
-                            else strip_tags(issue_data.get("description_html"))
-                        ),
-                        sequence_id=last_id,
-                        sort_order=largest_sort_order,
-                        start_date=issue_data.get("start_date", None),
-                        target_date=issue_data.get("target_date", None),
-                        priority=issue_data.get("priority", None),
-                        created_by=request.user,
-                    )
+            issues = list(
+                import_issues(
+                    project,
+                    default_state,
+                    request.user,
+                    service,
+                    issues_data,
+                    importer_id=importer_id,
                 )
-
-                largest_sort_order = largest_sort_order + 10000
-                last_id = last_id + 1
-
-            issues = Issue.objects.bulk_create(
-                bulk_issues,
-                batch_size=100,
-                ignore_conflicts=True,
-            )
-
-            # Sequences
-            _ = IssueSequence.objects.bulk_create(
-                [
-                    IssueSequence(
-                        issue=issue,
-                        sequence=issue.sequence_id,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                    )
-                    for issue in issues
-                ],
-                batch_size=100,
-            )
-
-            # Attach Labels
-            bulk_issue_labels = []
-            for issue, issue_data in zip(issues, issues_data):
-                labels_list = issue_data.get("labels_list", [])
-                bulk_issue_labels = bulk_issue_labels + [
-                    IssueLabel(
-                        issue=issue,
-                        label_id=label_id,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                    )
-                    for label_id in labels_list
-                ]
-
-            _ = IssueLabel.objects.bulk_create(
-                bulk_issue_labels, batch_size=100, ignore_conflicts=True
-            )
-
-            # Attach Assignees
-            bulk_issue_assignees = []
-            for issue, issue_data in zip(issues, issues_data):
-                assignees_list = issue_data.get("assignees_list", [])
-                bulk_issue_assignees = bulk_issue_assignees + [
-                    IssueAssignee(
-                        issue=issue,
-                        assignee_id=assignee_id,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                    )
-                    for assignee_id in assignees_list
-                ]
-
-            _ = IssueAssignee.objects.bulk_create(
-                bulk_issue_assignees, batch_size=100, ignore_conflicts=True
-            )
-
-            # Track the issue activities
-            IssueActivity.objects.bulk_create(
-                [
-                    IssueActivity(
-                        issue=issue,
-                        actor=request.user,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        comment=f"{request.user.email} importer the issue from {service}",
-                        verb="created",
-                        created_by=request.user,
-                    )
-                    for issue in issues
-                ],
-                batch_size=100,
-            )
-
-            # Create Comments
-            bulk_issue_comments = []
-            for issue, issue_data in zip(issues, issues_data):
-                comments_list = issue_data.get("comments_list", [])
-                bulk_issue_comments = bulk_issue_comments + [
-                    IssueComment(
-                        issue=issue,
-                        comment_html=comment.get("comment_html", "<p></p>"),
-                        actor=request.user,
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                    )
-                    for comment in comments_list
-                ]
-
-            _ = IssueComment.objects.bulk_create(bulk_issue_comments, batch_size=100)
-
-            # Attach Links
-            _ = IssueLink.objects.bulk_create(
-                [
-                    IssueLink(
-                        issue=issue,
-                        url=issue_data.get("link", {}).get("url", "https://github.com"),
-                        title=issue_data.get("link", {}).get("title", "Original Issue"),
-                        project_id=project_id,
-                        workspace_id=project.workspace_id,
-                        created_by=request.user,
-                    )
-                    for issue, issue_data in zip(issues, issues_data)
-                ]
             )
 
             return Response(
@@ -508,6 +404,10 @@ class BulkImportIssuesEndpoint(BaseAPIView):
             return Response(
                 {"error": "Project Does not exist"}, status=status.HTTP_404_NOT_FOUND
             )
+        except ValueError:
+            return Response(
+                {"error": "Invalid issue data"}, status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -579,6 +479,7 @@ class BulkImportModulesEndpoint(BaseAPIView):
                 _ = ModuleIssue.objects.bulk_create(
                     bulk_module_issues, batch_size=100, ignore_conflicts=True
                 )
+                ModuleProgress.refresh([module.id for module in modules])
 
                 serializer = ModuleSerializer(modules, many=True)
                 return Response(
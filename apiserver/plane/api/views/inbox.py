@@ -3,7 +3,7 @@ import json
 
 # Django import
 from django.utils import timezone
-from django.db.models import Q, Count, OuterRef, Func, F, Prefetch
+from django.db.models import Q, Count, F, Prefetch
 from django.core.serializers.json import DjangoJSONEncoder
 
 # Third party imports
@@ -20,8 +20,6 @@ from plane.db.models import (
     InboxIssue,
     Issue,
     State,
-    IssueLink,
-    IssueAttachment,
     ProjectMember,
 )
 from plane.api.serializers import (
@@ -123,26 +121,6 @@ class InboxIssueViewSet(BaseViewSet):
                 .select_related("workspace", "project", "state", "parent")
                 .prefetch_related("assignees", "labels")
                 .order_by("issue_inbox__snoozed_till", "issue_inbox__status")
-                .annotate(
-                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .prefetch_related(
                     Prefetch(
                         "issue_inbox",
@@ -7,7 +7,6 @@ from itertools import chain
 from django.db.models import (
     Prefetch,
     OuterRef,
-    Func,
     F,
     Q,
     Count,
@@ -19,10 +18,14 @@ from django.db.models import (
     Max,
 )
 from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
 from django.db.models.functions import Coalesce
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 # Third Party imports
 from rest_framework.response import Response
@@ -34,6 +37,7 @@ from sentry_sdk import capture_exception
 from . import BaseViewSet, BaseAPIView
 from plane.api.serializers import (
     IssueCreateSerializer,
+    IssueBulkUpdateSerializer,
     IssueActivitySerializer,
     IssueCommentSerializer,
     IssuePropertySerializer,
@@ -65,11 +69,43 @@ from plane.db.models import (
     IssueAttachment,
     State,
     IssueSubscriber,
+    IssueTombstone,
     ProjectMember,
+    PageBlock,
+    User,
+)
+from plane.db.models.analytic import invalidate_analytics
+from plane.db.models.issue import release_sort_orders
+from plane.db.models.progress import refresh_issue_progress
+from plane.bgtasks.issue_activites_task import issue_activity, bulk_issue_activity
+from plane.utils.grouper import (
+    group_field,
+    group_filters,
+    group_counts,
 )
-from plane.bgtasks.issue_activites_task import issue_activity
-from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
+from plane.utils.paginator import (
+    KeysetPaginator,
+    KeysetCursor,
+    UnionKeysetPaginator,
+)
+from plane.utils.membership import get_member_project_ids
+from plane.utils.issue_rows import (
+    issue_list_data,
+    issue_list_values,
+    is_normalized,
+    serialize_issue_rows,
+)
+from plane.utils.issue_sync import sync_issues
+from plane.utils.issue_stream import stream_issues
+from plane.utils.issue_relations import (
+    RELATION_FIELDS,
+    get_activity_instances,
+    set_issue_relations,
+)
+
+# Issues changed by a single batch update
+BULK_UPDATE_LIMIT = 500
 
 
 class IssueViewSet(BaseViewSet):
@@ -138,13 +174,7 @@ class IssueViewSet(BaseViewSet):
 
     def get_queryset(self):
         return (
-            Issue.issue_objects.annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(project_id=self.kwargs.get("project_id"))
+            Issue.issue_objects.filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
             .select_related("workspace")
@@ -158,7 +188,6 @@ class IssueViewSet(BaseViewSet):
     def list(self, request, slug, project_id):
         try:
             filters = issue_filters(request.query_params, "GET")
-            print(filters)
 
             # Custom ordering for priority and state
             priority_order = ["urgent", "high", "medium", "low", None]
@@ -171,20 +200,6 @@ class IssueViewSet(BaseViewSet):
                 .filter(**filters)
                 .annotate(cycle_id=F("issue_cycle__cycle_id"))
                 .annotate(module_id=F("issue_module__module_id"))
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
             )
 
             # Priority Ordering
@@ -203,6 +218,7 @@ class IssueViewSet(BaseViewSet):
                         output_field=CharField(),
                     )
                 ).order_by("priority_order")
+                order_by_key = "priority_order"
 
             # State Ordering
             elif order_by_param in [
@@ -226,6 +242,7 @@ class IssueViewSet(BaseViewSet):
                         output_field=CharField(),
                     )
                 ).order_by("state_order")
+                order_by_key = "state_order"
             # assignee and label ordering
             elif order_by_param in [
                 "labels__name",
@@ -242,19 +259,57 @@ class IssueViewSet(BaseViewSet):
                 ).order_by(
                     "-max_values" if order_by_param.startswith("-") else "max_values"
                 )
+                order_by_key = (
+                    "-max_values" if order_by_param.startswith("-") else "max_values"
+                )
             else:
                 issue_queryset = issue_queryset.order_by(order_by_param)
-
-            issues = IssueLiteSerializer(issue_queryset, many=True).data
+                order_by_key = order_by_param
 
             ## Grouping the results
             group_by = request.GET.get("group_by", False)
-            if group_by:
-                return Response(
-                    group_results(issues, group_by), status=status.HTTP_200_OK
+
+            # Keyset pagination, every group is paged on its own
+            if request.GET.get("per_page", False):
+                group_key = request.GET.get("group_key", False)
+                if group_by and not group_key:
+                    return self.paginate_groups(
+                        request=request,
+                        queryset=issue_list_values(
+                            issue_queryset, order_by_key.lstrip("-")
+                        ),
+                        group_field=group_field(group_by),
+                        group_counts=group_counts(
+                            self.get_queryset().filter(**filters), group_by
+                        ),
+                        order_by=order_by_key,
+                        on_results=lambda issues: serialize_issue_rows(
+                            issues, is_normalized(request)
+                        ),
+                    )
+
+                if group_by:
+                    issue_queryset = issue_queryset.filter(
+                        **group_filters(group_by, group_key)
+                    )
+
+                return self.paginate(
+                    request=request,
+                    queryset=issue_list_values(
+                        issue_queryset, order_by_key.lstrip("-")
+                    ),
+                    order_by=order_by_key,
+                    paginator_cls=KeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                    on_results=lambda issues: serialize_issue_rows(
+                        issues, is_normalized(request)
+                    ),
                 )
 
-            return Response(issues, status=status.HTTP_200_OK)
+            return Response(
+                issue_list_data(request, issue_queryset, group_by),
+                status=status.HTTP_200_OK,
+            )
 
         except Exception as e:
             capture_exception(e)
@@ -319,17 +374,16 @@ class UserWorkSpaceIssues(BaseAPIView):
 
             order_by_param = request.GET.get("order_by", "-created_at")
 
+            count_queryset = Issue.issue_objects.filter(
+                (Q(assignees__in=[request.user]) | Q(created_by=request.user)),
+                workspace__slug=slug,
+            ).filter(**filters)
+
             issue_queryset = (
                 Issue.issue_objects.filter(
                     (Q(assignees__in=[request.user]) | Q(created_by=request.user)),
                     workspace__slug=slug,
                 )
-                .annotate(
-                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .select_related("project")
                 .select_related("workspace")
                 .select_related("state")
@@ -337,20 +391,6 @@ class UserWorkSpaceIssues(BaseAPIView):
                 .prefetch_related("assignees")
                 .prefetch_related("labels")
                 .order_by(order_by_param)
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .filter(**filters)
             )
 
@@ -370,6 +410,7 @@ class UserWorkSpaceIssues(BaseAPIView):
                         output_field=CharField(),
                     )
                 ).order_by("priority_order")
+                order_by_key = "priority_order"
 
             # State Ordering
             elif order_by_param in [
@@ -393,6 +434,7 @@ class UserWorkSpaceIssues(BaseAPIView):
                         output_field=CharField(),
                     )
                 ).order_by("state_order")
+                order_by_key = "state_order"
             # assignee and label ordering
             elif order_by_param in [
                 "labels__name",
@@ -409,19 +451,127 @@ class UserWorkSpaceIssues(BaseAPIView):
                 ).order_by(
                     "-max_values" if order_by_param.startswith("-") else "max_values"
                 )
+                order_by_key = (
+                    "-max_values" if order_by_param.startswith("-") else "max_values"
+                )
             else:
                 issue_queryset = issue_queryset.order_by(order_by_param)
-
-            issues = IssueLiteSerializer(issue_queryset, many=True).data
+                order_by_key = order_by_param
 
             ## Grouping the results
             group_by = request.GET.get("group_by", False)
-            if group_by:
-                return Response(
-                    group_results(issues, group_by), status=status.HTTP_200_OK
+
+            # Keyset pagination, every group is paged on its own
+            if request.GET.get("per_page", False):
+                group_key = request.GET.get("group_key", False)
+                if group_by and not group_key:
+                    return self.paginate_groups(
+                        request=request,
+                        queryset=issue_list_values(
+                            issue_queryset, order_by_key.lstrip("-")
+                        ),
+                        group_field=group_field(group_by),
+                        group_counts=group_counts(count_queryset, group_by),
+                        order_by=order_by_key,
+                        on_results=lambda issues: serialize_issue_rows(
+                            issues, is_normalized(request)
+                        ),
+                    )
+
+                if group_by:
+                    issue_queryset = issue_queryset.filter(
+                        **group_filters(group_by, group_key)
+                    )
+
+                return self.paginate(
+                    request=request,
+                    queryset=issue_list_values(
+                        issue_queryset, order_by_key.lstrip("-")
+                    ),
+                    order_by=order_by_key,
+                    paginator_cls=KeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                    on_results=lambda issues: serialize_issue_rows(
+                        issues, is_normalized(request)
+                    ),
                 )
 
-            return Response(issues, status=status.HTTP_200_OK)
+            return Response(
+                issue_list_data(request, issue_queryset, group_by),
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class IssueSyncEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    @method_decorator(gzip_page)
+    def get(self, request, slug, project_id):
+        try:
+            filters = issue_filters(request.query_params, "GET")
+
+            changes = Issue.objects.filter(
+                workspace__slug=slug, project_id=project_id
+            )
+            visible = Issue.issue_objects.filter(
+                workspace__slug=slug, project_id=project_id
+            ).filter(**filters)
+            tombstones = IssueTombstone.objects.filter(
+                workspace__slug=slug, project_id=project_id
+            )
+
+            return Response(
+                sync_issues(request, changes, visible, tombstones),
+                status=status.HTTP_200_OK,
+            )
+        except ValueError:
+            return Response(
+                {"error": "Invalid watermark"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+class UserWorkSpaceIssuesSyncEndpoint(BaseAPIView):
+    @method_decorator(gzip_page)
+    def get(self, request, slug):
+        try:
+            filters = issue_filters(request.query_params, "GET")
+            project_ids = get_member_project_ids(request)
+
+            # Issues leaving the list of the user are among the changes too
+            changes = Issue.objects.filter(
+                workspace__slug=slug, project_id__in=project_ids
+            )
+            visible = Issue.issue_objects.filter(
+                (Q(assignees__in=[request.user]) | Q(created_by=request.user)),
+                workspace__slug=slug,
+                project_id__in=project_ids,
+            ).filter(**filters)
+            tombstones = IssueTombstone.objects.filter(
+                workspace__slug=slug, project_id__in=project_ids
+            )
+
+            return Response(
+                sync_issues(request, changes, visible, tombstones),
+                status=status.HTTP_200_OK,
+            )
+        except ValueError:
+            return Response(
+                {"error": "Invalid watermark"}, status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -440,11 +590,16 @@ class WorkSpaceIssuesEndpoint(BaseAPIView):
         try:
             issues = (
                 Issue.issue_objects.filter(workspace__slug=slug)
-                .filter(project__project_projectmember__member=self.request.user)
+                .filter(project_id__in=get_member_project_ids(self.request))
                 .order_by("-created_at")
             )
-            serializer = IssueSerializer(issues, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # One issue per line for clients reading the export incrementally
+            ndjson = request.GET.get("ndjson", "false") == "true"
+            return StreamingHttpResponse(
+                stream_issues(issues, ndjson),
+                content_type="application/x-ndjson" if ndjson else "application/json",
+                status=status.HTTP_200_OK,
+            )
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -465,13 +620,13 @@ class IssueActivityEndpoint(BaseAPIView):
                 IssueActivity.objects.filter(issue_id=issue_id)
                 .filter(
                     ~Q(field="comment"),
-                    project__project_projectmember__member=self.request.user,
+                    project_id__in=get_member_project_ids(self.request),
                 )
                 .select_related("actor", "workspace")
             ).order_by("created_at")
             issue_comments = (
                 IssueComment.objects.filter(issue_id=issue_id)
-                .filter(project__project_projectmember__member=self.request.user)
+                .filter(project_id__in=get_member_project_ids(self.request))
                 .order_by("created_at")
                 .select_related("actor", "issue", "project", "workspace")
             )
@@ -492,6 +647,96 @@ class IssueActivityEndpoint(BaseAPIView):
             )
 
 
+class IssueTimelineEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    def serialize_timeline(self, rows):
+        activity_ids = [row["id"] for row in rows if row["kind"] == "activity"]
+        comment_ids = [row["id"] for row in rows if row["kind"] == "comment"]
+
+        instances = {}
+        for instance in IssueActivitySerializer(
+            IssueActivity.objects.filter(pk__in=activity_ids).select_related(
+                "actor", "workspace"
+            ),
+            many=True,
+        ).data:
+            instances[("activity", instance["id"])] = instance
+        for instance in IssueCommentSerializer(
+            IssueComment.objects.filter(pk__in=comment_ids).select_related(
+                "actor", "issue", "project", "workspace"
+            ),
+            many=True,
+        ).data:
+            instances[("comment", instance["id"])] = instance
+
+        # Rows deleted since the page was read are left out
+        return [
+            instances[(row["kind"], str(row["id"]))]
+            for row in rows
+            if (row["kind"], str(row["id"])) in instances
+        ]
+
+    @method_decorator(gzip_page)
+    def get(self, request, slug, project_id, issue_id):
+        try:
+            issue_activities = IssueActivity.objects.filter(
+                ~Q(field="comment"),
+                issue_id=issue_id,
+                project_id__in=get_member_project_ids(self.request),
+            )
+            issue_comments = IssueComment.objects.filter(
+                issue_id=issue_id,
+                project_id__in=get_member_project_ids(self.request),
+            )
+
+            since = request.GET.get("since", None)
+            if since is not None:
+                try:
+                    since = parse_datetime(since)
+                except ValueError:
+                    since = None
+                if since is None:
+                    return Response(
+                        {"error": "Invalid since"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                if timezone.is_naive(since):
+                    since = timezone.make_aware(since)
+                issue_activities = issue_activities.filter(created_at__gt=since)
+                issue_comments = issue_comments.filter(created_at__gt=since)
+
+            order_by = request.GET.get("order_by", "created_at")
+            if order_by not in ["created_at", "-created_at"]:
+                order_by = "created_at"
+
+            # Both tables are merged in the database, the page only loads the
+            # activities and comments it returns
+            return self.paginate(
+                request=request,
+                querysets=[
+                    issue_activities.values(
+                        "id", "created_at", kind=Value("activity", CharField())
+                    ),
+                    issue_comments.values(
+                        "id", "created_at", kind=Value("comment", CharField())
+                    ),
+                ],
+                order_by=order_by,
+                paginator_cls=UnionKeysetPaginator,
+                cursor_cls=KeysetCursor,
+                on_results=self.serialize_timeline,
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class IssueCommentViewSet(BaseViewSet):
     serializer_class = IssueCommentSerializer
     model = IssueComment
@@ -566,7 +811,7 @@ class IssueCommentViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("issue")
@@ -595,7 +840,7 @@ class IssuePropertyViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(user=self.request.user)
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
         )
@@ -653,7 +898,7 @@ class LabelViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("parent")
@@ -697,6 +942,189 @@ class BulkDeleteIssuesEndpoint(BaseAPIView):
             )
 
 
+class BulkUpdateIssuesEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectEntityPermission,
+    ]
+
+    def patch(self, request, slug, project_id):
+        try:
+            issues_data = request.data.get("issues", [])
+
+            if not len(issues_data):
+                return Response(
+                    {"error": "Issues are required"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            if len(issues_data) > BULK_UPDATE_LIMIT:
+                return Response(
+                    {"error": f"At most {BULK_UPDATE_LIMIT} issues can be updated"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            serializer = IssueBulkUpdateSerializer(
+                data=issues_data, many=True, partial=True
+            )
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+            changes = {}
+            # The activities compare the requested values as they were sent
+            requested_data = {}
+            for data, raw_data in zip(serializer.validated_data, issues_data):
+                if str(data["id"]) in changes:
+                    return Response(
+                        {"error": f"Issue {data['id']} is updated more than once"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                changes[str(data["id"])] = data
+                requested_data[str(data["id"])] = {
+                    key: value for key, value in raw_data.items() if key != "id"
+                }
+
+            # Every referenced row is looked up once for the whole batch.
+            # Assignees are members of the project, labels belong to it and
+            # blocking issues to the workspace.
+            workspace_issues = Issue.issue_objects.filter(workspace__slug=slug)
+            references = {
+                "state": State.objects.filter(project_id=project_id),
+                "parent": Issue.objects.filter(project_id=project_id),
+                "assignees_list": User.objects.filter(
+                    pk__in=ProjectMember.objects.filter(
+                        project_id=project_id, workspace__slug=slug
+                    ).values("member_id")
+                ),
+                "labels_list": Label.objects.filter(project_id=project_id),
+                "blockers_list": workspace_issues,
+                "blocks_list": workspace_issues,
+            }
+            for field, queryset in references.items():
+                ids = set()
+                for data in changes.values():
+                    value = data.get(field)
+                    if isinstance(value, list):
+                        ids.update(value)
+                    elif value is not None:
+                        ids.add(value)
+                if ids and queryset.filter(pk__in=ids).count() != len(ids):
+                    return Response(
+                        {"error": f"Invalid {field}"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+
+            state_groups = dict(
+                State.objects.filter(
+                    pk__in={data["state"] for data in changes.values() if "state" in data}
+                ).values_list("id", "group")
+            )
+
+            with transaction.atomic():
+                issues = list(
+                    Issue.issue_objects.filter(
+                        workspace__slug=slug, project_id=project_id, pk__in=changes
+                    ).select_for_update(of=("self",))
+                )
+                if len(issues) != len(changes):
+                    return Response(
+                        {"error": "Issue Does not exist"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+
+                issue_ids = [issue.id for issue in issues]
+                current_instances = get_activity_instances(issue_ids)
+
+                now = timezone.now()
+                fields = {"updated_at", "updated_by"}
+                completed_ids = []
+                reopened_ids = []
+                relations = {}
+                for issue in issues:
+                    data = changes[str(issue.id)]
+                    for field, value in data.items():
+                        if field == "id":
+                            continue
+                        if field in RELATION_FIELDS:
+                            relations.setdefault(field, {})[issue.id] = value
+                            continue
+                        setattr(issue, issue._meta.get_field(field).attname, value)
+                        fields.add(field)
+
+                    # Same state transitions as a single save
+                    if "state" in data:
+                        group = state_groups[data["state"]]
+                        if group == "completed":
+                            issue.completed_at = now
+                            fields.add("completed_at")
+                            completed_ids.append(issue.id)
+                        elif group == "started":
+                            issue.start_date = now.date()
+                            fields.add("start_date")
+                        else:
+                            issue.completed_at = None
+                            fields.add("completed_at")
+                            reopened_ids.append(issue.id)
+
+                    issue.updated_at = now
+                    issue.updated_by = request.user
+
+                Issue.objects.bulk_update(issues, list(fields), batch_size=100)
+                if fields & {"state", "sort_order"}:
+                    release_sort_orders(
+                        (issue.state_id, issue.sort_order) for issue in issues
+                    )
+
+                PageBlock.objects.filter(issue_id__in=completed_ids).update(
+                    completed_at=now
+                )
+                PageBlock.objects.filter(issue_id__in=reopened_ids).update(
+                    completed_at=None
+                )
+
+                set_issue_relations(
+                    relations,
+                    project_id=project_id,
+                    workspace_id=issues[0].workspace_id,
+                    created_by_id=request.user.id,
+                    updated_by_id=request.user.id,
+                )
+
+                # Bulk writes do not send the signals of single saves
+                refresh_issue_progress(issue_ids)
+                invalidate_analytics(issues[0].workspace_id, [project_id])
+
+                events = [
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": json.dumps(
+                            requested_data[str(issue_id)], cls=DjangoJSONEncoder
+                        ),
+                        "current_instance": json.dumps(
+                            current_instances[str(issue_id)], cls=DjangoJSONEncoder
+                        ),
+                        "issue_id": str(issue_id),
+                        "actor_id": str(request.user.id),
+                        "project_id": str(project_id),
+                    }
+                    for issue_id in issue_ids
+                ]
+                transaction.on_commit(lambda: bulk_issue_activity.delay(events=events))
+
+            return Response(
+                serialize_issue_rows(
+                    issue_list_values(Issue.issue_objects.filter(pk__in=issue_ids)),
+                    is_normalized(request),
+                ),
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class SubIssuesEndpoint(BaseAPIView):
     permission_classes = [
         ProjectEntityPermission,
@@ -713,26 +1141,6 @@ class SubIssuesEndpoint(BaseAPIView):
                 .select_related("parent")
                 .prefetch_related("assignees")
                 .prefetch_related("labels")
-                .annotate(
-                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
             )
 
             state_distribution = (
@@ -873,7 +1281,7 @@ class IssueLinkViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .order_by("-created_at")
             .distinct()
         )
@@ -996,13 +1404,7 @@ class IssueArchiveViewSet(BaseViewSet):
 
     def get_queryset(self):
         return (
-            Issue.objects.annotate(
-                sub_issues_count=Issue.objects.filter(parent=OuterRef("id"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
-            .filter(archived_at__isnull=False)
+            Issue.objects.filter(archived_at__isnull=False)
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .select_related("project")
@@ -1025,25 +1427,15 @@ class IssueArchiveViewSet(BaseViewSet):
 
             order_by_param = request.GET.get("order_by", "-created_at")
 
+            count_queryset = self.get_queryset().filter(**filters)
+            if show_sub_issues != "true":
+                count_queryset = count_queryset.filter(parent__isnull=True)
+
             issue_queryset = (
                 self.get_queryset()
                 .filter(**filters)
                 .annotate(cycle_id=F("issue_cycle__cycle_id"))
                 .annotate(module_id=F("issue_module__module_id"))
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
             )
 
             # Priority Ordering
@@ -1062,6 +1454,7 @@ class IssueArchiveViewSet(BaseViewSet):
                         output_field=CharField(),
                     )
                 ).order_by("priority_order")
+                order_by_key = "priority_order"
 
             # State Ordering
             elif order_by_param in [
@@ -1085,6 +1478,7 @@ class IssueArchiveViewSet(BaseViewSet):
                         output_field=CharField(),
                     )
                 ).order_by("state_order")
+                order_by_key = "state_order"
             # assignee and label ordering
             elif order_by_param in [
                 "labels__name",
@@ -1101,8 +1495,12 @@ class IssueArchiveViewSet(BaseViewSet):
                 ).order_by(
                     "-max_values" if order_by_param.startswith("-") else "max_values"
                 )
+                order_by_key = (
+                    "-max_values" if order_by_param.startswith("-") else "max_values"
+                )
             else:
                 issue_queryset = issue_queryset.order_by(order_by_param)
+                order_by_key = order_by_param
 
             issue_queryset = (
                 issue_queryset
@@ -1110,16 +1508,48 @@ class IssueArchiveViewSet(BaseViewSet):
                 else issue_queryset.filter(parent__isnull=True)
             )
 
-            issues = IssueLiteSerializer(issue_queryset, many=True).data
-
             ## Grouping the results
             group_by = request.GET.get("group_by", False)
-            if group_by:
-                return Response(
-                    group_results(issues, group_by), status=status.HTTP_200_OK
+
+            # Keyset pagination, every group is paged on its own
+            if request.GET.get("per_page", False):
+                group_key = request.GET.get("group_key", False)
+                if group_by and not group_key:
+                    return self.paginate_groups(
+                        request=request,
+                        queryset=issue_list_values(
+                            issue_queryset, order_by_key.lstrip("-")
+                        ),
+                        group_field=group_field(group_by),
+                        group_counts=group_counts(count_queryset, group_by),
+                        order_by=order_by_key,
+                        on_results=lambda issues: serialize_issue_rows(
+                            issues, is_normalized(request)
+                        ),
+                    )
+
+                if group_by:
+                    issue_queryset = issue_queryset.filter(
+                        **group_filters(group_by, group_key)
+                    )
+
+                return self.paginate(
+                    request=request,
+                    queryset=issue_list_values(
+                        issue_queryset, order_by_key.lstrip("-")
+                    ),
+                    order_by=order_by_key,
+                    paginator_cls=KeysetPaginator,
+                    cursor_cls=KeysetCursor,
+                    on_results=lambda issues: serialize_issue_rows(
+                        issues, is_normalized(request)
+                    ),
                 )
 
-            return Response(issues, status=status.HTTP_200_OK)
+            return Response(
+                issue_list_data(request, issue_queryset, group_by),
+                status=status.HTTP_200_OK,
+            )
 
         except Exception as e:
             capture_exception(e)
@@ -1213,7 +1643,7 @@ class IssueSubscriberViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(issue_id=self.kwargs.get("issue_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .order_by("-created_at")
             .distinct()
         )
@@ -3,7 +3,8 @@ import json
 
 # Django Imports
 from django.db import IntegrityError
-from django.db.models import Prefetch, F, OuterRef, Func, Exists, Count, Q
+from django.db.models import Prefetch, F, OuterRef, Exists, Count, Q, Value
+from django.db.models.functions import Coalesce
 from django.core import serializers
 from django.utils.decorators import method_decorator
 from django.views.decorators.gzip import gzip_page
@@ -31,13 +32,14 @@ from plane.db.models import (
     Issue,
     ModuleLink,
     ModuleFavorite,
-    IssueLink,
-    IssueAttachment,
+    ModuleProgress,
 )
+from plane.db.models.progress import PROGRESS_FIELDS
 from plane.bgtasks.issue_activites_task import issue_activity
 from plane.utils.grouper import group_results
 from plane.utils.issue_filters import issue_filters
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.membership import get_member_project_ids
 
 class ModuleViewSet(BaseViewSet):
     model = Module
@@ -75,36 +77,11 @@ class ModuleViewSet(BaseViewSet):
                     queryset=ModuleLink.objects.select_related("module", "created_by"),
                 )
             )
-            .annotate(total_issues=Count("issue_module"))
             .annotate(
-                completed_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="completed"),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="cancelled"),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="started"),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="unstarted"),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_module__issue__state__group",
-                    filter=Q(issue_module__issue__state__group="backlog"),
-                )
+                **{
+                    field: Coalesce(F(f"progress__{field}"), Value(0))
+                    for field in PROGRESS_FIELDS
+                }
             )
             .order_by("-is_favorite", "name")
         )
@@ -281,16 +258,11 @@ class ModuleIssueViewSet(BaseViewSet):
         return self.filter_queryset(
             super()
             .get_queryset()
-            .annotate(
-                sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("issue"))
-                .order_by()
-                .annotate(count=Func(F("id"), function="Count"))
-                .values("count")
-            )
+            .annotate(sub_issues_count=F("issue__sub_issues_count"))
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("module")
@@ -308,12 +280,6 @@ class ModuleIssueViewSet(BaseViewSet):
             filters = issue_filters(request.query_params, "GET")
             issues = (
                 Issue.issue_objects.filter(issue_module__module_id=module_id)
-                .annotate(
-                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .annotate(bridge_id=F("issue_module__id"))
                 .filter(project_id=project_id)
                 .filter(workspace__slug=slug)
@@ -325,20 +291,6 @@ class ModuleIssueViewSet(BaseViewSet):
                 .prefetch_related("labels")
                 .order_by(order_by)
                 .filter(**filters)
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
             )
 
             issues_data = IssueStateSerializer(issues, many=True).data
@@ -419,6 +371,15 @@ class ModuleIssueViewSet(BaseViewSet):
                 batch_size=10,
             )
 
+            # Bulk writes skip the signals, refresh the progress of the modules
+            ModuleProgress.refresh(
+                [module_id]
+                + [
+                    activity["old_module_id"]
+                    for activity in update_module_issue_activity
+                ]
+            )
+
             # Capture Issue Activity
             issue_activity.delay(
                 type="module.activity.created",
@@ -473,7 +434,7 @@ class ModuleLinkViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(module_id=self.kwargs.get("module_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .order_by("-created_at")
             .distinct()
         )
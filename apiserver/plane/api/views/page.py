@@ -28,6 +28,7 @@ from plane.api.serializers import (
     PageFavoriteSerializer,
     IssueLiteSerializer,
 )
+from plane.utils.membership import get_member_project_ids
 
 
 class PageViewSet(BaseViewSet):
@@ -52,7 +53,7 @@ class PageViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .filter(Q(owned_by=self.request.user) | Q(access=0))
             .select_related("project")
             .select_related("workspace")
@@ -191,7 +192,7 @@ class PageBlockViewSet(BaseViewSet):
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
             .filter(page_id=self.kwargs.get("page_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .select_related("page")
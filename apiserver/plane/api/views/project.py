@@ -25,7 +25,7 @@ from plane.api.serializers import (
     ProjectFavoriteSerializer,
 )
 
-from plane.api.permissions import ProjectBasePermission
+from plane.api.permissions import ProjectBasePermission, ProjectLitePermission
 
 from plane.db.models import (
     Project,
@@ -51,6 +51,9 @@ from plane.db.models import (
 )
 
 from plane.bgtasks.project_invitation_task import project_invitation
+from plane.db.models.workspace import invalidate_memberships
+from plane.utils.membership import get_member_project_ids
+from plane.realtime.tickets import issue_ticket
 
 
 class ProjectViewSet(BaseViewSet):
@@ -77,7 +80,7 @@ class ProjectViewSet(BaseViewSet):
             super()
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
-            .filter(Q(project_projectmember__member=self.request.user) | Q(network=2))
+            .filter(Q(pk__in=get_member_project_ids(self.request)) | Q(network=2))
             .select_related(
                 "workspace", "workspace__owner", "default_assignee", "project_lead"
             )
@@ -429,6 +432,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
                     for invitation in project_invitations
                 ]
             )
+            invalidate_memberships([request.user.id])
 
             # Delete joined project invites
             project_invitations.delete()
@@ -606,6 +610,7 @@ class AddMemberToProjectEndpoint(BaseAPIView):
                 batch_size=10,
                 ignore_conflicts=True,
             )
+            invalidate_memberships([member.get("member_id") for member in members])
 
             serializer = ProjectMemberSerializer(project_members, many=True)
 
@@ -663,6 +668,7 @@ class AddTeamToProjectEndpoint(BaseAPIView):
             ProjectMember.objects.bulk_create(
                 project_members, batch_size=10, ignore_conflicts=True
             )
+            invalidate_memberships(team_members)
 
             serializer = ProjectMemberSerializer(project_members, many=True)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -810,6 +816,7 @@ class ProjectJoinEndpoint(BaseAPIView):
                 ],
                 ignore_conflicts=True,
             )
+            invalidate_memberships([request.user.id])
 
             return Response(
                 {"message": "Projects joined successfully"},
@@ -889,6 +896,23 @@ class ProjectMemberUserEndpoint(BaseAPIView):
             )
 
 
+class ProjectEventTicketEndpoint(BaseAPIView):
+    permission_classes = [
+        ProjectLitePermission,
+    ]
+
+    def post(self, request, slug, project_id):
+        try:
+            ticket = issue_ticket(request.user.id, slug, project_id)
+            return Response({"ticket": ticket}, status=status.HTTP_201_CREATED)
+        except Exception as e:
+            capture_exception(e)
+            return Response(
+                {"error": "Something went wrong please try again later"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+
 class ProjectFavoritesViewSet(BaseViewSet):
     serializer_class = ProjectFavoriteSerializer
     model = ProjectFavorite
@@ -11,8 +11,20 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from .base import BaseAPIView
-from plane.db.models import Workspace, Project, Issue, Cycle, Module, Page, IssueView
-from plane.utils.issue_search import search_issues
+from plane.db.models import (
+    Workspace,
+    Project,
+    Issue,
+    Cycle,
+    Module,
+    Page,
+    IssueView,
+)
+from plane.utils.issue_search import search_issues, search_queryset
+from plane.utils.membership import get_member_project_ids
+
+# Matches returned per entity, best ranked first
+SEARCH_RESULTS_LIMIT = 100
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -39,7 +51,7 @@ class GlobalSearchEndpoint(BaseAPIView):
         return (
             Project.objects.filter(
                 q,
-                Q(project_projectmember__member=self.request.user) | Q(network=2),
+                Q(pk__in=get_member_project_ids(self.request)) | Q(network=2),
                 workspace__slug=slug,
             )
             .distinct()
@@ -47,102 +59,84 @@ class GlobalSearchEndpoint(BaseAPIView):
         )
 
     def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                sequences = re.findall(r"\d+\.\d+|\d+", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-
         issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=get_member_project_ids(self.request),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             issues = issues.filter(project_id=project_id)
 
-        return issues.distinct().values(
+        issues = search_queryset(
+            query,
+            issues,
+            Q(sequence_id__in=re.findall(r"\d+", query))
+            | Q(
+                project_id__in=Project.objects.filter(
+                    identifier__icontains=query, workspace__slug=slug
+                ).values("id")
+            ),
+        )
+
+        return issues.values(
             "name",
             "id",
             "sequence_id",
             "project__identifier",
             "project_id",
             "workspace__slug",
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         cycles = Cycle.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=get_member_project_ids(self.request),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             cycles = cycles.filter(project_id=project_id)
 
-        return cycles.distinct().values(
+        return search_queryset(query, cycles).values(
             "name",
             "id",
             "project_id",
             "project__identifier",
             "workspace__slug",
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=get_member_project_ids(self.request),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             modules = modules.filter(project_id=project_id)
 
-        return modules.distinct().values(
+        return search_queryset(query, modules).values(
             "name",
             "id",
             "project_id",
             "project__identifier",
             "workspace__slug",
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
         pages = Page.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=get_member_project_ids(self.request),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
             pages = pages.filter(project_id=project_id)
 
-        return pages.distinct().values(
+        return search_queryset(query, pages).values(
             "name",
             "id",
             "project_id",
             "project__identifier",
             "workspace__slug",
-        )
+        )[:SEARCH_RESULTS_LIMIT]
 
     def filter_views(self, query, slug, project_id, workspace_search):
         fields = ["name"]
@@ -152,7 +146,7 @@ class GlobalSearchEndpoint(BaseAPIView):
 
         issue_views = IssueView.objects.filter(
             q,
-            project__project_projectmember__member=self.request.user,
+            project_id__in=get_member_project_ids(self.request),
             workspace__slug=slug,
         )
 
@@ -229,7 +223,7 @@ class IssueSearchEndpoint(BaseAPIView):
 
             issues = Issue.issue_objects.filter(
                 workspace__slug=slug,
-                project__project_projectmember__member=self.request.user,
+                project_id__in=get_member_project_ids(self.request),
             )
 
             if workspace_search == "false":
@@ -15,6 +15,7 @@ from . import BaseViewSet, BaseAPIView
 from plane.api.serializers import StateSerializer
 from plane.api.permissions import ProjectEntityPermission
 from plane.db.models import State, Issue
+from plane.utils.membership import get_member_project_ids
 
 
 class StateViewSet(BaseViewSet):
@@ -33,7 +34,7 @@ class StateViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .filter(~Q(name="Triage"))
             .select_related("project")
             .select_related("workspace")
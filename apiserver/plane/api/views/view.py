@@ -11,7 +11,6 @@ from sentry_sdk import capture_exception
 from . import BaseViewSet, BaseAPIView
 from plane.api.serializers import (
     IssueViewSerializer,
-    IssueLiteSerializer,
     IssueViewFavoriteSerializer,
 )
 from plane.api.permissions import ProjectEntityPermission
@@ -21,6 +20,9 @@ from plane.db.models import (
     IssueViewFavorite,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.membership import get_member_project_ids
+from plane.utils.issue_rows import issue_list_data
+from plane.utils.view_cache import get_cached_view_issues
 
 
 class IssueViewViewSet(BaseViewSet):
@@ -45,7 +47,7 @@ class IssueViewViewSet(BaseViewSet):
             .get_queryset()
             .filter(workspace__slug=self.kwargs.get("slug"))
             .filter(project_id=self.kwargs.get("project_id"))
-            .filter(project__project_projectmember__member=self.request.user)
+            .filter(project_id__in=get_member_project_ids(self.request))
             .select_related("project")
             .select_related("workspace")
             .annotate(is_favorite=Exists(subquery))
@@ -61,26 +63,28 @@ class ViewIssuesEndpoint(BaseAPIView):
 
     def get(self, request, slug, project_id, view_id):
         try:
-            view = IssueView.objects.get(pk=view_id)
-            queries = view.query
+            view = IssueView.objects.get(
+                pk=view_id, project_id=project_id, workspace__slug=slug
+            )
 
             filters = issue_filters(request.query_params, "GET")
 
-            issues = (
-                Issue.issue_objects.filter(
-                    **queries, project_id=project_id, workspace__slug=slug
-                )
-                .filter(**filters)
-                .select_related("project")
-                .select_related("workspace")
-                .select_related("state")
-                .select_related("parent")
-                .prefetch_related("assignees")
-                .prefetch_related("labels")
+            # The saved query is compiled when the view is saved
+            issues = Issue.issue_objects.filter(
+                **view.query, project_id=project_id, workspace__slug=slug
+            ).filter(**filters)
+            issue_ids = get_cached_view_issues(
+                view,
+                filters,
+                lambda: [str(issue_id) for issue_id in issues.values_list("id", flat=True)],
             )
 
-            serializer = IssueLiteSerializer(issues, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            return Response(
+                issue_list_data(
+                    request, Issue.issue_objects.filter(pk__in=issue_ids)
+                ),
+                status=status.HTTP_200_OK,
+            )
         except IssueView.DoesNotExist:
             return Response(
                 {"error": "Issue View does not exist"}, status=status.HTTP_404_NOT_FOUND
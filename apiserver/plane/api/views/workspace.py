@@ -46,7 +46,6 @@ from plane.api.serializers import (
     ProjectMemberSerializer,
     WorkspaceThemeSerializer,
     IssueActivitySerializer,
-    IssueLiteSerializer,
 )
 from plane.api.views.base import BaseAPIView
 from . import BaseViewSet
@@ -68,8 +67,6 @@ from plane.db.models import (
     PageFavorite,
     Page,
     IssueViewFavorite,
-    IssueLink,
-    IssueAttachment,
     IssueSubscriber,
     Project,
     Label,
@@ -82,7 +79,9 @@ from plane.api.permissions import (
 )
 from plane.bgtasks.workspace_invitation_task import workspace_invitation
 from plane.utils.issue_filters import issue_filters
-from plane.utils.grouper import group_results
+from plane.utils.issue_rows import issue_list_data
+from plane.db.models.workspace import invalidate_memberships
+from plane.utils.membership import get_member_project_ids
 
 
 class WorkSpaceViewSet(BaseViewSet):
@@ -520,6 +519,7 @@ class UserWorkspaceInvitationsEndpoint(BaseViewSet):
                 ],
                 ignore_conflicts=True,
             )
+            invalidate_memberships([request.user.id])
 
             # Delete joined workspace invites
             workspace_invitations.delete()
@@ -1054,7 +1054,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 Issue.issue_objects.filter(
                     workspace__slug=slug,
                     assignees__in=[user_id],
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
                 .annotate(state_group=F("state__group"))
@@ -1069,7 +1069,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 Issue.objects.filter(
                     workspace__slug=slug,
                     assignees__in=[user_id],
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
                 .values("priority")
@@ -1091,7 +1091,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 Issue.issue_objects.filter(
                     workspace__slug=slug,
                     assignees__in=[user_id],
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                     created_by_id=user_id,
                 )
                 .filter(**filters)
@@ -1102,7 +1102,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 Issue.issue_objects.filter(
                     workspace__slug=slug,
                     assignees__in=[user_id],
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
                 .count()
@@ -1113,7 +1113,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                     ~Q(state__group__in=["completed", "cancelled"]),
                     workspace__slug=slug,
                     assignees__in=[user_id],
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
                 .count()
@@ -1124,7 +1124,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                     workspace__slug=slug,
                     assignees__in=[user_id],
                     state__group="completed",
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
                 .count()
@@ -1134,7 +1134,7 @@ class WorkspaceUserProfileStatsEndpoint(BaseAPIView):
                 IssueSubscriber.objects.filter(
                     workspace__slug=slug,
                     subscriber_id=user_id,
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
                 .count()
@@ -1171,7 +1171,7 @@ class WorkspaceUserActivityEndpoint(BaseAPIView):
 
             queryset = IssueActivity.objects.filter(
                 workspace__slug=slug,
-                project__project_projectmember__member=request.user,
+                project_id__in=get_member_project_ids(request),
                 actor=user_id,
             ).select_related("actor", "workspace")
 
@@ -1205,7 +1205,7 @@ class WorkspaceUserProfileEndpoint(BaseAPIView):
             projects = (
                 Project.objects.filter(
                     workspace__slug=slug,
-                    project_projectmember__member=request.user,
+                    pk__in=get_member_project_ids(request),
                 )
                 .annotate(
                     created_issues=Count(
@@ -1291,32 +1291,12 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
                     | Q(created_by_id=user_id)
                     | Q(issue_subscribers__subscriber_id=user_id),
                     workspace__slug=slug,
-                    project__project_projectmember__member=request.user,
+                    project_id__in=get_member_project_ids(request),
                 )
                 .filter(**filters)
-                .annotate(
-                    sub_issues_count=Issue.issue_objects.filter(parent=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
                 .select_related("project", "workspace", "state", "parent")
                 .prefetch_related("assignees", "labels")
                 .order_by("-created_at")
-                .annotate(
-                    link_count=IssueLink.objects.filter(issue=OuterRef("id"))
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
-                .annotate(
-                    attachment_count=IssueAttachment.objects.filter(
-                        issue=OuterRef("id")
-                    )
-                    .order_by()
-                    .annotate(count=Func(F("id"), function="Count"))
-                    .values("count")
-                )
             )
 
             # Priority Ordering
@@ -1377,16 +1357,13 @@ class WorkspaceUserProfileIssuesEndpoint(BaseAPIView):
             else:
                 issue_queryset = issue_queryset.order_by(order_by_param)
 
-            issues = IssueLiteSerializer(issue_queryset, many=True).data
-
             ## Grouping the results
             group_by = request.GET.get("group_by", False)
-            if group_by:
-                return Response(
-                    group_results(issues, group_by), status=status.HTTP_200_OK
-                )
 
-            return Response(issues, status=status.HTTP_200_OK)
+            return Response(
+                issue_list_data(request, issue_queryset, group_by),
+                status=status.HTTP_200_OK,
+            )
         except Exception as e:
             capture_exception(e)
             return Response(
@@ -1403,7 +1380,7 @@ class WorkspaceLabelsEndpoint(BaseAPIView):
         try:
             labels = Label.objects.filter(
                 workspace__slug=slug,
-                project__project_projectmember__member=request.user,
+                project_id__in=get_member_project_ids(request),
             ).values("parent", "name", "color", "id", "project_id", "workspace__slug")
             return Response(labels, status=status.HTTP_200_OK)
         except Exception as e:
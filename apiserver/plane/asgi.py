@@ -1,18 +1,20 @@
 import os
 
-from channels.routing import ProtocolTypeRouter
+from channels.routing import ProtocolTypeRouter, URLRouter
 from django.core.asgi import get_asgi_application
 
-django_asgi_app = get_asgi_application()
-
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "plane.settings.production")
 # Initialize Django ASGI application early to ensure the AppRegistry
 # is populated before importing code that may import ORM models.
+django_asgi_app = get_asgi_application()
+
+from plane.realtime.routing import websocket_urlpatterns  # noqa: E402
 
 
 application = ProtocolTypeRouter(
     {
-        "http": get_asgi_application(),
+        "http": django_asgi_app,
+        "websocket": URLRouter(websocket_urlpatterns),
     }
 )
@@ -1,20 +1,27 @@
 # Python imports
 import csv
+import gzip
 import io
+import tempfile
+from itertools import groupby
+from uuid import uuid4
 
 # Django imports
 from django.core.mail import EmailMultiAlternatives
+from django.db.models import Case, IntegerField, Value, When
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.conf import settings
 
 # Third party imports
 from celery import shared_task
+from openpyxl import Workbook
 from sentry_sdk import capture_exception
 
 # Module imports
-from plane.db.models import Issue
-from plane.utils.analytics_plot import build_graph_plot
+from plane.db.models import Issue, User
+from plane.utils.analytics_plot import get_dimension, graph_queryset
+from plane.utils.export_storage import delete_expired_exports, save_export
 from plane.utils.issue_filters import issue_filters
 
 row_mapping = {
@@ -31,6 +38,103 @@ row_mapping = {
     "estimate": "Estimate",
 }
 
+# Rows fetched per round trip of the server side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+PRIORITY_ORDER = Case(
+    *[
+        When(dimension=priority, then=Value(index))
+        for index, priority in enumerate(["low", "medium", "high", "urgent"])
+    ],
+    default=Value(4),
+    output_field=IntegerField(),
+)
+
+
+def get_assignee_names(queryset):
+    return {
+        email: f"{first_name} {last_name}"
+        for email, first_name, last_name in User.objects.filter(
+            pk__in=queryset.values("assignees__id")
+        )
+        .order_by()
+        .values_list("email", "first_name", "last_name")
+    }
+
+
+def get_segments(queryset, segment):
+    segments = set(
+        queryset.annotate(segmented=get_dimension(segment))
+        .order_by()
+        .values_list("segmented", flat=True)
+        .distinct()
+    )
+    return sorted(segments, key=lambda value: (value is None, str(value)))
+
+
+def export_rows(queryset, x_axis, y_axis, segment):
+    """Header and rows of the export, streamed from the database"""
+    key = "count" if y_axis == "issue_count" else "estimate"
+
+    assignee_names = {}
+    if x_axis in ["assignees__email"] or segment in ["assignees__email"]:
+        assignee_names = get_assignee_names(queryset)
+
+    segments = get_segments(queryset, segment) if segment else []
+    header = [row_mapping.get(x_axis, "X-Axis"), row_mapping.get(y_axis, "Y-Axis")]
+    if segment in ["assignees__email"]:
+        header += [assignee_names.get(str(value), value) for value in segments]
+    else:
+        header += segments
+    yield header
+
+    distribution = graph_queryset(queryset, x_axis, y_axis, segment)
+    if x_axis == "priority":
+        distribution = distribution.order_by(PRIORITY_ORDER)
+
+    for dimension, items in groupby(
+        distribution.iterator(chunk_size=EXPORT_CHUNK_SIZE),
+        key=lambda item: item["dimension"],
+    ):
+        items = list(items)
+        name = str(dimension)
+        if x_axis in ["assignees__email"]:
+            name = assignee_names.get(name, name)
+
+        if segment:
+            values = {item["segment"]: item[key] for item in items}
+            yield [
+                name,
+                sum(value for value in values.values() if value is not None),
+            ] + [values.get(value, "0") for value in segments]
+        else:
+            yield [name, items[0][key]]
+
+
+def write_csv(rows, file):
+    with gzip.GzipFile(fileobj=file, mode="wb") as gzip_file:
+        text = io.TextIOWrapper(gzip_file, encoding="utf-8", newline="")
+        writer = csv.writer(text, delimiter=",", quoting=csv.QUOTE_ALL)
+        for row in rows:
+            writer.writerow(row)
+        text.flush()
+        text.detach()
+
+
+def write_xlsx(rows, file):
+    # Write only workbooks keep a single row in memory
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Analytics")
+    for row in rows:
+        sheet.append(row)
+    workbook.save(file)
+
+
+EXPORT_FORMATS = {
+    "csv": ("csv.gz", write_csv),
+    "xlsx": ("xlsx", write_xlsx),
+}
+
 
 @shared_task
 def analytic_export_task(email, data, slug):
@@ -42,132 +146,38 @@ def analytic_export_task(email, data, slug):
         y_axis = data.get("y_axis", False)
         segment = data.get("segment", False)
 
-        distribution = build_graph_plot(
-            queryset=queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
+        extension, write = EXPORT_FORMATS.get(
+            data.get("format", "csv"), EXPORT_FORMATS["csv"]
         )
 
-        key = "count" if y_axis == "issue_count" else "estimate"
+        # Spooled to disk and uploaded privately, the link expires
+        filename = f"{slug}-analytics.{extension}"
+        with tempfile.TemporaryFile() as file:
+            write(export_rows(queryset, x_axis, y_axis, segment), file)
+            file.seek(0)
+            url = save_export(file, f"{slug}/{uuid4().hex}/{filename}", filename)
 
-        segmented = segment
+        subject = "Your Export is ready"
 
-        assignee_details = {}
-        if x_axis in ["assignees__email"] or segment in ["assignees__email"]:
-            assignee_details = (
-                Issue.issue_objects.filter(workspace__slug=slug, **filters, assignees__avatar__isnull=False)
-                .order_by("assignees__id")
-                .distinct("assignees__id")
-                .values("assignees__avatar", "assignees__email", "assignees__first_name", "assignees__last_name")
-            )
+        html_content = render_to_string("emails/exports/analytics.html", {"url": url})
 
-        if segment:
-            segment_zero = []
-            for item in distribution:
-                current_dict = distribution.get(item)
-                for current in current_dict:
-                    segment_zero.append(current.get("segment"))
-
-            segment_zero = list(set(segment_zero))
-            row_zero = (
-                [
-                    row_mapping.get(x_axis, "X-Axis"),
-                ]
-                + [
-                    row_mapping.get(y_axis, "Y-Axis"),
-                ]
-                + segment_zero
-            )
-            rows = []
-            for item in distribution:
-                generated_row = [
-                    item,
-                ]
-
-                data = distribution.get(item)
-                # Add y axis values
-                generated_row.append(sum(obj.get(key) for obj in data if obj.get(key, None) is not None))
-
-                for segment in segment_zero:
-                    value = [x for x in data if x.get("segment") == segment]
-                    if len(value):
-                        generated_row.append(value[0].get(key))
-                    else:
-                        generated_row.append("0")
-                # x-axis replacement for names
-                if x_axis in ["assignees__email"]:
-                    assignee = [user for user in assignee_details if str(user.get("assignees__email")) == str(item)]
-                    if len(assignee):
-                        generated_row[0] = str(assignee[0].get("assignees__first_name")) + " " + str(assignee[0].get("assignees__last_name"))
-                rows.append(tuple(generated_row))
-
-            # If segment is ["assignees__email"] then replace segment_zero rows with first and last names
-            if segmented in ["assignees__email"]:
-                for index, segm in enumerate(row_zero[2:]):
-                    # find the name of the user
-                    assignee = [user for user in assignee_details if str(user.get("assignees__email")) == str(segm)]
-                    if len(assignee):
-                        row_zero[index] = str(assignee[0].get("assignees__first_name")) + " " + str(assignee[0].get("assignees__last_name"))
-
-            rows = [tuple(row_zero)] + rows
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-
-            # Write CSV data to the buffer
-            for row in rows:
-                writer.writerow(row)
-
-            subject = "Your Export is ready"
-
-            html_content = render_to_string("emails/exports/analytics.html", {})
-
-            text_content = strip_tags(html_content)
-            csv_buffer.seek(0)
-            msg = EmailMultiAlternatives(
-                subject, text_content, settings.EMAIL_FROM, [email]
-            )
-            msg.attach(f"{slug}-analytics.csv", csv_buffer.read())
-            msg.send(fail_silently=False)
+        text_content = strip_tags(html_content)
+        msg = EmailMultiAlternatives(subject, text_content, settings.EMAIL_FROM, [email])
+        msg.attach_alternative(html_content, "text/html")
+        msg.send(fail_silently=False)
 
-        else:
-            row_zero = [
-                row_mapping.get(x_axis, "X-Axis"),
-                row_mapping.get(y_axis, "Y-Axis"),
-            ]
-            rows = []
-            for item in distribution:
-                row =  [
-                            item,
-                            distribution.get(item)[0].get("count")
-                            if y_axis == "issue_count"
-                            else distribution.get(item)[0].get("estimate  "),
-                        ]
-                # x-axis replacement to names
-                if x_axis in ["assignees__email"]:
-                    assignee = [user for user in assignee_details if str(user.get("assignees__email")) == str(item)]
-                    if len(assignee):
-                        row[0] = str(assignee[0].get("assignees__first_name")) + " " + str(assignee[0].get("assignees__last_name"))
-
-                rows.append(tuple(row))
-            rows = [tuple(row_zero)] + rows
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-
-            # Write CSV data to the buffer
-            for row in rows:
-                writer.writerow(row)
-
-            subject = "Your Export is ready"
-
-            html_content = render_to_string("emails/exports/analytics.html", {})
-
-            text_content = strip_tags(html_content)
-
-            csv_buffer.seek(0)
-            msg = EmailMultiAlternatives(
-                subject, text_content, settings.EMAIL_FROM, [email]
-            )
-            msg.attach(f"{slug}-analytics.csv", csv_buffer.read())
-            msg.send(fail_silently=False)
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
 
+
+@shared_task
+def delete_old_exports():
+    try:
+        delete_expired_exports()
     except Exception as e:
         # Print logs if in DEBUG mode
         if settings.DEBUG:
@@ -0,0 +1,27 @@
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import IssueRollup
+from plane.db.models.analytic import invalidate_analytics
+
+
+@shared_task
+def rebuild_issue_rollups(project_id, workspace_id):
+    try:
+        # Changes made from now on schedule a new rebuild
+        cache.delete(f"analytics_rollup_pending:{project_id}")
+        IssueRollup.rebuild([project_id])
+        # Results cached while the rollups were stale are dropped
+        invalidate_analytics(workspace_id)
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
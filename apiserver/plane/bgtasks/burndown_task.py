@@ -0,0 +1,43 @@
+# Django imports
+from django.utils import timezone
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import Cycle, Module, CycleBurndown, ModuleBurndown
+
+
+@shared_task
+def capture_burndown_snapshots(batch_size=500):
+    try:
+        today = timezone.localdate()
+
+        for burndown_model, entities in [
+            (
+                CycleBurndown,
+                Cycle.objects.filter(start_date__lte=today, end_date__gte=today),
+            ),
+            (
+                ModuleBurndown,
+                Module.objects.filter(start_date__lte=today, target_date__gte=today),
+            ),
+        ]:
+            entity_ids = list(entities.values_list("id", flat=True))
+            for start in range(0, len(entity_ids), batch_size):
+                burndown_model.capture(
+                    entity_ids[start : start + batch_size], date=today
+                )
+                # Days missed before, or before the snapshots existed, are
+                # rebuilt from the history of the issues
+                burndown_model.backfill_missing(
+                    entity_ids[start : start + batch_size], until=today
+                )
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
@@ -0,0 +1,29 @@
+# Django imports
+from django.apps import apps
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.utils.html_processor import extract_text, html_digest
+
+
+@shared_task
+def extract_html_text(model, pk, html_field, text_field, digest):
+    try:
+        queryset = apps.get_model(model).objects.filter(pk=pk)
+        html = queryset.values_list(html_field, flat=True).first()
+
+        # The document changed again, the task of the newer save sets the text
+        if html is None or html_digest(html) != digest:
+            return
+
+        queryset.update(**{text_field: extract_text(html)})
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
@@ -26,6 +26,7 @@ from plane.db.models import (
     Label,
     User,
 )
+from plane.db.models.workspace import invalidate_memberships
 from .workspace_invitation_task import workspace_invitation
 from plane.bgtasks.user_welcome_task import send_welcome_slack
 
@@ -103,6 +104,9 @@ def service_importer(service, importer_id):
                 ignore_conflicts=True,
             )
 
+            # Bulk inserts do not send the signals refreshing the memberships
+            invalidate_memberships([user.id for user in workspace_users])
+
         # Check if sync config is on for github importers
         if service == "github" and importer.config.get("sync", False):
             name = importer.metadata.get("name", False)
@@ -1,10 +1,11 @@
 # Python imports
 import json
-import requests
+from collections import defaultdict
+from uuid import UUID
 
 # Django imports
+from django.db import transaction
 from django.conf import settings
-from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
 # Third Party imports
@@ -22,10 +23,12 @@ from plane.db.models import (
     Cycle,
     Module,
     IssueSubscriber,
-    Notification,
-    IssueAssignee,
+    WebhookDelivery,
 )
 from plane.api.serializers import IssueActivitySerializer
+from plane.bgtasks.notification_task import issue_notifications
+from plane.bgtasks.webhook_task import deliver_webhooks
+from plane.realtime.publisher import publish_events
 
 
 # Track Chnages in name
@@ -1018,6 +1021,177 @@ def delete_attachment_activity(
     )
 
 
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+}
+
+# Activities spanning many issues, they do not touch or notify a single issue
+BULK_ISSUE_ACTIVITIES = [
+    "cycle.activity.created",
+    "cycle.activity.deleted",
+    "module.activity.created",
+    "module.activity.deleted",
+]
+
+
+def post_issue_activity_hooks(issue_activities_created):
+    # Queue the updates to segway for integrations and webhooks
+    if not settings.PROXY_BASE_URL:
+        return
+
+    WebhookDelivery.objects.bulk_create(
+        [
+            WebhookDelivery(
+                url=f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
+                payload=IssueActivitySerializer(issue_activity).data,
+                project_id=issue_activity.project_id,
+                workspace_id=issue_activity.workspace_id,
+            )
+            for issue_activity in issue_activities_created
+        ],
+        batch_size=100,
+    )
+    transaction.on_commit(lambda: deliver_webhooks.delay())
+
+
+def record_issue_activities(events):
+    """
+    Record a list of activity events, every event is a dict with the
+    arguments of `issue_activity`. Actors, projects and issues are
+    resolved once for the whole list. Notifications, webhooks and board
+    events go out when the surrounding transaction commits.
+    """
+    actors = User.objects.in_bulk({str(event["actor_id"]) for event in events})
+    projects = Project.objects.select_related("workspace").in_bulk(
+        {str(event["project_id"]) for event in events}
+    )
+
+    issue_activities = []
+    issue_subscribers = {}
+    # Activities of every issue and actor, in the order of the events
+    grouped_activities = defaultdict(list)
+    # Changed issues pushed to the open boards
+    changes = {}
+
+    for event in events:
+        actor = actors.get(UUID(str(event["actor_id"])))
+        project = projects.get(UUID(str(event["project_id"])))
+        if actor is None or project is None:
+            continue
+
+        func = ACTIVITY_MAPPER.get(event["type"])
+        if func is None:
+            continue
+
+        event_activities = []
+        func(
+            event.get("requested_data"),
+            event.get("current_instance"),
+            event.get("issue_id"),
+            project,
+            actor,
+            event_activities,
+        )
+        issue_activities.extend(event_activities)
+
+        for activity in event_activities:
+            issue_id = activity.issue_id or event.get("issue_id")
+            if issue_id is None:
+                continue
+            change = changes.setdefault(
+                (event["type"], str(issue_id)),
+                {
+                    "type": event["type"],
+                    "workspace_id": str(project.workspace_id),
+                    "project_id": str(project.id),
+                    "issue_id": str(issue_id),
+                    "actor_id": str(actor.id),
+                    "fields": set(),
+                },
+            )
+            if activity.field:
+                change["fields"].add(activity.field)
+
+        if event["type"] in BULK_ISSUE_ACTIVITIES or event.get("issue_id") is None:
+            continue
+
+        issue_id = str(event.get("issue_id"))
+        grouped_activities[(project.id, issue_id, actor.id)].extend(
+            event_activities
+        )
+        if event.get("subscriber", True):
+            # add the user to issue subscriber
+            issue_subscribers[(issue_id, actor.id)] = IssueSubscriber(
+                issue_id=issue_id,
+                subscriber=actor,
+                project=project,
+                workspace_id=project.workspace_id,
+            )
+
+    issue_ids = set(
+        Issue.objects.filter(
+            pk__in={issue_id for _, issue_id, _ in grouped_activities}
+        ).values_list("id", flat=True)
+    )
+
+    # Touch all the issues at once
+    Issue.objects.filter(pk__in=issue_ids).update(updated_at=timezone.now())
+
+    IssueSubscriber.objects.bulk_create(
+        [
+            subscriber
+            for (issue_id, _), subscriber in issue_subscribers.items()
+            if UUID(issue_id) in issue_ids
+        ],
+        batch_size=100,
+        ignore_conflicts=True,
+    )
+
+    # Save all the values to database
+    issue_activities_created = IssueActivity.objects.bulk_create(
+        issue_activities, batch_size=100
+    )
+
+    if len(issue_activities_created):
+        post_issue_activity_hooks(issue_activities_created)
+
+    # Notifications are fanned out by their own task
+    notification_groups = [
+        {
+            "issue_id": issue_id,
+            "actor_id": str(actor_id),
+            "activity_ids": [str(activity.id) for activity in activities],
+        }
+        for (_, issue_id, actor_id), activities in grouped_activities.items()
+        if activities and UUID(issue_id) in issue_ids
+    ]
+    # Sent once the activities are committed, inside a transaction they
+    # roll back with the changes they describe
+    if notification_groups:
+        transaction.on_commit(
+            lambda: issue_notifications.delay(groups=notification_groups)
+        )
+
+    events = [
+        {**change, "fields": sorted(change["fields"])} for change in changes.values()
+    ]
+    transaction.on_commit(lambda: publish_events(events))
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1030,160 +1204,33 @@ def issue_activity(
     subscriber=True,
 ):
     try:
-        issue_activities = []
-
-        actor = User.objects.get(pk=actor_id)
-        project = Project.objects.get(pk=project_id)
-
-        if type not in [
-            "cycle.activity.created",
-            "cycle.activity.deleted",
-            "module.activity.created",
-            "module.activity.deleted",
-        ]:
-            issue = Issue.objects.filter(pk=issue_id).first()
-
-            if issue is not None:
-                try:
-                    issue.updated_at = timezone.now()
-                    issue.save(update_fields=["updated_at"])
-                except Exception as e:
-                    pass
-
-            if subscriber:
-                # add the user to issue subscriber
-                try:
-                    _ = IssueSubscriber.objects.get_or_create(
-                        issue_id=issue_id, subscriber=actor
-                    )
-                except Exception as e:
-                    pass
-
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-        }
-
-        func = ACTIVITY_MAPPER.get(type)
-        if func is not None:
-            func(
-                requested_data,
-                current_instance,
-                issue_id,
-                project,
-                actor,
-                issue_activities,
-            )
-
-        # Save all the values to database
-        issue_activities_created = IssueActivity.objects.bulk_create(issue_activities)
-        # Post the updates to segway for integrations and webhooks
-        if len(issue_activities_created):
-            # Don't send activities if the actor is a bot
-            try:
-                if settings.PROXY_BASE_URL:
-                    for issue_activity in issue_activities_created:
-                        headers = {"Content-Type": "application/json"}
-                        issue_activity_json = json.dumps(
-                            IssueActivitySerializer(issue_activity).data,
-                            cls=DjangoJSONEncoder,
-                        )
-                        _ = requests.post(
-                            f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
-                            json=issue_activity_json,
-                            headers=headers,
-                        )
-            except Exception as e:
-                capture_exception(e)
-
-        if type not in [
-            "cycle.activity.created",
-            "cycle.activity.deleted",
-            "module.activity.created",
-            "module.activity.deleted",
-        ]:
-            # Create Notifications
-            bulk_notifications = []
-
-            issue_subscribers = list(
-                IssueSubscriber.objects.filter(project=project, issue_id=issue_id)
-                .exclude(subscriber_id=actor_id)
-                .values_list("subscriber", flat=True)
-            )
-
-            issue_assignees = list(
-                IssueAssignee.objects.filter(project=project, issue_id=issue_id)
-                .exclude(assignee_id=actor_id)
-                .values_list("assignee", flat=True)
-            )
-
-            issue_subscribers = issue_subscribers + issue_assignees
-
-            issue = Issue.objects.filter(pk=issue_id).first()
-
-            # Add bot filtering
-            if (
-                issue is not None
-                and issue.created_by_id is not None
-                and not issue.created_by.is_bot
-                and str(issue.created_by_id) != str(actor_id)
-            ):
-                issue_subscribers = issue_subscribers + [issue.created_by_id]
-
-            for subscriber in issue_subscribers:
-                for issue_activity in issue_activities_created:
-                    bulk_notifications.append(
-                        Notification(
-                            workspace=project.workspace,
-                            sender="in_app:issue_activities",
-                            triggered_by_id=actor_id,
-                            receiver_id=subscriber,
-                            entity_identifier=issue_id,
-                            entity_name="issue",
-                            project=project,
-                            title=issue_activity.comment,
-                            data={
-                                "issue": {
-                                    "id": str(issue_id),
-                                    "name": str(issue.name),
-                                    "identifier": str(issue.project.identifier),
-                                    "sequence_id": issue.sequence_id,
-                                    "state_name": issue.state.name,
-                                    "state_group": issue.state.group,
-                                },
-                                "issue_activity": {
-                                    "id": str(issue_activity.id),
-                                    "verb": str(issue_activity.verb),
-                                    "field": str(issue_activity.field),
-                                    "actor": str(issue_activity.actor_id),
-                                    "new_value": str(issue_activity.new_value),
-                                    "old_value": str(issue_activity.old_value),
-                                    "issue_comment": str(
-                                        issue_activity.issue_comment.comment_stripped
-                                        if issue_activity.issue_comment is not None
-                                        else ""
-                                    ),
-                                },
-                            },
-                        )
-                    )
+        record_issue_activities(
+            [
+                {
+                    "type": type,
+                    "requested_data": requested_data,
+                    "current_instance": current_instance,
+                    "issue_id": issue_id,
+                    "actor_id": actor_id,
+                    "project_id": project_id,
+                    "subscriber": subscriber,
+                }
+            ]
+        )
+        return
+    except Exception as e:
+        # Print logs if in DEBUG mode
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
 
-            # Bulk create notifications
-            Notification.objects.bulk_create(bulk_notifications, batch_size=100)
 
+@shared_task
+def bulk_issue_activity(events):
+    """Batched `issue_activity` for automation and import jobs"""
+    try:
+        record_issue_activities(events)
         return
     except Exception as e:
         # Print logs if in DEBUG mode
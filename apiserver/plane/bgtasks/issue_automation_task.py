@@ -4,8 +4,10 @@ from datetime import timedelta
 
 # Django imports
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import Q
 from django.conf import settings
+from django.core.cache import cache
 
 # Third party imports
 from celery import shared_task
@@ -13,145 +15,172 @@ from sentry_sdk import capture_exception
 
 # Module imports
 from plane.db.models import Issue, Project, State
-from plane.bgtasks.issue_activites_task import issue_activity
-
-
-@shared_task
-def archive_and_close_old_issues():
-    archive_old_issues()
-    close_old_issues()
-
-
-def archive_old_issues():
+from plane.db.models.issue import release_sort_orders
+from plane.db.models.progress import refresh_issue_progress
+from plane.db.models.analytic import invalidate_analytics
+from plane.bgtasks.issue_activites_task import record_issue_activities
+
+# Number of issues changed by a single statement
+AUTOMATION_CHUNK_SIZE = 1000
+# A failed run is retried and resumes after the last finished project
+CHECKPOINT_TIMEOUT = 60 * 60 * 24
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=60,
+    retry_backoff_max=60 * 60,
+    max_retries=5,
+)
+def archive_and_close_old_issues(self):
     try:
-        # Get all the projects whose archive_in is greater than 0
-        projects = Project.objects.filter(archive_in__gt=0)
-
-        for project in projects:
-            project_id = project.id
-            archive_in = project.archive_in
-
-            # Get all the issues whose updated_at in less that the archive_in month
-            issues = Issue.objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=archive_in * 30)),
-                    state__group__in=["completed", "cancelled"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (
-                    Q(issue_cycle__cycle__end_date__lt=timezone.now().date())
-                    & Q(issue_cycle__isnull=False)
-                ),
-                Q(issue_module__isnull=True)
-                | (
-                    Q(issue_module__module__target_date__lt=timezone.now().date())
-                    & Q(issue_module__isnull=False)
-                ),
-            ).filter(
-                Q(issue_inbox__status=1)
-                | Q(issue_inbox__status=-1)
-                | Q(issue_inbox__status=2)
-                | Q(issue_inbox__isnull=True)
-            )
-
-            # Check if Issues
-            if issues:
-                issues_to_update = []
-                for issue in issues:
-                    issue.archived_at = timezone.now()
-                    issues_to_update.append(issue)
-
-                # Bulk Update the issues and log the activity
-                Issue.objects.bulk_update(
-                    issues_to_update, ["archived_at"], batch_size=100
-                )
-                [
-                    issue_activity.delay(
-                        type="issue.activity.updated",
-                        requested_data=json.dumps({"archived_at": str(issue.archived_at)}),
-                        actor_id=str(project.created_by_id),
-                        issue_id=issue.id,
-                        project_id=project_id,
-                        current_instance=None,
-                        subscriber=False,
-                    )
-                    for issue in issues_to_update
-                ]
-        return
+        # Retries keep the id of the run, a new run starts from the top
+        run_id = self.request.id
+        archive_old_issues(run_id)
+        close_old_issues(run_id)
     except Exception as e:
         if settings.DEBUG:
             print(e)
         capture_exception(e)
-        return
-
-
-def close_old_issues():
-    try:
-        # Get all the projects whose close_in is greater than 0
-        projects = Project.objects.filter(close_in__gt=0).select_related(
-            "default_state"
+        raise
+
+
+def get_stale_issues(project_id, days, state_groups):
+    """Issues of the project untouched for days, outside running cycles and modules"""
+    return Issue.issue_objects.filter(
+        Q(
+            project_id=project_id,
+            updated_at__lte=(timezone.now() - timedelta(days=days)),
+            state__group__in=state_groups,
+        ),
+        Q(issue_cycle__isnull=True)
+        | (
+            Q(issue_cycle__cycle__end_date__lt=timezone.now().date())
+            & Q(issue_cycle__isnull=False)
+        ),
+        Q(issue_module__isnull=True)
+        | (
+            Q(issue_module__module__target_date__lt=timezone.now().date())
+            & Q(issue_module__isnull=False)
+        ),
+    )
+
+
+def run_automation(job, run_id, projects, automate_project):
+    """
+    Run the job over the projects in order, checkpointing every finished one
+    for the retries of the run
+    """
+    key = f"issue_automation:{job}:{run_id}"
+    checkpoint = cache.get(key) if run_id is not None else None
+    if checkpoint is not None:
+        projects = projects.filter(pk__gt=checkpoint)
+
+    for project in projects.order_by("pk").iterator():
+        automate_project(project)
+        if run_id is not None:
+            cache.set(key, str(project.id), CHECKPOINT_TIMEOUT)
+
+
+def update_issues(project, issues, values, requested_data):
+    """
+    Update the issues in chunks with one statement each and record the
+    activities of every chunk in bulk, in the transaction of the chunk
+    """
+    updated = False
+    last_id = None
+    while True:
+        chunk = issues.order_by("pk")
+        if last_id is not None:
+            chunk = chunk.filter(pk__gt=last_id)
+        issue_ids = list(
+            chunk.values_list("pk", flat=True).distinct()[:AUTOMATION_CHUNK_SIZE]
         )
+        if not issue_ids:
+            break
+        last_id = issue_ids[-1]
+
+        with transaction.atomic():
+            Issue.objects.filter(pk__in=issue_ids).update(**values)
+            refresh_issue_progress(issue_ids)
+            if "state_id" in values:
+                release_sort_orders(
+                    Issue.objects.filter(pk__in=issue_ids).values_list(
+                        "state_id", "sort_order"
+                    )
+                )
 
-        for project in projects:
-            project_id = project.id
-            close_in = project.close_in
-
-            # Get all the issues whose updated_at in less that the close_in month
-            issues = Issue.objects.filter(
-                Q(
-                    project=project_id,
-                    archived_at__isnull=True,
-                    updated_at__lte=(timezone.now() - timedelta(days=close_in * 30)),
-                    state__group__in=["backlog", "unstarted", "started"],
-                ),
-                Q(issue_cycle__isnull=True)
-                | (
-                    Q(issue_cycle__cycle__end_date__lt=timezone.now().date())
-                    & Q(issue_cycle__isnull=False)
-                ),
-                Q(issue_module__isnull=True)
-                | (
-                    Q(issue_module__module__target_date__lt=timezone.now().date())
-                    & Q(issue_module__isnull=False)
-                ),
-            ).filter(
-                Q(issue_inbox__status=1)
-                | Q(issue_inbox__status=-1)
-                | Q(issue_inbox__status=2)
-                | Q(issue_inbox__isnull=True)
+            # The activities commit with the chunk, a retry no longer finds
+            # the issues of a committed chunk
+            record_issue_activities(
+                [
+                    {
+                        "type": "issue.activity.updated",
+                        "requested_data": requested_data,
+                        "actor_id": str(project.created_by_id),
+                        "issue_id": str(issue_id),
+                        "project_id": str(project.id),
+                        "current_instance": None,
+                        "subscriber": False,
+                    }
+                    for issue_id in issue_ids
+                ]
             )
 
-            # Check if Issues
-            if issues:
-                if project.default_state is None:
-                    close_state = State.objects.filter(group="cancelled").first()
-                else:
-                    close_state = project.default_state
+        updated = True
 
-                issues_to_update = []
-                for issue in issues:
-                    issue.state = close_state
-                    issues_to_update.append(issue)
+    if updated:
+        invalidate_analytics(project.workspace_id, [project.id])
 
-                # Bulk Update the issues and log the activity
-                Issue.objects.bulk_update(issues_to_update, ["state"], batch_size=100)
-                [
-                    issue_activity.delay(
-                        type="issue.activity.updated",
-                        requested_data=json.dumps({"closed_to": str(issue.state_id)}),
-                        actor_id=str(project.created_by_id),
-                        issue_id=issue.id,
-                        project_id=project_id,
-                        current_instance=None,
-                        subscriber=False,
-                    )
-                    for issue in issues_to_update
-                ]
-        return
-    except Exception as e:
-        if settings.DEBUG:
-            print(e)
-        capture_exception(e)
-        return
+
+def archive_project_issues(project):
+    archived_at = timezone.now()
+    update_issues(
+        project,
+        get_stale_issues(project.id, project.archive_in * 30, ["completed", "cancelled"]),
+        {"archived_at": archived_at},
+        json.dumps({"archived_at": str(archived_at)}),
+    )
+
+
+def close_project_issues(project):
+    if project.default_state_id is None:
+        close_state_id = (
+            State.objects.filter(project_id=project.id, group="cancelled")
+            .values_list("id", flat=True)
+            .first()
+        )
+        if close_state_id is None:
+            return
+    else:
+        close_state_id = project.default_state_id
+
+    update_issues(
+        project,
+        get_stale_issues(
+            project.id, project.close_in * 30, ["backlog", "unstarted", "started"]
+        ),
+        {"state_id": close_state_id},
+        json.dumps({"closed_to": str(close_state_id)}),
+    )
+
+
+def archive_old_issues(run_id=None):
+    # Get all the projects whose archive_in is greater than 0
+    run_automation(
+        "archive",
+        run_id,
+        Project.objects.filter(archive_in__gt=0),
+        archive_project_issues,
+    )
+
+
+def close_old_issues(run_id=None):
+    # Get all the projects whose close_in is greater than 0
+    run_automation(
+        "close",
+        run_id,
+        Project.objects.filter(close_in__gt=0),
+        close_project_issues,
+    )
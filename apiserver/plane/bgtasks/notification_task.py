@@ -0,0 +1,177 @@
+# Python imports
+import time
+from collections import defaultdict
+from uuid import UUID
+
+# Django imports
+from django.conf import settings
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import (
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueSubscriber,
+    Notification,
+)
+from plane.settings.redis import redis_instance
+
+
+def get_issue_recipients(issue_ids):
+    """Subscribers, assignees and human creators of the issues in one query"""
+    rows = (
+        IssueSubscriber.objects.filter(issue_id__in=issue_ids)
+        .order_by()
+        .values_list("issue_id", "subscriber_id")
+        .union(
+            IssueAssignee.objects.filter(issue_id__in=issue_ids)
+            .order_by()
+            .values_list("issue_id", "assignee_id"),
+            Issue.objects.filter(
+                pk__in=issue_ids,
+                created_by__isnull=False,
+                created_by__is_bot=False,
+            )
+            .order_by()
+            .values_list("id", "created_by_id"),
+        )
+    )
+
+    recipients = defaultdict(set)
+    for issue_id, user_id in rows:
+        recipients[issue_id].add(user_id)
+    return recipients
+
+
+def record_fan_out_metrics(workspace_counts, duration):
+    # Per workspace totals, throughput is notifications over duration_ms
+    try:
+        ri = redis_instance()
+        pipe = ri.pipeline()
+        date = timezone.now().date().isoformat()
+        for workspace_id, count in workspace_counts.items():
+            key = f"notification_fan_out:{workspace_id}:{date}"
+            pipe.hincrby(key, "tasks", 1)
+            pipe.hincrby(key, "notifications", count)
+            pipe.hincrby(key, "duration_ms", int(duration * 1000))
+            pipe.expire(key, 60 * 60 * 24 * 30)
+        pipe.execute()
+    except Exception as e:
+        capture_exception(e)
+
+
+@shared_task
+def issue_notifications(groups, batch_size=1000):
+    """
+    Fan out the notifications of recorded activities, every group is a
+    dict with the issue_id, the actor_id and the activity_ids
+    """
+    try:
+        started_at = time.monotonic()
+
+        issue_ids = {UUID(str(group["issue_id"])) for group in groups}
+        activity_ids = [
+            activity_id for group in groups for activity_id in group["activity_ids"]
+        ]
+
+        issues = {
+            issue["id"]: issue
+            for issue in Issue.objects.filter(pk__in=issue_ids).values(
+                "id",
+                "name",
+                "sequence_id",
+                "project_id",
+                "workspace_id",
+                "project__identifier",
+                "state__name",
+                "state__group",
+            )
+        }
+        activities = {
+            str(activity["id"]): activity
+            for activity in IssueActivity.objects.filter(pk__in=activity_ids).values(
+                "id",
+                "verb",
+                "field",
+                "actor_id",
+                "new_value",
+                "old_value",
+                "comment",
+                "issue_comment__comment_stripped",
+            )
+        }
+        recipients = get_issue_recipients(issue_ids)
+
+        bulk_notifications = []
+        workspace_counts = defaultdict(int)
+        for group in groups:
+            issue = issues.get(UUID(str(group["issue_id"])))
+            if issue is None:
+                continue
+
+            actor_id = UUID(str(group["actor_id"]))
+            receivers = recipients[issue["id"]] - {actor_id}
+            if not receivers:
+                continue
+
+            issue_data = {
+                "id": str(issue["id"]),
+                "name": str(issue["name"]),
+                "identifier": str(issue["project__identifier"]),
+                "sequence_id": issue["sequence_id"],
+                "state_name": issue["state__name"],
+                "state_group": issue["state__group"],
+            }
+
+            for activity_id in group["activity_ids"]:
+                activity = activities.get(str(activity_id))
+                if activity is None:
+                    continue
+
+                # Built once and shared by every receiver of the activity
+                data = {
+                    "issue": issue_data,
+                    "issue_activity": {
+                        "id": str(activity["id"]),
+                        "verb": str(activity["verb"]),
+                        "field": str(activity["field"]),
+                        "actor": str(activity["actor_id"]),
+                        "new_value": str(activity["new_value"]),
+                        "old_value": str(activity["old_value"]),
+                        "issue_comment": str(
+                            activity["issue_comment__comment_stripped"] or ""
+                        ),
+                    },
+                }
+
+                for receiver_id in receivers:
+                    bulk_notifications.append(
+                        Notification(
+                            workspace_id=issue["workspace_id"],
+                            sender="in_app:issue_activities",
+                            triggered_by_id=actor_id,
+                            receiver_id=receiver_id,
+                            entity_identifier=issue["id"],
+                            entity_name="issue",
+                            project_id=issue["project_id"],
+                            title=activity["comment"],
+                            data=data,
+                        )
+                    )
+                workspace_counts[issue["workspace_id"]] += len(receivers)
+
+        # Bulk create notifications
+        Notification.objects.bulk_create(bulk_notifications, batch_size=batch_size)
+
+        record_fan_out_metrics(workspace_counts, time.monotonic() - started_at)
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
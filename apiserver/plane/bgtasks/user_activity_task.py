@@ -0,0 +1,21 @@
+# Django imports
+from django.conf import settings
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.utils.user_activity import flush_user_activity
+
+
+@shared_task
+def flush_last_active():
+    try:
+        flush_user_activity()
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
@@ -0,0 +1,166 @@
+# Python imports
+import json
+import time
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Django imports
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+# Third party imports
+from celery import shared_task
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.db.models import WebhookDelivery
+from plane.settings.redis import redis_instance
+
+# Rows stay claimed by a worker for this long before they can be retried
+CLAIM_TIMEOUT = timedelta(minutes=5)
+# Longest wait between two attempts of a delivery
+MAX_BACKOFF = timedelta(hours=1)
+
+_session = None
+
+
+def get_session():
+    # One pooled session per worker process, connections are kept alive
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=settings.WEBHOOK_ENDPOINT_CONCURRENCY * 4,
+        )
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+        _session.headers.update({"Content-Type": "application/json"})
+    return _session
+
+
+def get_backoff(attempts):
+    return min(timedelta(seconds=30 * 2 ** (attempts - 1)), MAX_BACKOFF)
+
+
+def post_delivery(delivery, semaphore):
+    with semaphore:
+        started_at = time.monotonic()
+        try:
+            response = get_session().post(
+                delivery.url,
+                json=json.dumps(delivery.payload, cls=DjangoJSONEncoder),
+                timeout=settings.WEBHOOK_TIMEOUT,
+            )
+            delivery.response_status = response.status_code
+            delivery.last_error = "" if response.ok else response.text[:1000]
+            success = response.ok
+        except requests.RequestException as e:
+            delivery.response_status = None
+            delivery.last_error = str(e)[:1000]
+            success = False
+        delivery.latency_ms = int((time.monotonic() - started_at) * 1000)
+
+    now = timezone.now()
+    delivery.attempts += 1
+    if success:
+        delivery.status = "delivered"
+        delivery.delivered_at = now
+    elif delivery.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+        delivery.status = "failed"
+    else:
+        delivery.next_attempt_at = now + get_backoff(delivery.attempts)
+    return delivery
+
+
+def record_delivery_metrics(deliveries):
+    # Daily totals, the mean latency is latency_ms over attempts
+    try:
+        ri = redis_instance()
+        pipe = ri.pipeline()
+        key = f"webhook_deliveries:{timezone.now().date().isoformat()}"
+        for delivery in deliveries:
+            pipe.hincrby(key, "attempts", 1)
+            pipe.hincrby(key, delivery.status, 1)
+            pipe.hincrby(key, "latency_ms", delivery.latency_ms or 0)
+        pipe.expire(key, 60 * 60 * 24 * 30)
+        pipe.execute()
+    except Exception as e:
+        capture_exception(e)
+
+
+def claim_deliveries(batch_size):
+    now = timezone.now()
+    with transaction.atomic():
+        deliveries = list(
+            WebhookDelivery.objects.filter(status="pending", next_attempt_at__lte=now)
+            .order_by("next_attempt_at")
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        WebhookDelivery.objects.filter(pk__in=[d.id for d in deliveries]).update(
+            next_attempt_at=now + CLAIM_TIMEOUT
+        )
+    return deliveries
+
+
+@shared_task
+def deliver_webhooks(batch_size=100):
+    try:
+        deliveries = claim_deliveries(batch_size)
+        if not deliveries:
+            return
+
+        # Every endpoint gets at most WEBHOOK_ENDPOINT_CONCURRENCY requests at a time
+        semaphores = defaultdict(
+            lambda: threading.BoundedSemaphore(settings.WEBHOOK_ENDPOINT_CONCURRENCY)
+        )
+        for delivery in deliveries:
+            semaphores[urlparse(delivery.url).netloc]
+
+        with ThreadPoolExecutor(
+            max_workers=min(
+                len(deliveries),
+                settings.WEBHOOK_ENDPOINT_CONCURRENCY * len(semaphores),
+            )
+        ) as executor:
+            deliveries = list(
+                executor.map(
+                    lambda delivery: post_delivery(
+                        delivery, semaphores[urlparse(delivery.url).netloc]
+                    ),
+                    deliveries,
+                )
+            )
+
+        WebhookDelivery.objects.bulk_update(
+            deliveries,
+            [
+                "status",
+                "attempts",
+                "next_attempt_at",
+                "delivered_at",
+                "response_status",
+                "latency_ms",
+                "last_error",
+            ],
+            batch_size=100,
+        )
+        record_delivery_metrics(deliveries)
+
+        # Keep draining while a full batch was due
+        if len(deliveries) == batch_size:
+            deliver_webhooks.delay(batch_size=batch_size)
+        return
+    except Exception as e:
+        if settings.DEBUG:
+            print(e)
+        capture_exception(e)
+        return
@@ -20,6 +20,26 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.issue_automation_task.archive_and_close_old_issues",
         "schedule": crontab(hour=0, minute=0),
     },
+    # Executes every day at 11:55 PM
+    "check-every-day-to-capture-burndown": {
+        "task": "plane.bgtasks.burndown_task.capture_burndown_snapshots",
+        "schedule": crontab(hour=23, minute=55),
+    },
+    # Executes every minute
+    "check-every-minute-to-deliver-webhooks": {
+        "task": "plane.bgtasks.webhook_task.deliver_webhooks",
+        "schedule": crontab(minute="*"),
+    },
+    # Executes every minute
+    "check-every-minute-to-flush-last-active": {
+        "task": "plane.bgtasks.user_activity_task.flush_last_active",
+        "schedule": crontab(minute="*"),
+    },
+    # Executes every hour
+    "check-every-hour-to-delete-old-exports": {
+        "task": "plane.bgtasks.analytic_plot_export.delete_old_exports",
+        "schedule": crontab(minute=0),
+    },
 }
 
 # Load task modules from all registered Django app configs.
@@ -0,0 +1,40 @@
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from plane.db.models import Cycle, Module, CycleBurndown, ModuleBurndown
+
+
+class Command(BaseCommand):
+    """
+    Django command to rebuild the missing burndown days of the cycles and
+    modules from the history of their issues
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        today = timezone.localdate()
+
+        for model, burndown_model in [
+            (Cycle, CycleBurndown),
+            (Module, ModuleBurndown),
+        ]:
+            self.stdout.write(f"Backfilling {burndown_model._meta.verbose_name}...")
+            ids = list(
+                model.objects.filter(start_date__lte=today)
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            backfilled = 0
+            for start in range(0, len(ids), batch_size):
+                backfilled += burndown_model.backfill_missing(
+                    ids[start : start + batch_size], until=today
+                )
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Backfilled {backfilled} days of {len(ids)} rows"
+                )
+            )
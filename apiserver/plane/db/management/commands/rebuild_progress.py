@@ -0,0 +1,28 @@
+from django.core.management import BaseCommand
+
+from plane.db.models import Cycle, Module, CycleProgress, ModuleProgress
+
+
+class Command(BaseCommand):
+    """Django command to rebuild the cycle and module progress counters"""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model, progress_model in [
+            (Cycle, CycleProgress),
+            (Module, ModuleProgress),
+        ]:
+            self.stdout.write(f"Rebuilding {progress_model._meta.verbose_name}...")
+            ids = list(model.objects.order_by("pk").values_list("pk", flat=True))
+            for start in range(0, len(ids), batch_size):
+                progress_model.refresh(ids[start : start + batch_size])
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Rebuilt {progress_model._meta.verbose_name} for {len(ids)} rows"
+                )
+            )
@@ -0,0 +1,65 @@
+from django.core.management import BaseCommand
+from django.db.models import F, Func, OuterRef, Q, Subquery
+
+from plane.db.models import Issue, IssueAttachment, IssueLink
+
+
+def count_of(queryset):
+    return Subquery(
+        queryset.order_by()
+        .annotate(count=Func(F("id"), function="Count"))
+        .values("count")
+    )
+
+
+class Command(BaseCommand):
+    """Django command to repair the sub issue, link and attachment counters"""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        counts = {
+            "sub_issues_count": lambda: count_of(
+                Issue.issue_objects.filter(parent=OuterRef("pk"))
+            ),
+            "link_count": lambda: count_of(
+                IssueLink.objects.filter(issue=OuterRef("pk"))
+            ),
+            "attachment_count": lambda: count_of(
+                IssueAttachment.objects.filter(issue=OuterRef("pk"))
+            ),
+        }
+
+        self.stdout.write("Reconciling issue counters...")
+        queryset = Issue.objects.order_by("pk")
+        repaired = 0
+        last_pk = None
+        while True:
+            rows = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            pks = list(rows.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            last_pk = pks[-1]
+
+            # Only the drifted rows are written, the counts are computed again
+            # in the update so concurrent increments are not lost
+            drifted = (
+                Issue.objects.filter(pk__in=pks)
+                .annotate(
+                    **{f"actual_{field}": count() for field, count in counts.items()}
+                )
+                .exclude(
+                    Q(sub_issues_count=F("actual_sub_issues_count"))
+                    & Q(link_count=F("actual_link_count"))
+                    & Q(attachment_count=F("actual_attachment_count"))
+                )
+                .values_list("pk", flat=True)
+            )
+            repaired += Issue.objects.filter(pk__in=list(drifted)).update(
+                **{field: count() for field, count in counts.items()}
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"Repaired {repaired} issues"))
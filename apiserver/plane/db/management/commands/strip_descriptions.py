@@ -0,0 +1,47 @@
+from django.core.management import BaseCommand
+
+from plane.db.models import Issue, IssueComment, Page, PageBlock
+from plane.utils.html_processor import strip_tags
+
+
+class Command(BaseCommand):
+    """Django command to extract the text of the rich text fields again"""
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        for model, html_field, text_field, empty in [
+            (Issue, "description_html", "description_stripped", None),
+            (IssueComment, "comment_html", "comment_stripped", ""),
+            (Page, "description_html", "description_stripped", None),
+            (PageBlock, "description_html", "description_stripped", None),
+        ]:
+            self.stdout.write(f"Stripping {model._meta.verbose_name_plural}...")
+            queryset = model.objects.order_by("pk").only("pk", html_field, text_field)
+            updated = 0
+            last_pk = None
+            while True:
+                rows = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+                rows = list(rows[:batch_size])
+                if not rows:
+                    break
+                last_pk = rows[-1].pk
+
+                changed = []
+                for row in rows:
+                    html = getattr(row, html_field)
+                    text = strip_tags(html) if html else empty
+                    if getattr(row, text_field) != text:
+                        setattr(row, text_field, text)
+                        changed.append(row)
+                model.objects.bulk_update(changed, [text_field], batch_size=batch_size)
+                updated += len(changed)
+
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Updated {updated} {model._meta.verbose_name_plural}"
+                )
+            )
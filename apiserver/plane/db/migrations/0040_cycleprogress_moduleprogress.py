@@ -0,0 +1,124 @@
+# Generated by Django 4.2.3 on 2023-07-27 10:12
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum, Value
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+import uuid
+
+
+def build_progress(apps, schema_editor):
+    for entity_model, progress_model, entity_field, issue_relation in [
+        ("Cycle", "CycleProgress", "cycle", "issue_cycle"),
+        ("Module", "ModuleProgress", "module", "issue_module"),
+    ]:
+        Entity = apps.get_model("db", entity_model)
+        Progress = apps.get_model("db", progress_model)
+
+        # Same aggregates as the progress refresh at the time of the migration
+        issue = f"{issue_relation}__issue"
+        live = Q(**{f"{issue}__archived_at__isnull": True})
+        aggregates = {
+            "total_issues": Count(issue_relation, filter=live),
+            "total_estimates": Coalesce(
+                Sum(f"{issue}__estimate_point", filter=live), Value(0)
+            ),
+        }
+        for group in ["backlog", "unstarted", "started", "completed", "cancelled"]:
+            aggregates[f"{group}_issues"] = Count(
+                issue_relation,
+                filter=live & Q(**{f"{issue}__state__group": group}),
+            )
+        for group in ["completed", "started"]:
+            aggregates[f"{group}_estimates"] = Coalesce(
+                Sum(
+                    f"{issue}__estimate_point",
+                    filter=live & Q(**{f"{issue}__state__group": group}),
+                ),
+                Value(0),
+            )
+
+        rows = (
+            Entity.objects.order_by()
+            .values("id", "project_id", "workspace_id")
+            .annotate(**aggregates)
+        )
+        Progress.objects.bulk_create(
+            [
+                Progress(
+                    project_id=row["project_id"],
+                    workspace_id=row["workspace_id"],
+                    **{f"{entity_field}_id": row["id"]},
+                    **{field: row[field] for field in aggregates},
+                )
+                for row in rows
+            ],
+            batch_size=100,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("db", "0039_auto_20230723_2203"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CycleProgress",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Created At")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Last Modified At")),
+                ("id", models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ("total_issues", models.PositiveIntegerField(default=0)),
+                ("backlog_issues", models.PositiveIntegerField(default=0)),
+                ("unstarted_issues", models.PositiveIntegerField(default=0)),
+                ("started_issues", models.PositiveIntegerField(default=0)),
+                ("completed_issues", models.PositiveIntegerField(default=0)),
+                ("cancelled_issues", models.PositiveIntegerField(default=0)),
+                ("total_estimates", models.PositiveIntegerField(default=0)),
+                ("completed_estimates", models.PositiveIntegerField(default=0)),
+                ("started_estimates", models.PositiveIntegerField(default=0)),
+                ("created_by", models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="%(class)s_created_by", to=settings.AUTH_USER_MODEL, verbose_name="Created By")),
+                ("cycle", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="progress", to="db.cycle")),
+                ("project", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="project_%(class)s", to="db.project")),
+                ("updated_by", models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="%(class)s_updated_by", to=settings.AUTH_USER_MODEL, verbose_name="Last Modified By")),
+                ("workspace", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="workspace_%(class)s", to="db.workspace")),
+            ],
+            options={
+                "verbose_name": "Cycle Progress",
+                "verbose_name_plural": "Cycle Progresses",
+                "db_table": "cycle_progresses",
+                "ordering": ("-created_at",),
+            },
+        ),
+        migrations.CreateModel(
+            name="ModuleProgress",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Created At")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Last Modified At")),
+                ("id", models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ("total_issues", models.PositiveIntegerField(default=0)),
+                ("backlog_issues", models.PositiveIntegerField(default=0)),
+                ("unstarted_issues", models.PositiveIntegerField(default=0)),
+                ("started_issues", models.PositiveIntegerField(default=0)),
+                ("completed_issues", models.PositiveIntegerField(default=0)),
+                ("cancelled_issues", models.PositiveIntegerField(default=0)),
+                ("total_estimates", models.PositiveIntegerField(default=0)),
+                ("completed_estimates", models.PositiveIntegerField(default=0)),
+                ("started_estimates", models.PositiveIntegerField(default=0)),
+                ("created_by", models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="%(class)s_created_by", to=settings.AUTH_USER_MODEL, verbose_name="Created By")),
+                ("module", models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name="progress", to="db.module")),
+                ("project", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="project_%(class)s", to="db.project")),
+                ("updated_by", models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name="%(class)s_updated_by", to=settings.AUTH_USER_MODEL, verbose_name="Last Modified By")),
+                ("workspace", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="workspace_%(class)s", to="db.workspace")),
+            ],
+            options={
+                "verbose_name": "Module Progress",
+                "verbose_name_plural": "Module Progresses",
+                "db_table": "module_progresses",
+                "ordering": ("-created_at",),
+            },
+        ),
+        migrations.RunPython(build_progress, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 4.2.3 on 2023-07-28 09:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0040_cycleprogress_moduleprogress"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ModuleBurndown',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('total_issues', models.PositiveIntegerField(default=0)),
+                ('completed_issues', models.PositiveIntegerField(default=0)),
+                ('pending_issues', models.PositiveIntegerField(default=0)),
+                ('total_estimates', models.PositiveIntegerField(default=0)),
+                ('completed_estimates', models.PositiveIntegerField(default=0)),
+                ('pending_estimates', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('module', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='burndowns', to='db.module')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Module Burndown',
+                'verbose_name_plural': 'Module Burndowns',
+                'db_table': 'module_burndowns',
+                'ordering': ('date',),
+                'unique_together': {('module', 'date')},
+            },
+        ),
+        migrations.CreateModel(
+            name='CycleBurndown',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('date', models.DateField()),
+                ('total_issues', models.PositiveIntegerField(default=0)),
+                ('completed_issues', models.PositiveIntegerField(default=0)),
+                ('pending_issues', models.PositiveIntegerField(default=0)),
+                ('total_estimates', models.PositiveIntegerField(default=0)),
+                ('completed_estimates', models.PositiveIntegerField(default=0)),
+                ('pending_estimates', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('cycle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='burndowns', to='db.cycle')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Cycle Burndown',
+                'verbose_name_plural': 'Cycle Burndowns',
+                'db_table': 'cycle_burndowns',
+                'ordering': ('date',),
+                'unique_together': {('cycle', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.3 on 2023-08-01 08:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0042_webhookdelivery"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importer",
+            name="imported_issues",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.3 on 2023-08-02 10:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+import django.contrib.postgres.search
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the tables for writes
+    atomic = False
+
+    dependencies = [
+        ("db", "0043_importer_imported_issues"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='cycle',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple', weight='A'), name='cycle_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='cycle',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='cycle_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='simple', weight='A'), '||', django.contrib.postgres.search.SearchVector('description_stripped', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig('simple')), name='issue_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issue',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='issue_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='module',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.SearchVector('name', config='simple', weight='A'), name='module_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='module',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='module_name_trgm_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('name', config='simple', weight='A'), '||', django.contrib.postgres.search.SearchVector('description_stripped', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig('simple')), name='page_search_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='page',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='page_name_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 4.2.3 on 2023-08-03 09:15
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+import django.db.models.deletion
+import uuid
+
+
+def build_rollups(apps, schema_editor):
+    Issue = apps.get_model("db", "Issue")
+    IssueRollup = apps.get_model("db", "IssueRollup")
+
+    # Same issues as Issue.issue_objects
+    issues = Issue.objects.filter(
+        models.Q(issue_inbox__status=1)
+        | models.Q(issue_inbox__status=-1)
+        | models.Q(issue_inbox__status=2)
+        | models.Q(issue_inbox__isnull=True),
+        archived_at__isnull=True,
+    )
+    for facet, dimensions in {
+        "issue": {},
+        "label": {"label_id": "labels__id"},
+        "assignee": {"assignee_id": "assignees__id"},
+    }.items():
+        rows = (
+            issues.order_by()
+            .values(
+                "project_id",
+                "workspace_id",
+                "priority",
+                month=TruncMonth("created_at", output_field=models.DateField()),
+                state_group=F("state__group"),
+                **{field: F(lookup) for field, lookup in dimensions.items()},
+            )
+            .annotate(issue_count=Count("*"), estimate_sum=Sum("estimate_point"))
+        )
+        IssueRollup.objects.bulk_create(
+            [IssueRollup(facet=facet, **row) for row in rows], batch_size=1000
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0044_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueRollup',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('facet', models.CharField(choices=[('issue', 'Issue'), ('label', 'Label'), ('assignee', 'Assignee')], max_length=20)),
+                ('month', models.DateField()),
+                ('state_group', models.CharField(max_length=20, null=True)),
+                ('priority', models.CharField(max_length=30, null=True)),
+                ('issue_count', models.PositiveIntegerField(default=0)),
+                ('estimate_sum', models.PositiveIntegerField(null=True)),
+                ('assignee', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='issue_rollups', to=settings.AUTH_USER_MODEL)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('label', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='rollups', to='db.label')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_%(class)s', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='workspace_%(class)s', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Rollup',
+                'verbose_name_plural': 'Issue Rollups',
+                'db_table': 'issue_rollups',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['workspace', 'facet'], name='issue_rollup_facet_idx')],
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
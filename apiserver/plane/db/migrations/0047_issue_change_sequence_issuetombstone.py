@@ -0,0 +1,84 @@
+# Generated by Django 4.2.3 on 2023-08-07 11:24
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+# Every write stamps the row with the id of its transaction, this covers
+# queryset updates and bulk inserts which never call save
+CHANGE_SEQUENCE_SQL = """
+CREATE FUNCTION set_change_sequence() RETURNS trigger AS $$
+BEGIN
+    NEW.change_sequence := txid_current();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER issues_change_sequence
+BEFORE INSERT OR UPDATE ON issues
+FOR EACH ROW EXECUTE FUNCTION set_change_sequence();
+
+CREATE TRIGGER issue_tombstones_change_sequence
+BEFORE INSERT ON issue_tombstones
+FOR EACH ROW EXECUTE FUNCTION set_change_sequence();
+"""
+
+DROP_CHANGE_SEQUENCE_SQL = """
+DROP TRIGGER IF EXISTS issue_tombstones_change_sequence ON issue_tombstones;
+DROP TRIGGER IF EXISTS issues_change_sequence ON issues;
+DROP FUNCTION IF EXISTS set_change_sequence();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0046_issuesequencecounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='change_sequence',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['project', 'change_sequence', 'id'], name='issue_project_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(fields=['workspace', 'change_sequence', 'id'], name='issue_workspace_change_idx'),
+        ),
+        migrations.CreateModel(
+            name='IssueTombstone',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Last Modified At')),
+                ('id', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True)),
+                ('issue_id', models.UUIDField()),
+                ('change_sequence', models.BigIntegerField(default=0, editable=False)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created_by', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('project', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='issue_tombstones', to='db.project')),
+                ('updated_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated_by', to=settings.AUTH_USER_MODEL, verbose_name='Last Modified By')),
+                ('workspace', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='issue_tombstones', to='db.workspace')),
+            ],
+            options={
+                'verbose_name': 'Issue Tombstone',
+                'verbose_name_plural': 'Issue Tombstones',
+                'db_table': 'issue_tombstones',
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='issuetombstone',
+            index=models.Index(fields=['project', 'change_sequence'], name='tombstone_project_change_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issuetombstone',
+            index=models.Index(fields=['workspace', 'change_sequence'], name='tombstone_workspace_change_idx'),
+        ),
+        migrations.RunSQL(CHANGE_SEQUENCE_SQL, DROP_CHANGE_SEQUENCE_SQL),
+    ]
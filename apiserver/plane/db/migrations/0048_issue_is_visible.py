@@ -0,0 +1,85 @@
+# Generated by Django 4.2.3 on 2023-08-09 08:52
+
+from django.db import migrations, models
+
+
+# Same rule as the former inbox join of the issue manager, issues are
+# listed outside of the inbox or once they are accepted, rejected or
+# marked as duplicate, as long as they are not archived
+VISIBILITY_SQL = """
+CREATE FUNCTION issue_is_visible(issue_id uuid, archived_at date) RETURNS boolean AS $$
+    SELECT archived_at IS NULL AND (
+        NOT EXISTS (SELECT 1 FROM inbox_issues WHERE inbox_issues.issue_id = $1)
+        OR EXISTS (
+            SELECT 1 FROM inbox_issues
+            WHERE inbox_issues.issue_id = $1 AND inbox_issues.status IN (1, -1, 2)
+        )
+    )
+$$ LANGUAGE sql STABLE;
+
+CREATE FUNCTION set_issue_visibility() RETURNS trigger AS $$
+BEGIN
+    NEW.is_visible := issue_is_visible(NEW.id, NEW.archived_at);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER issues_visibility
+BEFORE INSERT OR UPDATE OF archived_at, is_visible ON issues
+FOR EACH ROW EXECUTE FUNCTION set_issue_visibility();
+
+CREATE FUNCTION sync_inbox_issue_visibility() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE issues SET is_visible = issue_is_visible(id, archived_at)
+        WHERE id = OLD.issue_id
+        AND is_visible IS DISTINCT FROM issue_is_visible(id, archived_at);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE issues SET is_visible = issue_is_visible(id, archived_at)
+        WHERE id = NEW.issue_id
+        AND is_visible IS DISTINCT FROM issue_is_visible(id, archived_at);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER inbox_issues_visibility
+AFTER INSERT OR UPDATE OF status, issue_id OR DELETE ON inbox_issues
+FOR EACH ROW EXECUTE FUNCTION sync_inbox_issue_visibility();
+
+UPDATE issues SET is_visible = issue_is_visible(id, archived_at)
+WHERE is_visible IS DISTINCT FROM issue_is_visible(id, archived_at);
+"""
+
+DROP_VISIBILITY_SQL = """
+DROP TRIGGER IF EXISTS inbox_issues_visibility ON inbox_issues;
+DROP TRIGGER IF EXISTS issues_visibility ON issues;
+DROP FUNCTION IF EXISTS sync_inbox_issue_visibility();
+DROP FUNCTION IF EXISTS set_issue_visibility();
+DROP FUNCTION IF EXISTS issue_is_visible(uuid, date);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0047_issue_change_sequence_issuetombstone'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='is_visible',
+            field=models.BooleanField(default=True, editable=False),
+        ),
+        migrations.RunSQL(VISIBILITY_SQL, DROP_VISIBILITY_SQL),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['project', '-created_at'], name='issue_visible_project_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(condition=models.Q(('is_visible', True)), fields=['workspace', '-created_at'], name='issue_visible_workspace_idx'),
+        ),
+    ]
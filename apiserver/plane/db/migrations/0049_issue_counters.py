@@ -0,0 +1,85 @@
+# Generated by Django 4.2.3 on 2023-08-10 10:37
+
+from django.db import migrations, models
+
+
+# Visible sub issues are counted on the parent, the visibility is itself
+# maintained by triggers so the count has to follow it in the database
+SUB_ISSUES_COUNT_SQL = """
+CREATE FUNCTION update_sub_issues_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+        AND OLD.parent_id IS NOT DISTINCT FROM NEW.parent_id
+        AND OLD.is_visible = NEW.is_visible THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.parent_id IS NOT NULL AND OLD.is_visible THEN
+        UPDATE issues SET sub_issues_count = sub_issues_count - 1
+        WHERE id = OLD.parent_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.parent_id IS NOT NULL AND NEW.is_visible THEN
+        UPDATE issues SET sub_issues_count = sub_issues_count + 1
+        WHERE id = NEW.parent_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER issues_sub_issues_count
+AFTER INSERT OR UPDATE OR DELETE ON issues
+FOR EACH ROW EXECUTE FUNCTION update_sub_issues_count();
+"""
+
+DROP_SUB_ISSUES_COUNT_SQL = """
+DROP TRIGGER IF EXISTS issues_sub_issues_count ON issues;
+DROP FUNCTION IF EXISTS update_sub_issues_count();
+"""
+
+BACKFILL_COUNTERS_SQL = """
+UPDATE issues SET sub_issues_count = counts.count
+FROM (
+    SELECT parent_id, COUNT(*) AS count FROM issues
+    WHERE parent_id IS NOT NULL AND is_visible
+    GROUP BY parent_id
+) AS counts
+WHERE issues.id = counts.parent_id;
+
+UPDATE issues SET link_count = counts.count
+FROM (
+    SELECT issue_id, COUNT(*) AS count FROM issue_links GROUP BY issue_id
+) AS counts
+WHERE issues.id = counts.issue_id;
+
+UPDATE issues SET attachment_count = counts.count
+FROM (
+    SELECT issue_id, COUNT(*) AS count FROM issue_attachments GROUP BY issue_id
+) AS counts
+WHERE issues.id = counts.issue_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0048_issue_is_visible'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='issue',
+            name='attachment_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='link_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='sub_issues_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(SUB_ISSUES_COUNT_SQL, DROP_SUB_ISSUES_COUNT_SQL),
+        migrations.RunSQL(BACKFILL_COUNTERS_SQL, migrations.RunSQL.noop),
+    ]
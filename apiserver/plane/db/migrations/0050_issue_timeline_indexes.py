@@ -0,0 +1,24 @@
+# Generated by Django 4.2.3 on 2023-08-11 09:18
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking the tables for writes
+    atomic = False
+
+    dependencies = [
+        ('db', '0049_issue_counters'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='issueactivity',
+            index=models.Index(fields=['issue', 'created_at', 'id'], name='issue_activity_timeline_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='issuecomment',
+            index=models.Index(fields=['issue', 'created_at', 'id'], name='issue_comment_timeline_idx'),
+        ),
+    ]
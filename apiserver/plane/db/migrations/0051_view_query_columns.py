@@ -0,0 +1,41 @@
+# Generated by Django 4.2.3 on 2023-08-14 11:05
+
+from django.db import migrations, models
+
+
+def compile_saved_queries(apps, schema_editor):
+    # Saved queries hold the filters of issue_filters already, they only
+    # get their lists sorted and the columns they read
+    for model_name in ["IssueView", "AnalyticView"]:
+        model = apps.get_model("db", model_name)
+        views = list(model.objects.only("id", "query"))
+        for view in views:
+            query = {}
+            for lookup, value in sorted((view.query or {}).items()):
+                if isinstance(value, list):
+                    value = sorted({str(item) for item in value})
+                query[lookup] = value
+            view.query = query
+            view.query_columns = sorted({lookup.split("__")[0] for lookup in query})
+        model.objects.bulk_update(views, ["query", "query_columns"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('db', '0050_issue_timeline_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analyticview',
+            name='query_columns',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='issueview',
+            name='query_columns',
+            field=models.JSONField(default=list),
+        ),
+        migrations.RunPython(compile_saved_queries, migrations.RunPython.noop),
+    ]
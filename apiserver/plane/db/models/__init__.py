@@ -32,8 +32,10 @@ from .issue import (
     IssueBlocker,
     IssueLink,
     IssueSequence,
+    IssueSequenceCounter,
     IssueAttachment,
     IssueSubscriber,
+    IssueTombstone,
 )
 
 from .asset import FileAsset
@@ -68,6 +70,14 @@ from .estimate import Estimate, EstimatePoint
 
 from .inbox import Inbox, InboxIssue
 
-from .analytic import AnalyticView
+from .analytic import AnalyticView, IssueRollup
 
-from .notification import Notification
\ No newline at end of file
+from .notification import Notification
+from .progress import (
+    CycleProgress,
+    ModuleProgress,
+    CycleBurndown,
+    ModuleBurndown,
+)
+
+from .webhook import WebhookDelivery
@@ -1,8 +1,28 @@
+# Python imports
+from uuid import uuid4
+
 # Django models
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.conf import settings
+from django.core.cache import cache
 
 from .base import BaseModel
+from . import ProjectBaseModel
+from .issue import Issue, IssueAssignee, IssueLabel
+
+# Seconds to wait for more changes before the rollups of a project are rebuilt
+ROLLUP_DELAY = 60
+
+# Extra dimension of every facet of the rollups
+ROLLUP_FACETS = {
+    "issue": {},
+    "label": {"label_id": "labels__id"},
+    "assignee": {"assignee_id": "assignees__id"},
+}
 
 
 class AnalyticView(BaseModel):
@@ -13,6 +33,8 @@ class AnalyticView(BaseModel):
     description = models.TextField(blank=True)
     query = models.JSONField()
     query_dict = models.JSONField(default=dict)
+    # Columns the compiled query filters on
+    query_columns = models.JSONField(default=list)
 
     class Meta:
         verbose_name = "Analytic"
@@ -23,3 +45,111 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+def get_rollup_rows(issues, facet):
+    """Issue counts and estimates of the issues grouped by the facet dimensions"""
+    return (
+        issues.order_by()
+        .values(
+            "project_id",
+            "workspace_id",
+            "priority",
+            month=TruncMonth("created_at", output_field=models.DateField()),
+            state_group=F("state__group"),
+            **{field: F(lookup) for field, lookup in ROLLUP_FACETS[facet].items()},
+        )
+        .annotate(issue_count=Count("*"), estimate_sum=Sum("estimate_point"))
+    )
+
+
+class IssueRollup(ProjectBaseModel):
+    """
+    Pre-aggregated issues by project, month, state group and priority.
+    The label and assignee facets add one row per label or assignee,
+    like the joins of the live analytics queries.
+    """
+
+    facet = models.CharField(
+        max_length=20,
+        choices=(
+            ("issue", "Issue"),
+            ("label", "Label"),
+            ("assignee", "Assignee"),
+        ),
+    )
+    month = models.DateField()
+    state_group = models.CharField(max_length=20, null=True)
+    priority = models.CharField(max_length=30, null=True)
+    label = models.ForeignKey(
+        "db.Label", on_delete=models.CASCADE, related_name="rollups", null=True
+    )
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="issue_rollups",
+        null=True,
+    )
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate_sum = models.PositiveIntegerField(null=True)
+
+    class Meta:
+        verbose_name = "Issue Rollup"
+        verbose_name_plural = "Issue Rollups"
+        db_table = "issue_rollups"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=["workspace", "facet"], name="issue_rollup_facet_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} {self.facet} {self.month}"
+
+    @classmethod
+    def rebuild(cls, project_ids):
+        """Recompute all the rows of the given projects"""
+        issues = Issue.issue_objects.filter(project_id__in=project_ids)
+        with transaction.atomic():
+            cls.objects.filter(project_id__in=project_ids).delete()
+            cls.objects.bulk_create(
+                [
+                    cls(facet=facet, **row)
+                    for facet in ROLLUP_FACETS
+                    for row in get_rollup_rows(issues, facet)
+                ],
+                batch_size=1000,
+            )
+
+
+def get_analytics_version(workspace_id):
+    return cache.get_or_set(f"analytics_version:{workspace_id}", uuid4().hex, None)
+
+
+def invalidate_analytics(workspace_id, project_ids=()):
+    """
+    Drop the cached analytics of the workspace once the transaction is
+    committed and rebuild the rollups of the projects shortly after
+    """
+
+    def invalidate():
+        from plane.bgtasks.analytic_rollup_task import rebuild_issue_rollups
+
+        cache.set(f"analytics_version:{workspace_id}", uuid4().hex, None)
+        for project_id in set(project_ids):
+            # Changes in the same window share one rebuild
+            if cache.add(f"analytics_rollup_pending:{project_id}", True, ROLLUP_DELAY * 2):
+                rebuild_issue_rollups.apply_async(
+                    args=[str(project_id), str(workspace_id)], countdown=ROLLUP_DELAY
+                )
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=Issue)
+@receiver(post_delete, sender=Issue)
+@receiver(post_save, sender=IssueLabel)
+@receiver(post_delete, sender=IssueLabel)
+@receiver(post_save, sender=IssueAssignee)
+@receiver(post_delete, sender=IssueAssignee)
+def update_issue_analytics(sender, instance, **kwargs):
+    invalidate_analytics(instance.workspace_id, [instance.project_id])
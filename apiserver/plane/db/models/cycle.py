@@ -4,6 +4,7 @@ from django.conf import settings
 
 # Module imports
 from . import ProjectBaseModel
+from .search import search_indexes
 
 
 class Cycle(ProjectBaseModel):
@@ -18,10 +19,13 @@ class Cycle(ProjectBaseModel):
     )
     view_props = models.JSONField(default=dict)
 
+    search_content_field = None
+
     class Meta:
         verbose_name = "Cycle"
         verbose_name_plural = "Cycles"
         db_table = "cycles"
+        indexes = search_indexes("cycle")
         ordering = ("-created_at",)
 
     def __str__(self):
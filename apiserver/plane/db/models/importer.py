@@ -34,6 +34,7 @@ class Importer(ProjectBaseModel):
         "db.APIToken", on_delete=models.CASCADE, related_name="importer"
     )
     imported_data = models.JSONField(null=True)
+    imported_issues = models.PositiveIntegerField(default=0)
 
     class Meta:
         verbose_name = "Importer"
@@ -1,35 +1,37 @@
 # Python import
+import math
 from uuid import uuid4
 
 # Django imports
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.db import connection, models, transaction
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 
 # Module imports
-from . import ProjectBaseModel
-from plane.utils.html_processor import strip_tags
+from . import BaseModel, ProjectBaseModel
+from .search import search_indexes
+from plane.utils.html_processor import queue_text_extraction, update_text
+
+# Gap between the sort orders of consecutive new issues
+SORT_ORDER_STEP = 10000
+# Cached largest sort order of a state, reseeded from the issues afterwards
+SORT_ORDER_TIMEOUT = 60 * 60
+# Denormalized counts of the issue, maintained outside of Issue.save
+ISSUE_COUNTER_FIELDS = ("sub_issues_count", "link_count", "attachment_count")
 
 
 # TODO: Handle identifiers for Bulk Inserts - nk
 class IssueManager(models.Manager):
     def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .filter(
-                models.Q(issue_inbox__status=1)
-                | models.Q(issue_inbox__status=-1)
-                | models.Q(issue_inbox__status=2)
-                | models.Q(issue_inbox__isnull=True)
-            )
-            .exclude(archived_at__isnull=False)
-        )
+        # Issues outside of the inbox or accepted, rejected or marked as
+        # duplicate in it, and not archived
+        return super().get_queryset().filter(is_visible=True)
 
 
 class Issue(ProjectBaseModel):
@@ -83,14 +85,46 @@ class Issue(ProjectBaseModel):
     sort_order = models.FloatField(default=65535)
     completed_at = models.DateTimeField(null=True)
     archived_at = models.DateField(null=True)
+    # Id of the transaction which wrote the row last, set by a database trigger
+    change_sequence = models.BigIntegerField(default=0, editable=False)
+    # Whether the issue is listed, kept in sync with the inbox status and the
+    # archive date by database triggers
+    is_visible = models.BooleanField(default=True, editable=False)
+    # Counters of the visible sub issues, the links and the attachments,
+    # repaired by the reconcile_issue_counters command if they drift
+    sub_issues_count = models.IntegerField(default=0, editable=False)
+    link_count = models.IntegerField(default=0, editable=False)
+    attachment_count = models.IntegerField(default=0, editable=False)
 
     objects = models.Manager()
     issue_objects = IssueManager()
 
+    search_content_field = "description_stripped"
+
     class Meta:
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
         db_table = "issues"
+        indexes = search_indexes("issue", "description_stripped") + [
+            models.Index(
+                fields=["project", "change_sequence", "id"],
+                name="issue_project_change_idx",
+            ),
+            models.Index(
+                fields=["workspace", "change_sequence", "id"],
+                name="issue_workspace_change_idx",
+            ),
+            models.Index(
+                fields=["project", "-created_at"],
+                condition=models.Q(is_visible=True),
+                name="issue_visible_project_idx",
+            ),
+            models.Index(
+                fields=["workspace", "-created_at"],
+                condition=models.Q(is_visible=True),
+                name="issue_visible_workspace_idx",
+            ),
+        ]
         ordering = ("-created_at",)
 
     def save(self, *args, **kwargs):
@@ -138,31 +172,30 @@ class Issue(ProjectBaseModel):
             except ImportError:
                 pass
         if self._state.adding:
-            # Get the maximum display_id value from the database
-            last_id = IssueSequence.objects.filter(project=self.project).aggregate(
-                largest=models.Max("sequence")
-            )["largest"]
-            # aggregate can return None! Check it first.
-            # If it isn't none, just use the last ID specified (which should be the greatest) and add one to it
-            if last_id is not None:
-                self.sequence_id = last_id + 1
-
-            largest_sort_order = Issue.objects.filter(
-                project=self.project, state=self.state
-            ).aggregate(largest=models.Max("sort_order"))["largest"]
-            if largest_sort_order is not None:
-                self.sort_order = largest_sort_order + 10000
+            self.sequence_id = allocate_sequences(self.project_id)[0]
+            self.sort_order = allocate_sort_orders(self.state_id)[0]
 
             # If adding it to started state
             if self.state.group == "started":
                 self.start_date = timezone.now().date()
         # Strip the html tags using html parser
-        self.description_stripped = (
-            None
-            if (self.description_html == "" or self.description_html is None)
-            else strip_tags(self.description_html)
-        )
+        update_text(self, "description_html", "description_stripped")
+        # The counters are only written with F expressions, never write back
+        # the value loaded with the instance
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.attname not in ISSUE_COUNTER_FIELDS
+            ]
+        adding = self._state.adding
         super(Issue, self).save(*args, **kwargs)
+        queue_text_extraction(self)
+        if not adding:
+            release_sort_orders([(self.state_id, self.sort_order)])
 
     def __str__(self):
         """Return name of the issue"""
@@ -290,6 +323,12 @@ class IssueActivity(ProjectBaseModel):
         verbose_name = "Issue Activity"
         verbose_name_plural = "Issue Activities"
         db_table = "issue_activities"
+        indexes = [
+            models.Index(
+                fields=["issue", "created_at", "id"],
+                name="issue_activity_timeline_idx",
+            ),
+        ]
         ordering = ("-created_at",)
 
     def __str__(self):
@@ -312,15 +351,20 @@ class IssueComment(ProjectBaseModel):
     )
 
     def save(self, *args, **kwargs):
-        self.comment_stripped = (
-            strip_tags(self.comment_html) if self.comment_html != "" else ""
-        )
-        return super(IssueComment, self).save(*args, **kwargs)
+        update_text(self, "comment_html", "comment_stripped", empty="")
+        super(IssueComment, self).save(*args, **kwargs)
+        queue_text_extraction(self)
 
     class Meta:
         verbose_name = "Issue Comment"
         verbose_name_plural = "Issue Comments"
         db_table = "issue_comments"
+        indexes = [
+            models.Index(
+                fields=["issue", "created_at", "id"],
+                name="issue_comment_timeline_idx",
+            ),
+        ]
         ordering = ("-created_at",)
 
     def __str__(self):
@@ -403,6 +447,90 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounter(BaseModel):
+    project = models.OneToOneField(
+        "db.Project", on_delete=models.CASCADE, related_name="issue_sequence_counter"
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.project_id} {self.last_sequence}"
+
+
+def allocate_sequences(project_id, count=1):
+    """
+    Reserve a block of sequence ids of the project, the counter row is only
+    locked until the end of the surrounding transaction
+    """
+    counters = IssueSequenceCounter.objects.filter(project_id=project_id)
+    with transaction.atomic():
+        if not counters.update(last_sequence=models.F("last_sequence") + count):
+            # Seed the counter of projects numbered before it existed
+            largest = IssueSequence.objects.filter(project_id=project_id).aggregate(
+                largest=models.Max("sequence")
+            )["largest"]
+            IssueSequenceCounter.objects.bulk_create(
+                [
+                    IssueSequenceCounter(
+                        project_id=project_id, last_sequence=largest or 0
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            counters.update(last_sequence=models.F("last_sequence") + count)
+        last_sequence = counters.values_list("last_sequence", flat=True).get()
+    return range(last_sequence - count + 1, last_sequence + 1)
+
+
+def allocate_sort_orders(state_id, count=1):
+    """Sort orders placing a block of new issues at the end of the state"""
+    key = f"issue_sort_order:{state_id}"
+    try:
+        largest = cache.incr(key, SORT_ORDER_STEP * count)
+    except ValueError:
+        largest = Issue.objects.filter(state_id=state_id).aggregate(
+            largest=models.Max("sort_order")
+        )["largest"]
+        cache.add(
+            key,
+            65535 - SORT_ORDER_STEP if largest is None else math.ceil(largest),
+            SORT_ORDER_TIMEOUT,
+        )
+        largest = cache.incr(key, SORT_ORDER_STEP * count)
+    return range(
+        largest - SORT_ORDER_STEP * (count - 1), largest + 1, SORT_ORDER_STEP
+    )
+
+
+def release_sort_orders(issues):
+    """
+    Drop the cached largest sort order of the states issues were moved or
+    reordered past it in, from (state id, sort order) pairs. The next
+    allocation reseeds it from the issues once the change is committed.
+    """
+    largest = {}
+    for state_id, sort_order in issues:
+        if sort_order is not None:
+            key = f"issue_sort_order:{state_id}"
+            largest[key] = max(sort_order, largest.get(key, sort_order))
+    if not largest:
+        return
+
+    stale = [
+        key
+        for key, cached in cache.get_many(list(largest)).items()
+        if largest[key] > cached
+    ]
+    if stale:
+        transaction.on_commit(lambda: cache.delete_many(stale))
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
@@ -424,6 +552,53 @@ class IssueSubscriber(ProjectBaseModel):
         return f"{self.issue.name} {self.subscriber.email}"
 
 
+class IssueTombstone(BaseModel):
+    issue_id = models.UUIDField()
+    # Tombstones outlive their project, no constraint blocks the cascade
+    project = models.ForeignKey(
+        "db.Project",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="issue_tombstones",
+    )
+    workspace = models.ForeignKey(
+        "db.Workspace",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="issue_tombstones",
+    )
+    change_sequence = models.BigIntegerField(default=0, editable=False)
+
+    class Meta:
+        verbose_name = "Issue Tombstone"
+        verbose_name_plural = "Issue Tombstones"
+        db_table = "issue_tombstones"
+        indexes = [
+            models.Index(
+                fields=["project", "change_sequence"],
+                name="tombstone_project_change_idx",
+            ),
+            models.Index(
+                fields=["workspace", "change_sequence"],
+                name="tombstone_workspace_change_idx",
+            ),
+        ]
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.issue_id} {self.change_sequence}"
+
+
+def change_horizon():
+    """
+    Oldest transaction still running, every change sequence below it is
+    committed or rolled back and no row can appear below it anymore
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT txid_snapshot_xmin(txid_current_snapshot())")
+        return cursor.fetchone()[0]
+
+
 # TODO: Find a better method to save the model
 @receiver(post_save, sender=Issue)
 def create_issue_sequence(sender, instance, created, **kwargs):
@@ -431,3 +606,38 @@ def create_issue_sequence(sender, instance, created, **kwargs):
         IssueSequence.objects.create(
             issue=instance, sequence=instance.sequence_id, project=instance.project
         )
+
+
+@receiver(post_delete, sender=Issue)
+def create_issue_tombstone(sender, instance, **kwargs):
+    IssueTombstone.objects.create(
+        issue_id=instance.id,
+        project_id=instance.project_id,
+        workspace_id=instance.workspace_id,
+    )
+
+
+def update_issue_counter(issue_id, field, delta):
+    Issue.objects.filter(pk=issue_id).update(**{field: models.F(field) + delta})
+
+
+@receiver(post_save, sender=IssueLink)
+def increment_issue_link_count(sender, instance, created, **kwargs):
+    if created:
+        update_issue_counter(instance.issue_id, "link_count", 1)
+
+
+@receiver(post_delete, sender=IssueLink)
+def decrement_issue_link_count(sender, instance, **kwargs):
+    update_issue_counter(instance.issue_id, "link_count", -1)
+
+
+@receiver(post_save, sender=IssueAttachment)
+def increment_issue_attachment_count(sender, instance, created, **kwargs):
+    if created:
+        update_issue_counter(instance.issue_id, "attachment_count", 1)
+
+
+@receiver(post_delete, sender=IssueAttachment)
+def decrement_issue_attachment_count(sender, instance, **kwargs):
+    update_issue_counter(instance.issue_id, "attachment_count", -1)
@@ -4,6 +4,7 @@ from django.conf import settings
 
 # Module imports
 from . import ProjectBaseModel
+from .search import search_indexes
 
 
 class Module(ProjectBaseModel):
@@ -41,11 +42,14 @@ class Module(ProjectBaseModel):
     )
     view_props = models.JSONField(default=dict)
 
+    search_content_field = None
+
     class Meta:
         unique_together = ["name", "project"]
         verbose_name = "Module"
         verbose_name_plural = "Modules"
         db_table = "modules"
+        indexes = search_indexes("module")
         ordering = ("-created_at",)
 
     def __str__(self):
@@ -4,7 +4,8 @@ from django.conf import settings
 
 # Module imports
 from . import ProjectBaseModel
-from plane.utils.html_processor import strip_tags
+from .search import search_indexes
+from plane.utils.html_processor import queue_text_extraction, update_text
 
 
 class Page(ProjectBaseModel):
@@ -23,12 +24,20 @@ class Page(ProjectBaseModel):
         "db.Label", blank=True, related_name="pages", through="db.PageLabel"
     )
 
+    search_content_field = "description_stripped"
+
     class Meta:
         verbose_name = "Page"
         verbose_name_plural = "Pages"
         db_table = "pages"
+        indexes = search_indexes("page", "description_stripped")
         ordering = ("-created_at",)
 
+    def save(self, *args, **kwargs):
+        update_text(self, "description_html", "description_stripped")
+        super(Page, self).save(*args, **kwargs)
+        queue_text_extraction(self)
+
     def __str__(self):
         """Return owner email and page name"""
         return f"{self.owned_by.email} <{self.name}>"
@@ -56,11 +65,7 @@ class PageBlock(ProjectBaseModel):
                 self.sort_order = largest_sort_order + 10000
 
         # Strip the html tags using html parser
-        self.description_stripped = (
-            None
-            if (self.description_html == "" or self.description_html is None)
-            else strip_tags(self.description_html)
-        )
+        update_text(self, "description_html", "description_stripped")
 
         if self.completed_at and self.issue:
             try:
@@ -74,6 +79,7 @@ class PageBlock(ProjectBaseModel):
             except ImportError:
                 pass
         super(PageBlock, self).save(*args, **kwargs)
+        queue_text_extraction(self)
 
     class Meta:
         verbose_name = "Page Block"
@@ -0,0 +1,443 @@
+# Python imports
+from collections import defaultdict
+from datetime import timedelta
+
+# Django imports
+from django.db import models, transaction
+from django.db.models import Count, F, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+# Module imports
+from . import ProjectBaseModel
+from .cycle import Cycle, CycleIssue
+from .module import Module, ModuleIssue
+from .issue import Issue, IssueActivity
+from .state import State
+
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+PROGRESS_FIELDS = [
+    "total_issues",
+    "backlog_issues",
+    "unstarted_issues",
+    "started_issues",
+    "completed_issues",
+    "cancelled_issues",
+    "total_estimates",
+    "completed_estimates",
+    "started_estimates",
+]
+
+
+def get_progress_aggregates(issue_relation):
+    """Aggregates of a cycle or module over the given issue relation"""
+    issue = f"{issue_relation}__issue"
+    # Archived issues are not part of the progress
+    live = Q(**{f"{issue}__archived_at__isnull": True})
+    aggregates = {
+        "total_issues": Count(issue_relation, filter=live),
+        "total_estimates": Coalesce(
+            Sum(f"{issue}__estimate_point", filter=live), Value(0)
+        ),
+    }
+    for group in STATE_GROUPS:
+        aggregates[f"{group}_issues"] = Count(
+            issue_relation,
+            filter=live & Q(**{f"{issue}__state__group": group}),
+        )
+    for group in ["completed", "started"]:
+        aggregates[f"{group}_estimates"] = Coalesce(
+            Sum(
+                f"{issue}__estimate_point",
+                filter=live & Q(**{f"{issue}__state__group": group}),
+            ),
+            Value(0),
+        )
+    return aggregates
+
+
+class BurndownBaseModel(ProjectBaseModel):
+    """
+    Daily snapshot of the completed and pending work of a cycle or module
+    """
+
+    date = models.DateField()
+    total_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    pending_issues = models.PositiveIntegerField(default=0)
+    total_estimates = models.PositiveIntegerField(default=0)
+    completed_estimates = models.PositiveIntegerField(default=0)
+    pending_estimates = models.PositiveIntegerField(default=0)
+
+    # Name of the related model, its end date and the join to its issues
+    entity_field = None
+    end_date_field = None
+    issue_relation = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_entity_model(cls):
+        return cls._meta.get_field(cls.entity_field).related_model
+
+    @classmethod
+    def upsert(cls, snapshots):
+        cls.objects.bulk_create(
+            snapshots,
+            batch_size=100,
+            update_conflicts=True,
+            unique_fields=[cls.entity_field, "date"],
+            update_fields=[
+                "total_issues",
+                "completed_issues",
+                "pending_issues",
+                "total_estimates",
+                "completed_estimates",
+                "pending_estimates",
+                "updated_at",
+            ],
+        )
+
+    @classmethod
+    def capture(cls, entity_ids, date=None):
+        """Snapshot the current progress of the running cycles or modules"""
+        date = date or timezone.localdate()
+        rows = (
+            cls.get_entity_model()
+            .objects.filter(
+                pk__in=entity_ids,
+                start_date__lte=date,
+                **{f"{cls.end_date_field}__gte": date},
+            )
+            .values(
+                "id",
+                "project_id",
+                "workspace_id",
+                total_issues=Coalesce(F("progress__total_issues"), Value(0)),
+                completed_issues=Coalesce(F("progress__completed_issues"), Value(0)),
+                total_estimates=Coalesce(F("progress__total_estimates"), Value(0)),
+                completed_estimates=Coalesce(
+                    F("progress__completed_estimates"), Value(0)
+                ),
+            )
+        )
+
+        cls.upsert(
+            [
+                cls(
+                    project_id=row["project_id"],
+                    workspace_id=row["workspace_id"],
+                    date=date,
+                    total_issues=row["total_issues"],
+                    completed_issues=row["completed_issues"],
+                    pending_issues=row["total_issues"] - row["completed_issues"],
+                    total_estimates=row["total_estimates"],
+                    completed_estimates=row["completed_estimates"],
+                    pending_estimates=row["total_estimates"]
+                    - row["completed_estimates"],
+                    **{f"{cls.entity_field}_id": row["id"]},
+                )
+                for row in rows
+            ]
+        )
+
+    @classmethod
+    def backfill(cls, entity, dates):
+        """
+        Rebuild past days from the history of the issues, when they were
+        added to the cycle or module, their state changes and when they
+        were archived. Estimates are not tracked, the current ones are used.
+        """
+        issues = list(
+            Issue.objects.filter(
+                **{f"{cls.issue_relation}__{cls.entity_field}_id": entity.id}
+            ).values_list(
+                "id",
+                f"{cls.issue_relation}__created_at",
+                "archived_at",
+                "state__group",
+                "estimate_point",
+            )
+        )
+
+        state_changes = defaultdict(list)
+        state_ids = set()
+        for issue_id, created_at, old_state_id, new_state_id in (
+            IssueActivity.objects.filter(
+                issue_id__in=[issue[0] for issue in issues], field="state"
+            )
+            .order_by("created_at")
+            .values_list("issue_id", "created_at", "old_identifier", "new_identifier")
+        ):
+            state_changes[issue_id].append(
+                (timezone.localdate(created_at), new_state_id)
+            )
+            # The state before the first change
+            if len(state_changes[issue_id]) == 1:
+                state_changes[issue_id].insert(0, (None, old_state_id))
+            state_ids.update([old_state_id, new_state_id])
+        groups = dict(
+            State.objects.filter(pk__in=state_ids - {None}).values_list("id", "group")
+        )
+
+        days = {
+            date: {
+                "total_issues": 0,
+                "completed_issues": 0,
+                "total_estimates": 0,
+                "completed_estimates": 0,
+            }
+            for date in dates
+        }
+        for issue_id, added_at, archived_on, group, estimate in issues:
+            added_on = timezone.localdate(added_at)
+            changes = state_changes.get(issue_id)
+            for date, day in days.items():
+                if date < added_on or (archived_on and archived_on <= date):
+                    continue
+                # Issues without state changes kept their current state
+                day_group = group
+                if changes:
+                    day_group = groups.get(
+                        [
+                            state_id
+                            for changed_on, state_id in changes
+                            if changed_on is None or changed_on <= date
+                        ][-1]
+                    )
+                day["total_issues"] += 1
+                day["total_estimates"] += estimate or 0
+                if day_group == "completed":
+                    day["completed_issues"] += 1
+                    day["completed_estimates"] += estimate or 0
+
+        snapshots = [
+            cls(
+                project_id=entity.project_id,
+                workspace_id=entity.workspace_id,
+                date=date,
+                pending_issues=day["total_issues"] - day["completed_issues"],
+                pending_estimates=day["total_estimates"] - day["completed_estimates"],
+                **day,
+                **{f"{cls.entity_field}_id": entity.id},
+            )
+            for date, day in days.items()
+        ]
+        # Days captured in the meantime are kept
+        cls.objects.bulk_create(snapshots, batch_size=100, ignore_conflicts=True)
+        return snapshots
+
+    @classmethod
+    def backfill_missing(cls, entity_ids, until=None):
+        """Rebuild the days of the cycles or modules which have no snapshot"""
+        until = until or timezone.localdate()
+        entities = cls.get_entity_model().objects.filter(
+            pk__in=entity_ids,
+            start_date__isnull=False,
+            **{f"{cls.end_date_field}__isnull": False},
+        )
+        captured = defaultdict(set)
+        for entity_id, date in cls.objects.filter(
+            **{f"{cls.entity_field}_id__in": entity_ids}
+        ).values_list(f"{cls.entity_field}_id", "date"):
+            captured[entity_id].add(date)
+
+        backfilled = 0
+        for entity in entities.only(
+            "id", "project_id", "workspace_id", "start_date", cls.end_date_field
+        ):
+            end_date = min(getattr(entity, cls.end_date_field), until)
+            dates = [
+                entity.start_date + timedelta(days=day)
+                for day in range((end_date - entity.start_date).days + 1)
+            ]
+            missing_dates = [date for date in dates if date not in captured[entity.id]]
+            if missing_dates:
+                cls.backfill(entity, missing_dates)
+                backfilled += len(missing_dates)
+        return backfilled
+
+
+class CycleBurndown(BurndownBaseModel):
+    cycle = models.ForeignKey(
+        Cycle, on_delete=models.CASCADE, related_name="burndowns"
+    )
+
+    entity_field = "cycle"
+    end_date_field = "end_date"
+    issue_relation = "issue_cycle"
+
+    class Meta:
+        unique_together = ["cycle", "date"]
+        verbose_name = "Cycle Burndown"
+        verbose_name_plural = "Cycle Burndowns"
+        db_table = "cycle_burndowns"
+        ordering = ("date",)
+
+    def __str__(self):
+        return f"{self.cycle} {self.date}"
+
+
+class ModuleBurndown(BurndownBaseModel):
+    module = models.ForeignKey(
+        Module, on_delete=models.CASCADE, related_name="burndowns"
+    )
+
+    entity_field = "module"
+    end_date_field = "target_date"
+    issue_relation = "issue_module"
+
+    class Meta:
+        unique_together = ["module", "date"]
+        verbose_name = "Module Burndown"
+        verbose_name_plural = "Module Burndowns"
+        db_table = "module_burndowns"
+        ordering = ("date",)
+
+    def __str__(self):
+        return f"{self.module} {self.date}"
+
+
+class ProgressBaseModel(ProjectBaseModel):
+    """
+    Per state group issue counts and estimate sums, rows are refreshed
+    whenever the issues of the cycle or module change
+    """
+
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    total_estimates = models.PositiveIntegerField(default=0)
+    completed_estimates = models.PositiveIntegerField(default=0)
+    started_estimates = models.PositiveIntegerField(default=0)
+
+    # Name of the related model, the join to its issues and its snapshots
+    entity_field = None
+    issue_relation = None
+    burndown_model = None
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_entity_model(cls):
+        return cls._meta.get_field(cls.entity_field).related_model
+
+    @classmethod
+    def refresh(cls, entity_ids):
+        """Recompute the rows of the given cycles or modules"""
+        entity_ids = {entity_id for entity_id in entity_ids if entity_id is not None}
+        if not entity_ids:
+            return
+
+        rows = (
+            cls.get_entity_model()
+            .objects.filter(pk__in=entity_ids)
+            .order_by()
+            .values("id", "project_id", "workspace_id")
+            .annotate(**get_progress_aggregates(cls.issue_relation))
+        )
+
+        cls.objects.bulk_create(
+            [
+                cls(
+                    project_id=row["project_id"],
+                    workspace_id=row["workspace_id"],
+                    **{f"{cls.entity_field}_id": row["id"]},
+                    **{field: row[field] for field in PROGRESS_FIELDS},
+                )
+                for row in rows
+            ],
+            batch_size=100,
+            update_conflicts=True,
+            unique_fields=[cls.entity_field],
+            update_fields=PROGRESS_FIELDS + ["updated_at"],
+        )
+
+        # Keep the snapshot of the day in step with the progress
+        cls.burndown_model.capture(entity_ids)
+
+    @classmethod
+    def refresh_on_commit(cls, entity_ids):
+        # Deferred so cascading deletes of the cycle or module have finished
+        entity_ids = list(entity_ids)
+        transaction.on_commit(lambda: cls.refresh(entity_ids))
+
+
+class CycleProgress(ProgressBaseModel):
+    cycle = models.OneToOneField(
+        Cycle, on_delete=models.CASCADE, related_name="progress"
+    )
+
+    entity_field = "cycle"
+    issue_relation = "issue_cycle"
+    burndown_model = CycleBurndown
+
+    class Meta:
+        verbose_name = "Cycle Progress"
+        verbose_name_plural = "Cycle Progresses"
+        db_table = "cycle_progresses"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.cycle}"
+
+
+class ModuleProgress(ProgressBaseModel):
+    module = models.OneToOneField(
+        Module, on_delete=models.CASCADE, related_name="progress"
+    )
+
+    entity_field = "module"
+    issue_relation = "issue_module"
+    burndown_model = ModuleBurndown
+
+    class Meta:
+        verbose_name = "Module Progress"
+        verbose_name_plural = "Module Progresses"
+        db_table = "module_progresses"
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.module}"
+
+
+def refresh_issue_progress(issue_ids):
+    """Refresh the cycles and modules of the given issues"""
+    cycle_ids = set()
+    module_ids = set()
+    for cycle_id, module_id in Issue.objects.filter(pk__in=issue_ids).values_list(
+        "issue_cycle__cycle_id", "issue_module__module_id"
+    ):
+        cycle_ids.add(cycle_id)
+        module_ids.add(module_id)
+
+    CycleProgress.refresh_on_commit(cycle_ids)
+    ModuleProgress.refresh_on_commit(module_ids)
+
+
+@receiver(post_save, sender=Issue)
+def update_issue_progress(sender, instance, created, **kwargs):
+    # A new issue does not belong to any cycle or module yet
+    if not created:
+        refresh_issue_progress([instance.id])
+
+
+@receiver(post_save, sender=CycleIssue)
+@receiver(post_delete, sender=CycleIssue)
+def update_cycle_progress(sender, instance, **kwargs):
+    CycleProgress.refresh_on_commit([instance.cycle_id])
+
+
+@receiver(post_save, sender=ModuleIssue)
+@receiver(post_delete, sender=ModuleIssue)
+def update_module_progress(sender, instance, **kwargs):
+    ModuleProgress.refresh_on_commit([instance.module_id])
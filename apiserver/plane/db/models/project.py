@@ -2,7 +2,7 @@
 from django.db import models
 from django.conf import settings
 from django.template.defaultfilters import slugify
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 
@@ -11,6 +11,7 @@ from plane.db.mixins import AuditModel
 
 # Module imports
 from . import BaseModel
+from .workspace import invalidate_memberships
 
 ROLE_CHOICES = (
     (20, "Admin"),
@@ -203,3 +204,9 @@ class ProjectFavorite(ProjectBaseModel):
     def __str__(self):
         """Return user of the project"""
         return f"{self.user.email} <{self.project.name}>"
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def update_project_memberships(sender, instance, **kwargs):
+    invalidate_memberships([instance.member_id])
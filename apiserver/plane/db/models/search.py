@@ -0,0 +1,32 @@
+# Django imports
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector
+from django.db.models.functions import Upper
+
+# Dictionary free config, names and identifiers are not stemmed
+SEARCH_CONFIG = "simple"
+
+
+def search_vector(name_field="name", content_field=None):
+    """
+    Weighted document of a row, queries have to use the same expression
+    as the index to be served by it
+    """
+    vector = SearchVector(name_field, config=SEARCH_CONFIG, weight="A")
+    if content_field is not None:
+        vector = vector + SearchVector(content_field, config=SEARCH_CONFIG, weight="B")
+    return vector
+
+
+def search_indexes(prefix, content_field=None):
+    """Full text index of the document and trigram index for substring matches"""
+    return [
+        GinIndex(
+            search_vector("name", content_field),
+            name=f"{prefix}_search_idx",
+        ),
+        GinIndex(
+            OpClass(Upper("name"), name="gin_trgm_ops"),
+            name=f"{prefix}_name_trgm_idx",
+        ),
+    ]
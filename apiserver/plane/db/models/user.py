@@ -5,6 +5,7 @@ import uuid
 # Django imports
 from django.db import models
 from django.db.models.signals import post_save
+from django.core.cache import cache
 from django.dispatch import receiver
 from django.contrib.auth.models import AbstractBaseUser, UserManager, PermissionsMixin
 from django.utils import timezone
@@ -113,6 +114,12 @@ class User(AbstractBaseUser, PermissionsMixin):
         super(User, self).save(*args, **kwargs)
 
 
+@receiver(post_save, sender=User)
+def clear_user_timezone(sender, instance, **kwargs):
+    # Read by the user middleware on every request
+    cache.delete(f"user_timezone:{instance.id}")
+
+
 @receiver(post_save, sender=User)
 def send_welcome_slack(sender, instance, created, **kwargs):
     try:
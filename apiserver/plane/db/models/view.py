@@ -1,9 +1,40 @@
+# Python imports
+from uuid import uuid4
+
 # Django imports
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Max
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.conf import settings
+from django.core.cache import cache
 
 # Module import
 from . import ProjectBaseModel
+from .cycle import CycleIssue
+from .inbox import InboxIssue
+from .issue import (
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    IssueSubscriber,
+    IssueTombstone,
+    change_horizon,
+)
+from .module import ModuleIssue
+from .state import State
+
+# Related rows deciding whether an issue matches the filters on a column,
+# the other columns are stored on the issue itself
+VIEW_RELATIONS = {
+    "state": State,
+    "labels": IssueLabel,
+    "assignees": IssueAssignee,
+    "issue_cycle": CycleIssue,
+    "issue_module": ModuleIssue,
+    "issue_inbox": InboxIssue,
+    "issue_subscribers": IssueSubscriber,
+}
 
 
 class IssueView(ProjectBaseModel):
@@ -14,6 +45,8 @@ class IssueView(ProjectBaseModel):
         default=1, choices=((0, "Private"), (1, "Public"))
     )
     query_data = models.JSONField(default=dict)
+    # Columns the compiled query filters on
+    query_columns = models.JSONField(default=list)
 
     class Meta:
         verbose_name = "Issue View"
@@ -46,3 +79,67 @@ class IssueViewFavorite(ProjectBaseModel):
     def __str__(self):
         """Return user and the view"""
         return f"{self.user.email} <{self.view.name}>"
+
+
+def relation_version_key(project_id, model):
+    return f"view_data_version:{project_id}:{model._meta.model_name}"
+
+
+def get_relation_version(project_id, model):
+    return cache.get_or_set(relation_version_key(project_id, model), uuid4().hex, None)
+
+
+def get_view_data_version(project_id, columns):
+    """
+    Version of the project data the filters on the columns read, None while
+    it cannot be trusted.
+
+    Every write to the issues of the project raises their largest change
+    sequence. A transaction still running below it could commit later
+    without raising it again, so the version only holds once every
+    transaction before it has finished. The related rows are versioned when
+    they are saved or deleted, bulk writes touch the issues afterwards.
+    """
+    sequence = max(
+        Issue.objects.filter(project_id=project_id).aggregate(
+            sequence=Max("change_sequence")
+        )["sequence"]
+        or 0,
+        IssueTombstone.objects.filter(project_id=project_id).aggregate(
+            sequence=Max("change_sequence")
+        )["sequence"]
+        or 0,
+    )
+    if sequence >= change_horizon():
+        return None
+
+    versions = [str(sequence)] + [
+        get_relation_version(project_id, VIEW_RELATIONS[column])
+        for column in sorted(columns)
+        if column in VIEW_RELATIONS
+    ]
+    return ":".join(versions)
+
+
+def invalidate_relation_version(project_id, model):
+    transaction.on_commit(
+        lambda: cache.set(relation_version_key(project_id, model), uuid4().hex, None)
+    )
+
+
+@receiver(post_save, sender=State)
+@receiver(post_delete, sender=State)
+@receiver(post_save, sender=IssueLabel)
+@receiver(post_delete, sender=IssueLabel)
+@receiver(post_save, sender=IssueAssignee)
+@receiver(post_delete, sender=IssueAssignee)
+@receiver(post_save, sender=CycleIssue)
+@receiver(post_delete, sender=CycleIssue)
+@receiver(post_save, sender=ModuleIssue)
+@receiver(post_delete, sender=ModuleIssue)
+@receiver(post_save, sender=InboxIssue)
+@receiver(post_delete, sender=InboxIssue)
+@receiver(post_save, sender=IssueSubscriber)
+@receiver(post_delete, sender=IssueSubscriber)
+def update_view_data_version(sender, instance, **kwargs):
+    invalidate_relation_version(instance.project_id, sender)
@@ -0,0 +1,48 @@
+# Django imports
+from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+# Module imports
+from . import ProjectBaseModel
+
+
+class WebhookDelivery(ProjectBaseModel):
+    """
+    Outbox of the issue activity hooks, rows are written with the
+    activities and delivered by the webhook task
+    """
+
+    url = models.TextField()
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        max_length=50,
+        choices=(
+            ("pending", "Pending"),
+            ("delivered", "Delivered"),
+            ("failed", "Failed"),
+        ),
+        default="pending",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    delivered_at = models.DateTimeField(null=True)
+    response_status = models.PositiveSmallIntegerField(null=True)
+    latency_ms = models.PositiveIntegerField(null=True)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        verbose_name = "Webhook Delivery"
+        verbose_name_plural = "Webhook Deliveries"
+        db_table = "webhook_deliveries"
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="webhook_delivery_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.url} <{self.status}>"
@@ -1,9 +1,16 @@
+# Python imports
+from uuid import uuid4
+
 # Django imports
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
 
 # Module imports
 from . import BaseModel
+from plane.realtime.publisher import publish_membership_changes
 
 
 ROLE_CHOICES = (
@@ -173,3 +180,51 @@ class WorkspaceTheme(BaseModel):
         verbose_name_plural = "Workspace Themes"
         db_table = "workspace_themes"
         ordering = ("-created_at",)
+
+
+def get_membership_version(user_id):
+    return cache.get_or_set(f"membership_version:{user_id}", uuid4().hex, None)
+
+
+def invalidate_memberships(user_ids):
+    """Drop the cached workspace and project roles of the users after commit"""
+    user_ids = [str(user_id) for user_id in set(user_ids)]
+
+    def invalidate():
+        cache.set_many(
+            {f"membership_version:{user_id}": uuid4().hex for user_id in user_ids},
+            None,
+        )
+        # Open event channels of the users check the new roles
+        publish_membership_changes(user_ids)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=WorkspaceMember)
+@receiver(post_delete, sender=WorkspaceMember)
+def update_workspace_memberships(sender, instance, **kwargs):
+    invalidate_memberships([instance.member_id])
+
+
+@receiver(pre_save, sender=Workspace)
+def store_previous_workspace_slug(sender, instance, **kwargs):
+    instance._previous_slug = (
+        None
+        if instance._state.adding
+        else Workspace.objects.filter(pk=instance.pk)
+        .values_list("slug", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Workspace)
+def update_workspace_slug_memberships(sender, instance, created, **kwargs):
+    # The cached roles are keyed by the workspace slug, a renamed workspace
+    # must not leave its old slug to the members
+    if created or instance._previous_slug == instance.slug:
+        return
+    invalidate_memberships(
+        list(instance.workspace_member.values_list("member_id", flat=True))
+        + list(instance.workspace_projectmember.values_list("member_id", flat=True))
+    )
@@ -2,7 +2,7 @@ import jwt
 import pytz
 from django.conf import settings
 from django.utils import timezone
-from plane.db.models import User
+from plane.utils.user_activity import get_user_timezone, record_user_activity
 
 
 class UserMiddleware(object):
@@ -20,11 +20,11 @@ class UserMiddleware(object):
                     access_token, settings.SECRET_KEY, algorithms=["HS256"]
                 )
                 id = decoded['user_id']
-                user = User.objects.get(id=id)
-                user.last_active = timezone.now()
-                user.token_updated_at = None
-                user.save()
-                timezone.activate(pytz.timezone(user.user_timezone))
+                # Last active times are flushed to the users table in bulk
+                record_user_activity(id)
+                user_timezone = get_user_timezone(id)
+                if user_timezone is not None:
+                    timezone.activate(pytz.timezone(user_timezone))
         except Exception as e:
             print(e)
         
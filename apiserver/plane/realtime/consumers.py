@@ -0,0 +1,74 @@
+# Python imports
+import asyncio
+from urllib.parse import parse_qs
+
+# Third party imports
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+# Module imports
+from plane.utils.membership import get_user_memberships
+from plane.realtime.hub import hub, Subscription
+from plane.realtime.tickets import redeem_ticket
+
+
+def is_project_member(user_id, slug, project_id):
+    slug_role = get_user_memberships(user_id)["projects"].get(str(project_id))
+    return slug_role is not None and slug_role[0] == slug
+
+
+def get_project_member(ticket, slug, project_id):
+    """Id of the user of the ticket when the user is a member of the project"""
+    user_id = redeem_ticket(ticket, slug, project_id)
+    if user_id is None or not is_project_member(user_id, slug, project_id):
+        return None
+    return user_id
+
+
+class ProjectEventConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Pushes the issue, comment, cycle and module changes of a project.
+    Browsers cannot set headers on websockets, the connection is opened
+    with a single use ticket from the event ticket endpoint passed as the
+    ticket query parameter. The connection is closed once the user is no
+    longer a member of the project.
+    """
+
+    subscription = None
+
+    async def connect(self):
+        kwargs = self.scope["url_route"]["kwargs"]
+        ticket = parse_qs(self.scope["query_string"].decode()).get("ticket", [None])[0]
+
+        user_id = await database_sync_to_async(get_project_member)(
+            ticket, kwargs["slug"], kwargs["project_id"]
+        )
+        if user_id is None:
+            await self.close()
+            return
+
+        await self.accept()
+        self.subscription = Subscription(
+            kwargs["project_id"], user_id, self.send_json, self.check_membership
+        )
+        self.writer = asyncio.create_task(self.subscription.run())
+        await hub.subscribe(self.subscription)
+
+    async def check_membership(self):
+        kwargs = self.scope["url_route"]["kwargs"]
+        is_member = await database_sync_to_async(is_project_member)(
+            self.subscription.user_id, kwargs["slug"], kwargs["project_id"]
+        )
+        if not is_member:
+            await self.close()
+        return is_member
+
+    async def disconnect(self, code):
+        if self.subscription is None:
+            return
+        await hub.unsubscribe(self.subscription)
+        self.writer.cancel()
+
+    async def receive_json(self, content, **kwargs):
+        # The channel only pushes, clients read the changes from the api
+        pass
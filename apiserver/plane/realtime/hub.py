@@ -0,0 +1,165 @@
+# Python imports
+import asyncio
+import json
+from collections import OrderedDict
+
+# Third party imports
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.settings.redis import async_redis_instance
+from plane.realtime.publisher import MEMBERSHIP_CHANNEL, project_channel
+
+# Distinct changes a connection may hold before it is asked to resync
+MAX_PENDING_EVENTS = 500
+# Changes arriving while a frame is sent or within the interval are merged
+FLUSH_INTERVAL = 0.25
+RECONNECT_DELAY = 1
+
+
+class Subscription:
+    """
+    Changes waiting for a single connection. A change replaces the pending
+    change of the same type and issue, so a slow client receives every
+    issue once however often it changed, and a client falling too far
+    behind gets a single resync instead of the backlog. The membership of
+    the user is checked again before the next frame once it changed.
+    """
+
+    def __init__(self, project_id, user_id, send, check_membership):
+        self.project_id = str(project_id)
+        self.user_id = str(user_id)
+        self.send = send
+        self.check_membership = check_membership
+        self.pending = OrderedDict()
+        self.resync = False
+        self.membership_changed = False
+        self.ready = asyncio.Event()
+
+    def push(self, event):
+        key = (event["type"], event["issue_id"])
+        self.pending.pop(key, None)
+        self.pending[key] = event
+        if len(self.pending) > MAX_PENDING_EVENTS:
+            self.request_resync()
+        self.ready.set()
+
+    def request_resync(self):
+        self.pending.clear()
+        self.resync = True
+        self.ready.set()
+
+    def request_membership_check(self):
+        self.membership_changed = True
+        self.ready.set()
+
+    async def run(self):
+        while True:
+            await self.ready.wait()
+            self.ready.clear()
+            if self.membership_changed:
+                self.membership_changed = False
+                # The connection is closed when the user left the project
+                if not await self.check_membership():
+                    return
+            if self.resync:
+                # The client reloads the board, the pending changes are in it
+                self.resync = False
+                self.pending.clear()
+                await self.send({"type": "resync"})
+            elif self.pending:
+                events = list(self.pending.values())
+                self.pending.clear()
+                await self.send({"type": "events", "events": events})
+            await asyncio.sleep(FLUSH_INTERVAL)
+
+
+class EventHub:
+    """
+    Redis subscriptions of the process, every project channel is subscribed
+    once however many boards of the project are open. The reader only
+    queues the events on the subscriptions and never waits for a client.
+    Membership changes are read from their own channel.
+    """
+
+    def __init__(self):
+        self.subscriptions = {}
+        self.pubsub = None
+        self.reader = None
+        self.lock = asyncio.Lock()
+
+    async def subscribe(self, subscription):
+        channel = project_channel(subscription.project_id)
+        async with self.lock:
+            if self.pubsub is None:
+                self.pubsub = async_redis_instance().pubsub()
+                await self.pubsub.subscribe(MEMBERSHIP_CHANNEL)
+            if channel not in self.subscriptions:
+                self.subscriptions[channel] = set()
+                await self.pubsub.subscribe(channel)
+            self.subscriptions[channel].add(subscription)
+            if self.reader is None or self.reader.done():
+                self.reader = asyncio.create_task(self.read())
+
+    async def unsubscribe(self, subscription):
+        channel = project_channel(subscription.project_id)
+        async with self.lock:
+            subscribers = self.subscriptions.get(channel)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self.subscriptions[channel]
+                await self.pubsub.unsubscribe(channel)
+
+    async def read(self):
+        while self.subscriptions:
+            try:
+                message = await self.pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except Exception as e:
+                capture_exception(e)
+                await self.reconnect()
+                continue
+
+            if message is None:
+                continue
+
+            events = json.loads(message["data"])
+            channel = message["channel"].decode()
+            if channel == MEMBERSHIP_CHANNEL:
+                self.check_memberships(set(events))
+                continue
+            for subscription in list(self.subscriptions.get(channel, ())):
+                for event in events:
+                    subscription.push(event)
+
+    def check_memberships(self, user_ids):
+        for subscribers in self.subscriptions.values():
+            for subscription in subscribers:
+                if subscription.user_id in user_ids:
+                    subscription.request_membership_check()
+
+    async def reconnect(self):
+        await asyncio.sleep(RECONNECT_DELAY)
+        async with self.lock:
+            try:
+                await self.pubsub.close()
+            except Exception:
+                pass
+            self.pubsub = async_redis_instance().pubsub()
+            try:
+                await self.pubsub.subscribe(MEMBERSHIP_CHANNEL, *self.subscriptions)
+            except Exception as e:
+                capture_exception(e)
+                return
+
+        # Events and membership changes published while disconnected are lost
+        for subscribers in self.subscriptions.values():
+            for subscription in subscribers:
+                subscription.request_resync()
+                subscription.request_membership_check()
+
+
+hub = EventHub()
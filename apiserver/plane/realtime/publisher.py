@@ -0,0 +1,42 @@
+# Python imports
+import json
+from collections import defaultdict
+
+# Django imports
+from django.conf import settings
+
+# Module imports
+from plane.settings.redis import redis_instance
+
+
+# Users whose workspace or project memberships changed
+MEMBERSHIP_CHANNEL = "plane:memberships:events"
+
+
+def project_channel(project_id):
+    return f"plane:projects:{project_id}:events"
+
+
+def publish_events(events):
+    """
+    Publish change events to the boards of their project, the events of a
+    project are sent as a single message
+    """
+    if not settings.REDIS_URL or not events:
+        return
+
+    project_events = defaultdict(list)
+    for event in events:
+        project_events[event["project_id"]].append(event)
+
+    pipeline = redis_instance().pipeline(transaction=False)
+    for project_id, events in project_events.items():
+        pipeline.publish(project_channel(project_id), json.dumps(events))
+    pipeline.execute()
+
+
+def publish_membership_changes(user_ids):
+    """Ask the open event channels of the users to check their membership"""
+    if not settings.REDIS_URL or not user_ids:
+        return
+    redis_instance().publish(MEMBERSHIP_CHANNEL, json.dumps(list(user_ids)))
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from plane.realtime.consumers import ProjectEventConsumer
+
+
+websocket_urlpatterns = [
+    path(
+        "ws/workspaces/<str:slug>/projects/<uuid:project_id>/events/",
+        ProjectEventConsumer.as_asgi(),
+    ),
+]
@@ -0,0 +1,38 @@
+# Python imports
+import secrets
+
+# Django imports
+from django.core.cache import cache
+
+# Seconds a ticket can be redeemed after it was issued
+TICKET_TIMEOUT = 30
+
+
+def issue_ticket(user_id, slug, project_id):
+    """
+    Single use ticket opening the event channel of a project. Tickets are
+    passed in the query string of the websocket, which is logged, instead
+    of the access token.
+    """
+    ticket = secrets.token_urlsafe(32)
+    cache.set(
+        f"realtime_ticket:{ticket}",
+        (str(user_id), slug, str(project_id)),
+        TICKET_TIMEOUT,
+    )
+    return ticket
+
+
+def redeem_ticket(ticket, slug, project_id):
+    """Id of the user the ticket was issued to, a ticket is only redeemed once"""
+    if not ticket:
+        return None
+    key = f"realtime_ticket:{ticket}"
+    issued = cache.get(key)
+    # Only the connection deleting the ticket may use it
+    if issued is None or not cache.delete(key):
+        return None
+    user_id, ticket_slug, ticket_project_id = issued
+    if ticket_slug != slug or ticket_project_id != str(project_id):
+        return None
+    return user_id
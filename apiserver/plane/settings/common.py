@@ -214,4 +214,26 @@ SIMPLE_JWT = {
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_ACCEPT_CONTENT = ['application/json']
-CELERY_IMPORTS = ("plane.bgtasks.issue_automation_task",)
+CELERY_IMPORTS = (
+    "plane.bgtasks.issue_automation_task",
+    "plane.bgtasks.burndown_task",
+    "plane.bgtasks.webhook_task",
+    "plane.bgtasks.analytic_rollup_task",
+    "plane.bgtasks.user_activity_task",
+    "plane.bgtasks.html_text_task",
+    "plane.bgtasks.analytic_plot_export",
+)
+
+# Issue activity hooks
+WEBHOOK_TIMEOUT = int(os.environ.get("WEBHOOK_TIMEOUT", 10))
+WEBHOOK_MAX_ATTEMPTS = int(os.environ.get("WEBHOOK_MAX_ATTEMPTS", 8))
+WEBHOOK_ENDPOINT_CONCURRENCY = int(os.environ.get("WEBHOOK_ENDPOINT_CONCURRENCY", 4))
+
+# Seconds between two recorded requests of the same user
+LAST_ACTIVE_GRANULARITY = int(os.environ.get("LAST_ACTIVE_GRANULARITY", 60))
+
+# Rich text of at least this many characters is converted to text by a worker
+HTML_TEXT_DEFER_LENGTH = int(os.environ.get("HTML_TEXT_DEFER_LENGTH", 512 * 1024))
+
+# Seconds the link to an export is valid, the export is deleted afterwards
+EXPORT_URL_EXPIRY = int(os.environ.get("EXPORT_URL_EXPIRY", 60 * 60 * 24))
@@ -1,5 +1,6 @@
 import os
 import redis
+from redis import asyncio as aioredis
 from django.conf import settings
 from urllib.parse import urlparse
 
@@ -23,3 +24,24 @@ def redis_instance():
         )
 
     return ri
+
+
+def async_redis_instance():
+    # connect to redis from asyncio code, used by the realtime event hub
+    if (
+        settings.DOCKERIZED
+        or os.environ.get("DJANGO_SETTINGS_MODULE", "plane.settings.production")
+        == "plane.settings.local"
+    ):
+        ri = aioredis.Redis.from_url(settings.REDIS_URL, db=0)
+    else:
+        url = urlparse(settings.REDIS_URL)
+        ri = aioredis.Redis(
+            host=url.hostname,
+            port=url.port,
+            password=url.password,
+            ssl=True,
+            ssl_cert_reqs=None,
+        )
+
+    return ri
@@ -0,0 +1,76 @@
+# Python imports
+import random
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.utils.html_processor import parse_text, strip_tags
+
+
+class StripTagsParityTest(SimpleTestCase):
+    # Pieces of editor html and of the markup the html parser reads its own way
+    tokens = [
+        "<p>",
+        "</p>",
+        "<a href='x>y'>",
+        '<b class="q">',
+        "</b>",
+        "<br/>",
+        "a",
+        " ",
+        "\n",
+        "<",
+        ">",
+        "'",
+        '"',
+        "=",
+        "</",
+        "</>",
+        "</ p>",
+        "<p",
+        "<a b='",
+        "x<y",
+        "<1",
+        "&",
+        "&amp;",
+        "&lt",
+        "&am",
+        "p;",
+        "&#39;",
+        "<script>",
+        "</script>",
+        "<STYLE>",
+        "</style>",
+        "<!-- c -->",
+        "<!x>",
+        "<?pi>",
+        "<p\x00>",
+        "<img src=x>",
+    ]
+
+    def assertParity(self, html):
+        self.assertEqual(strip_tags(html), parse_text(html), repr(html))
+
+    def test_raw_text_elements(self):
+        self.assertEqual(strip_tags("<script>if(a<b)x()</script>"), "if(a<b)x()")
+        self.assertEqual(strip_tags("<style>p>a{color:red}</style>"), "p>a{color:red}")
+
+    def test_bare_less_than(self):
+        self.assertEqual(strip_tags("<p>a</p><"), "a")
+        self.assertEqual(strip_tags("<p>a < b</p>"), "a < b")
+
+    def test_editor_html(self):
+        html = '<p class="x">Fix &amp; <a href="/a?b=1&amp;c=2">ship</a><br/></p>'
+        self.assertEqual(strip_tags(html), "Fix & ship")
+        self.assertParity(html)
+
+    def test_random_markup(self):
+        generator = random.Random(0)
+        for _ in range(20000):
+            self.assertParity(
+                "".join(
+                    generator.choice(self.tokens)
+                    for _ in range(generator.randint(0, 12))
+                )
+            )
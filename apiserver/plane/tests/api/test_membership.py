@@ -0,0 +1,54 @@
+# Django imports
+from django.test import TestCase, override_settings
+
+# Module imports
+from plane.db.models import User, Workspace, WorkspaceMember
+from plane.utils.membership import get_user_memberships
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class WorkspaceSlugMembershipTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(email="user@plane.so")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.workspace = Workspace.objects.create(
+                name="Plane", slug="plane", owner=self.user
+            )
+            WorkspaceMember.objects.create(
+                workspace=self.workspace, member=self.user, role=20
+            )
+
+    def rename_workspace(self, slug):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.workspace.slug = slug
+            self.workspace.save()
+
+    def test_renamed_workspace_role_follows_the_slug(self):
+        # Cache the roles under the old slug
+        self.assertEqual(get_user_memberships(self.user.id)["workspaces"], {"plane": 20})
+
+        self.rename_workspace("plane-hq")
+
+        self.assertEqual(
+            get_user_memberships(self.user.id)["workspaces"], {"plane-hq": 20}
+        )
+
+    def test_reused_slug_does_not_keep_the_old_members(self):
+        self.assertEqual(get_user_memberships(self.user.id)["workspaces"], {"plane": 20})
+
+        self.rename_workspace("plane-hq")
+        other_user = User.objects.create(email="other@plane.so")
+        with self.captureOnCommitCallbacks(execute=True):
+            other_workspace = Workspace.objects.create(
+                name="Other", slug="plane", owner=other_user
+            )
+            WorkspaceMember.objects.create(
+                workspace=other_workspace, member=other_user, role=20
+            )
+
+        self.assertIsNone(get_user_memberships(self.user.id)["workspaces"].get("plane"))
+        self.assertEqual(
+            get_user_memberships(other_user.id)["workspaces"], {"plane": 20}
+        )
@@ -0,0 +1,187 @@
+# Python imports
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Django imports
+from django.db import connection, transaction
+from django.test import TransactionTestCase, override_settings
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.webhook_task import (
+    CLAIM_TIMEOUT,
+    claim_deliveries,
+    deliver_webhooks,
+)
+from plane.db.models import Project, User, WebhookDelivery, Workspace
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.server.bodies.append(
+            self.rfile.read(int(self.headers["Content-Length"]))
+        )
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = b"" if status < 400 else b"endpoint failed"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(
+    WEBHOOK_TIMEOUT=5, WEBHOOK_MAX_ATTEMPTS=3, WEBHOOK_ENDPOINT_CONCURRENCY=2
+)
+class WebhookDeliveryTest(TransactionTestCase):
+    def setUp(self):
+        # Endpoint answering with the queued statuses, 200 once they are used
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.server.bodies = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hooks/"
+
+        user = User.objects.create(email="user@plane.so")
+        workspace = Workspace.objects.create(name="Plane", slug="plane", owner=user)
+        self.project = Project.objects.create(
+            name="Plane", identifier="PLN", workspace=workspace
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def create_delivery(self, **kwargs):
+        return WebhookDelivery.objects.create(
+            project=self.project,
+            workspace_id=self.project.workspace_id,
+            url=kwargs.pop("url", self.url),
+            payload={"verb": "created"},
+            **kwargs,
+        )
+
+    def make_due(self, delivery):
+        WebhookDelivery.objects.filter(pk=delivery.pk).update(
+            next_attempt_at=timezone.now()
+        )
+
+    def test_delivered(self):
+        delivery = self.create_delivery()
+
+        deliver_webhooks()
+
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.status, "delivered")
+        self.assertEqual(delivery.attempts, 1)
+        self.assertEqual(delivery.response_status, 200)
+        self.assertIsNotNone(delivery.delivered_at)
+        self.assertEqual(len(self.server.bodies), 1)
+
+    def test_retried_with_backoff(self):
+        self.server.statuses = [500, 503]
+        delivery = self.create_delivery()
+
+        started_at = timezone.now()
+        deliver_webhooks()
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.status, "pending")
+        self.assertEqual(delivery.attempts, 1)
+        self.assertEqual(delivery.response_status, 500)
+        self.assertEqual(delivery.last_error, "endpoint failed")
+        self.assertGreaterEqual(
+            delivery.next_attempt_at, started_at + timedelta(seconds=30)
+        )
+        self.assertLess(delivery.next_attempt_at, started_at + timedelta(seconds=60))
+
+        # Not due yet, the endpoint is left alone
+        deliver_webhooks()
+        self.assertEqual(len(self.server.bodies), 1)
+
+        # The wait doubles with every failed attempt
+        self.make_due(delivery)
+        started_at = timezone.now()
+        deliver_webhooks()
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.attempts, 2)
+        self.assertEqual(delivery.response_status, 503)
+        self.assertGreaterEqual(
+            delivery.next_attempt_at, started_at + timedelta(seconds=60)
+        )
+        self.assertLess(
+            delivery.next_attempt_at, started_at + timedelta(seconds=120)
+        )
+
+        # Delivered on the next attempt
+        self.make_due(delivery)
+        deliver_webhooks()
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.status, "delivered")
+        self.assertEqual(delivery.attempts, 3)
+        self.assertEqual(delivery.last_error, "")
+        self.assertEqual(len(self.server.bodies), 3)
+
+    def test_failed_after_the_last_attempt(self):
+        self.server.statuses = [500]
+        delivery = self.create_delivery(attempts=2)
+
+        deliver_webhooks()
+
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.status, "failed")
+        self.assertEqual(delivery.attempts, 3)
+
+    def test_unreachable_endpoint_is_retried(self):
+        # Port of a closed server, the connection is refused
+        closed = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        closed.server_close()
+        delivery = self.create_delivery(
+            url=f"http://127.0.0.1:{closed.server_port}/hooks/"
+        )
+
+        deliver_webhooks()
+
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.status, "pending")
+        self.assertEqual(delivery.attempts, 1)
+        self.assertIsNone(delivery.response_status)
+        self.assertNotEqual(delivery.last_error, "")
+
+    def test_claim_skips_locked_deliveries(self):
+        locked = self.create_delivery()
+        free = self.create_delivery()
+        is_locked = threading.Event()
+        release = threading.Event()
+
+        def lock_delivery():
+            # Another worker holding the row in its own transaction
+            try:
+                with transaction.atomic():
+                    WebhookDelivery.objects.select_for_update().get(pk=locked.pk)
+                    is_locked.set()
+                    release.wait(10)
+            finally:
+                connection.close()
+
+        worker = threading.Thread(target=lock_delivery)
+        worker.start()
+        try:
+            self.assertTrue(is_locked.wait(10))
+            claimed = claim_deliveries(batch_size=10)
+        finally:
+            release.set()
+            worker.join()
+
+        self.assertEqual([delivery.id for delivery in claimed], [free.id])
+
+        # Claimed rows wait for the claim to time out, the other row is due
+        free.refresh_from_db()
+        self.assertGreater(
+            free.next_attempt_at, timezone.now() + CLAIM_TIMEOUT - timedelta(minutes=1)
+        )
+        self.assertEqual(
+            [delivery.id for delivery in claim_deliveries(batch_size=10)], [locked.id]
+        )
@@ -1,54 +1,44 @@
 # Python imports
+import hashlib
+import json
 from itertools import groupby
 from datetime import timedelta
 
 # Django import
-from django.db import models
-from django.db.models.functions import TruncDate
-from django.db.models import Count, F, Sum, Value, Case, When, CharField
+from django.db.models import Count, F, Sum, Value, CharField
 from django.db.models.functions import Coalesce, ExtractMonth, ExtractYear, Concat
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 
 # Module imports
-from plane.db.models import Issue
+from plane.db.models import CycleBurndown, ModuleBurndown, IssueRollup
+from plane.db.models.analytic import get_analytics_version
 
+# Cached results expire even without issue changes
+ANALYTICS_CACHE_TIMEOUT = 60 * 60 * 24
 
-def build_graph_plot(queryset, x_axis, y_axis, segment=None):
-
-    temp_axis = x_axis
 
-    if x_axis in ["created_at", "start_date", "target_date", "completed_at"]:
-        year = ExtractYear(x_axis)
-        month = ExtractMonth(x_axis)
-        dimension = Concat(year, Value("-"), month, output_field=CharField())
-        queryset = queryset.annotate(dimension=dimension)
-        x_axis = "dimension"
-    else:
-        queryset = queryset.annotate(dimension=F(x_axis))
-        x_axis = "dimension"
+def get_dimension(axis):
+    """Value of the axis, dates are grouped by year and month"""
+    if axis in ["created_at", "start_date", "target_date", "completed_at"]:
+        year = ExtractYear(axis)
+        month = ExtractMonth(axis)
+        return Concat(year, Value("-"), month, output_field=CharField())
+    return F(axis)
 
-    if x_axis in ["created_at", "start_date", "target_date", "completed_at"]:
-        queryset = queryset.exclude(x_axis__is_null=True)
 
-    if segment in ["created_at", "start_date", "target_date", "completed_at"]:
-        year = ExtractYear(segment)
-        month = ExtractMonth(segment)
-        dimension = Concat(year, Value("-"), month, output_field=CharField())
-        queryset = queryset.annotate(segmented=dimension)
+def graph_queryset(queryset, x_axis, y_axis, segment=None):
+    """Issue counts or estimates of every dimension and segment, ordered by dimension"""
+    queryset = queryset.annotate(dimension=get_dimension(x_axis))
+    if segment:
+        queryset = queryset.annotate(segmented=get_dimension(segment))
         segment = "segmented"
 
-    queryset = queryset.values(x_axis)
+    queryset = queryset.values("dimension")
 
     # Group queryset by x_axis field
 
     if y_axis == "issue_count":
-        queryset = queryset.annotate(
-            is_null=Case(
-                When(dimension__isnull=True, then=Value("None")),
-                default=Value("not_null"),
-                output_field=models.CharField(max_length=8),
-            ),
-            dimension_ex=Coalesce("dimension", Value("null")),
-        ).values("dimension")
         if segment:
             queryset = queryset.annotate(segment=F(segment)).values(
                 "dimension", "segment"
@@ -59,7 +49,9 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
         queryset = queryset.annotate(count=Count("*")).order_by("dimension")
 
     if y_axis == "estimate":
-        queryset = queryset.annotate(estimate=Sum("estimate_point")).order_by(x_axis)
+        queryset = queryset.annotate(estimate=Sum("estimate_point")).order_by(
+            "dimension"
+        )
         if segment:
             queryset = queryset.annotate(segment=F(segment)).values(
                 "dimension", "segment", "estimate"
@@ -67,13 +59,22 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
         else:
             queryset = queryset.values("dimension", "estimate")
 
-    result_values = list(queryset)
+    return queryset
+
+
+def build_graph_plot(queryset, x_axis, y_axis, segment=None):
+    return group_plot(
+        list(graph_queryset(queryset, x_axis, y_axis, segment)), x_axis
+    )
+
+
+def group_plot(result_values, x_axis):
     grouped_data = {}
     for key, items in groupby(result_values, key=lambda x: x[str("dimension")]):
         grouped_data[str(key)] = list(items)
 
     sorted_data = grouped_data
-    if temp_axis == "priority":
+    if x_axis == "priority":
         order = ["low", "medium", "high", "urgent", "None"]
         sorted_data = {key: grouped_data[key] for key in order if key in grouped_data}
     else:
@@ -81,67 +82,136 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sorted_data
 
 
-def burndown_plot(queryset, slug, project_id, cycle_id=None, module_id=None):
-    # Total Issues in Cycle or Module
-    total_issues = queryset.total_issues
+# Axes served by the rollups and the rollup field holding them
+ROLLUP_AXES = {
+    "state__group": "state_group",
+    "priority": "priority",
+    "labels__name": "label__name",
+    "assignees__email": "assignee__email",
+    "created_at": "month",
+}
+
+# Issue filters served by the rollups and the matching rollup lookup
+ROLLUP_FILTERS = {
+    "project__in": "project_id__in",
+    "state__group__in": "state_group__in",
+    "priority__in": "priority__in",
+    "priority__isnull": "priority__isnull",
+}
+
+
+def get_rollup_queryset(workspace_id, filters, axes):
+    """
+    Rollups answering the filters and axes, None when the live issues
+    have to be queried
+    """
+    axes = [axis for axis in axes if axis]
+    if any(axis not in ROLLUP_AXES for axis in axes) or any(
+        key not in ROLLUP_FILTERS for key in filters
+    ):
+        return None
+
+    if "labels__name" in axes and "assignees__email" in axes:
+        return None
+    elif "labels__name" in axes:
+        facet = "label"
+    elif "assignees__email" in axes:
+        facet = "assignee"
+    else:
+        facet = "issue"
 
+    return IssueRollup.objects.filter(
+        workspace_id=workspace_id,
+        facet=facet,
+        **{ROLLUP_FILTERS[key]: value for key, value in filters.items()},
+    )
 
-    if cycle_id:
-        # Get all dates between the two dates
-        date_range = [
-            queryset.start_date + timedelta(days=x)
-            for x in range((queryset.end_date - queryset.start_date).days + 1)
-        ]
-
-        chart_data = {str(date): 0 for date in date_range}
-
-        completed_issues_distribution = (
-            Issue.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                issue_cycle__cycle_id=cycle_id,
-            )
-            .annotate(date=TruncDate("completed_at"))
-            .values("date")
-            .annotate(total_completed=Count("id"))
-            .values("date", "total_completed")
-            .order_by("date")
+
+def get_rollup_dimension(axis):
+    if axis == "created_at":
+        return Concat(
+            ExtractYear("month"), Value("-"), ExtractMonth("month"), output_field=CharField()
         )
-    
-    if module_id:
-        # Get all dates between the two dates
-        date_range = [
-            queryset.start_date + timedelta(days=x)
-            for x in range((queryset.target_date - queryset.start_date).days + 1)
-        ]
-
-        chart_data = {str(date): 0 for date in date_range}
-
-        completed_issues_distribution = (
-            Issue.objects.filter(
-                workspace__slug=slug,
-                project_id=project_id,
-                issue_module__module_id=module_id,
-            )
-            .annotate(date=TruncDate("completed_at"))
-            .values("date")
-            .annotate(total_completed=Count("id"))
-            .values("date", "total_completed")
-            .order_by("date")
+    return F(ROLLUP_AXES[axis])
+
+
+def build_rollup_plot(workspace_id, filters, x_axis, y_axis, segment=None):
+    """Same result as build_graph_plot, read from the rollups when possible"""
+    queryset = get_rollup_queryset(workspace_id, filters, [x_axis, segment])
+    if queryset is None or y_axis not in ["issue_count", "estimate"]:
+        return None
+
+    queryset = queryset.annotate(dimension=get_rollup_dimension(x_axis))
+    if segment:
+        queryset = queryset.annotate(segment=get_rollup_dimension(segment)).values(
+            "dimension", "segment"
         )
+    else:
+        queryset = queryset.values("dimension")
+
+    if y_axis == "issue_count":
+        queryset = queryset.annotate(count=Sum("issue_count"))
+    else:
+        queryset = queryset.annotate(estimate=Sum("estimate_sum"))
+
+    return group_plot(list(queryset.order_by("dimension")), x_axis)
+
+
+def count_rollup_issues(workspace_id, filters):
+    queryset = get_rollup_queryset(workspace_id, filters, [])
+    if queryset is None:
+        return None
+    return queryset.aggregate(total=Coalesce(Sum("issue_count"), Value(0)))["total"]
 
 
+def get_cached_analytics(workspace_id, name, params, compute):
+    """
+    Result of compute cached per workspace, name and request parameters,
+    issue changes in the workspace drop all of its entries
+    """
+    digest = hashlib.md5(
+        json.dumps(sorted(params), cls=DjangoJSONEncoder).encode()
+    ).hexdigest()
+    key = f"analytics:{workspace_id}:{get_analytics_version(workspace_id)}:{name}:{digest}"
+
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result, ANALYTICS_CACHE_TIMEOUT)
+    return result
+
+
+def burndown_plot(queryset, slug, project_id, cycle_id=None, module_id=None):
+    if cycle_id:
+        burndown_model = CycleBurndown
+        end_date = queryset.end_date
+
+    if module_id:
+        burndown_model = ModuleBurndown
+        end_date = queryset.target_date
+
+    # Get all dates between the two dates
+    date_range = [
+        queryset.start_date + timedelta(days=x)
+        for x in range((end_date - queryset.start_date).days + 1)
+    ]
+
+    chart_data = {str(date): 0 for date in date_range}
+
+    # Pending issues of every captured day in a single range read
+    snapshots = dict(
+        burndown_model.objects.filter(
+            **{burndown_model.entity_field: queryset},
+            date__gte=queryset.start_date,
+            date__lte=end_date,
+        ).values_list("date", "pending_issues")
+    )
+
+    # Days without a snapshot, upcoming ones or days the nightly task has
+    # not rebuilt yet, carry the latest known value
+    pending_issues = queryset.total_issues
     for date in date_range:
-        cumulative_pending_issues = total_issues
-        total_completed = 0
-        total_completed = sum(
-            [
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            ]
-        )
-        cumulative_pending_issues -= total_completed
-        chart_data[str(date)] = cumulative_pending_issues
+        pending_issues = snapshots.get(date, pending_issues)
+        chart_data[str(date)] = pending_issues
 
-    return chart_data
\ No newline at end of file
+    return chart_data
@@ -0,0 +1,119 @@
+# Python imports
+from datetime import timedelta
+
+# Django imports
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+# Third party imports
+import boto3
+from botocore.config import Config
+
+# Prefix of every export, only exports are listed and deleted under it
+EXPORT_PREFIX = "exports/"
+
+S3_BUCKET_SETTINGS = {
+    "storages.backends.s3boto3.S3Boto3Storage": "AWS_STORAGE_BUCKET_NAME",
+    "django_s3_storage.storage.S3Storage": "AWS_S3_BUCKET_NAME",
+}
+
+
+def get_export_bucket():
+    """
+    S3 client and bucket of the default storage, None when the files are
+    stored on disk. The exports do not go through the storage, which may
+    upload them public-read and hand out unsigned urls.
+    """
+    bucket_setting = S3_BUCKET_SETTINGS.get(settings.STORAGES["default"]["BACKEND"])
+    if bucket_setting is None:
+        return None, None
+
+    client = boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID or None,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY or None,
+        region_name=getattr(settings, "AWS_REGION", "") or None,
+        config=Config(
+            signature_version="s3v4",
+            s3={"addressing_style": "path" if settings.AWS_S3_ENDPOINT_URL else "auto"},
+        ),
+    )
+    return client, getattr(settings, bucket_setting)
+
+
+def public_url(client, bucket, url):
+    # MinIO is reached through the proxy of the web url, which forwards the
+    # signed path and host to the MinIO endpoint unchanged
+    custom_domain = getattr(settings, "AWS_S3_CUSTOM_DOMAIN", None)
+    internal = f"{client.meta.endpoint_url.rstrip('/')}/{bucket}"
+    if custom_domain and url.startswith(internal):
+        return f"{settings.AWS_S3_URL_PROTOCOL}//{custom_domain}{url[len(internal):]}"
+    return url
+
+
+def save_export(file, name, filename):
+    """
+    Upload an export privately and return a link which expires after
+    EXPORT_URL_EXPIRY seconds
+    """
+    key = f"{EXPORT_PREFIX}{name}"
+    client, bucket = get_export_bucket()
+    if client is None:
+        return default_storage.url(default_storage.save(key, File(file)))
+
+    # Uploaded in multipart chunks for large files
+    client.upload_fileobj(
+        file,
+        bucket,
+        key,
+        ExtraArgs={
+            "ACL": "private",
+            "ContentDisposition": f'attachment; filename="{filename}"',
+        },
+    )
+    url = client.generate_presigned_url(
+        "get_object",
+        Params={"Bucket": bucket, "Key": key},
+        ExpiresIn=settings.EXPORT_URL_EXPIRY,
+    )
+    return public_url(client, bucket, url)
+
+
+def delete_expired_exports():
+    """Delete the exports whose links expired, returns how many were deleted"""
+    expired_before = timezone.now() - timedelta(seconds=settings.EXPORT_URL_EXPIRY)
+    client, bucket = get_export_bucket()
+    if client is None:
+        return delete_expired_files(EXPORT_PREFIX.rstrip("/"), expired_before)
+
+    deleted = 0
+    for page in client.get_paginator("list_objects_v2").paginate(
+        Bucket=bucket, Prefix=EXPORT_PREFIX
+    ):
+        keys = [
+            {"Key": item["Key"]}
+            for item in page.get("Contents", [])
+            if item["LastModified"] < expired_before
+        ]
+        # A page holds at most 1000 keys, the limit of one delete request
+        if keys:
+            client.delete_objects(Bucket=bucket, Delete={"Objects": keys, "Quiet": True})
+            deleted += len(keys)
+    return deleted
+
+
+def delete_expired_files(path, expired_before):
+    if not default_storage.exists(path):
+        return 0
+    deleted = 0
+    directories, files = default_storage.listdir(path)
+    for directory in directories:
+        deleted += delete_expired_files(f"{path}/{directory}", expired_before)
+    for name in files:
+        if default_storage.get_modified_time(f"{path}/{name}") < expired_before:
+            default_storage.delete(f"{path}/{name}")
+            deleted += 1
+    return deleted
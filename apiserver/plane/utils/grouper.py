@@ -1,3 +1,7 @@
+# Django imports
+from django.db.models import Count
+
+
 def resolve_keys(group_keys, value):
     """resolve keys to a key which will be used for
     grouping
@@ -60,3 +64,74 @@ def group_results(results_data, group_by):
                 response_dict[str(group_attribute)].append(value)
 
     return response_dict
+
+
+# group_by keys of the serialized issue mapped to the database lookups
+GROUP_BY_FIELDS = {
+    "state": "state_id",
+    "state_detail.group": "state__group",
+    "priority": "priority",
+    "labels": "labels__id",
+    "assignees": "assignees__id",
+    "created_by": "created_by_id",
+    "project": "project_id",
+}
+
+
+def group_field(group_by):
+    """resolve the database lookup used for grouping
+
+    Args:
+        group_by (string): key which is used for grouping
+
+    Returns:
+        string: lookup of the issue field
+    """
+    field = GROUP_BY_FIELDS.get(group_by, None)
+    if field is None:
+        raise ValueError(f"Cannot group by {group_by}")
+    return field
+
+
+def group_filters(group_by, group_key):
+    """filters which restrict the issues to a single group
+
+    Args:
+        group_by (string): key which is used for grouping
+        group_key (string): the group to restrict to
+
+    Returns:
+        dict: filters for the issue queryset
+    """
+    field = group_field(group_by)
+
+    if group_key == str(None):
+        return {f"{field}__isnull": True}
+    return {field: group_key}
+
+
+def group_counts(queryset, group_by):
+    """count the issues of every group with a single aggregate query
+
+    Args:
+        queryset (obj): issue queryset without aggregate annotations
+        group_by (string): key which is used for grouping
+
+    Returns:
+        dict: issue count for every group key
+    """
+    field = group_field(group_by)
+
+    counts = dict()
+    if group_by == "priority":
+        counts = {"urgent": 0, "high": 0, "medium": 0, "low": 0, "None": 0}
+
+    for group in (
+        queryset.prefetch_related(None)
+        .order_by()
+        .values(field)
+        .annotate(count=Count("id", distinct=True))
+    ):
+        counts[str(group[field])] = group["count"]
+
+    return counts
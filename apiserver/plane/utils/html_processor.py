@@ -1,15 +1,44 @@
-from io import StringIO
+# Python imports
+import re
+from hashlib import sha1
+from html import unescape
 from html.parser import HTMLParser
+from io import StringIO
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Well formed start and end tags, the html parser ends them at the same >.
+# Any other < is left to the html parser.
+MARKUP_RE = re.compile(
+    r"<[a-zA-Z][a-zA-Z0-9]*"
+    r"(?:\s+[a-zA-Z_:][-a-zA-Z0-9_:.]*"
+    r"(?:\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s\"'=<>`]+))?)*\s*/?>"
+    r"|</[a-zA-Z][a-zA-Z0-9]*\s*>"
+)
+# Elements whose content the html parser reads as raw text
+RAW_TEXT_RE = re.compile(r"<(?:script|style)", re.I)
+# The html parser holds back trailing text which may end in a character
+# reference cut in half
+TRAILING_REFERENCE_RE = re.compile(r"&[^\s;]*\Z")
+
+# Shorter documents are stripped faster than looked up in the cache
+TEXT_CACHE_MIN_LENGTH = 4096
+TEXT_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class MLStripper(HTMLParser):
     """
     Markup Language Stripper
     """
+
     def __init__(self):
         super().__init__()
         self.reset()
         self.strict = False
-        self.convert_charrefs= True
+        self.convert_charrefs = True
         self.text = StringIO()
 
     def handle_data(self, d):
@@ -18,7 +47,83 @@ class MLStripper(HTMLParser):
     def get_data(self):
         return self.text.getvalue()
 
+
+def parse_text(html):
+    stripper = MLStripper()
+    stripper.feed(html)
+    return stripper.get_data()
+
+
 def strip_tags(html):
-    s = MLStripper()
-    s.feed(html)
-    return s.get_data()
+    """
+    Text of the html, the same as the html parser returns. Documents made of
+    well formed tags and text, which is what the editor writes, are stripped
+    with one regex pass, the others go through the html parser.
+    """
+    if RAW_TEXT_RE.search(html) or TRAILING_REFERENCE_RE.search(
+        html, max(len(html) - 34, 0)
+    ):
+        return parse_text(html)
+
+    texts = MARKUP_RE.split(html)
+    if any("<" in text for text in texts):
+        return parse_text(html)
+    return "".join(unescape(text) for text in texts)
+
+
+def html_digest(html):
+    return sha1(html.encode("utf-8")).hexdigest()
+
+
+def extract_text(html):
+    """Text of an html document, larger documents are cached by content hash"""
+    if len(html) < TEXT_CACHE_MIN_LENGTH:
+        return strip_tags(html)
+
+    key = f"html_text:{html_digest(html)}"
+    text = cache.get(key)
+    if text is None:
+        text = strip_tags(html)
+        cache.set(key, text, TEXT_CACHE_TIMEOUT)
+    return text
+
+
+def update_text(instance, html_field, text_field, empty=None):
+    """
+    Set the text of the html field of a model before it is saved, very large
+    documents keep their previous text until a worker extracted the new one,
+    queue_text_extraction queues it once the row is saved
+    """
+    html = getattr(instance, html_field)
+    instance._pending_text = None
+    if not html:
+        setattr(instance, text_field, empty)
+    elif len(html) < settings.HTML_TEXT_DEFER_LENGTH:
+        setattr(instance, text_field, extract_text(html))
+    else:
+        instance._pending_text = (html_field, text_field, html_digest(html))
+
+
+def queue_text_extraction(instance):
+    """
+    Queue the extraction left by update_text, called after the row is saved.
+    Outside of a transaction on_commit runs right away, the worker must not
+    read the row before it is written.
+    """
+    pending = getattr(instance, "_pending_text", None)
+    if pending is None:
+        return
+    from plane.bgtasks.html_text_task import extract_html_text
+
+    instance._pending_text = None
+    html_field, text_field, digest = pending
+    model, pk = instance._meta.label, str(instance.pk)
+    transaction.on_commit(
+        lambda: extract_html_text.delay(
+            model=model,
+            pk=pk,
+            html_field=html_field,
+            text_field=text_field,
+            digest=digest,
+        )
+    )
@@ -1,6 +1,8 @@
 from django.utils.timezone import make_aware
 from django.utils.dateparse import parse_datetime
 
+from plane.db.models import Issue
+
 def filter_state(params, filter, method):
     if method == "GET":
         states = params.get("state").split(",")
@@ -326,3 +328,25 @@ def issue_filters(query_params, method):
             func(query_params, filter, method)
 
     return filter
+
+
+def filter_columns(filters):
+    """Issue columns and relations the filters read"""
+    return sorted({lookup.split("__")[0] for lookup in filters})
+
+
+def compile_issue_filters(query_params):
+    """
+    Filters of a saved view in a normalized form, with the columns they
+    read. Building the queryset checks the lookups and the values once when
+    the view is saved, a FieldError, ValidationError or ValueError is
+    raised for invalid filters.
+    """
+    filters = {}
+    for lookup, value in sorted(issue_filters(query_params, "POST").items()):
+        if isinstance(value, (list, tuple)):
+            value = sorted({str(item) for item in value})
+        filters[lookup] = value
+
+    Issue.issue_objects.filter(**filters)
+    return filters, filter_columns(filters)
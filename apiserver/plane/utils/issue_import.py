@@ -0,0 +1,185 @@
+# Python imports
+import json
+from itertools import islice
+
+# Django imports
+from django.db import transaction
+from django.db.models import F
+
+# Module imports
+from plane.db.models import (
+    Importer,
+    IssueSequence,
+    Issue,
+    IssueActivity,
+    IssueComment,
+    IssueLink,
+    IssueLabel,
+    IssueAssignee,
+)
+from plane.db.models.analytic import invalidate_analytics
+from plane.db.models.issue import allocate_sequences, allocate_sort_orders
+from plane.utils.html_processor import extract_text
+
+
+def iter_ndjson(stream):
+    """Issues of a newline delimited JSON body, read line by line"""
+    for line in iter(stream.readline, b""):
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def import_issue_chunk(project, default_state, actor, service, issues_data):
+    """Write one chunk of imported issues and their relations in one transaction"""
+    workspace_id = project.workspace_id
+
+    with transaction.atomic():
+        # The sequence ids are reserved in the transaction of the chunk, a
+        # failed chunk gives them back
+        sequences = allocate_sequences(project.id, len(issues_data))
+        sort_orders = allocate_sort_orders(default_state.id, len(issues_data))
+
+        issues = []
+        for sequence_id, sort_order, issue_data in zip(
+            sequences, sort_orders, issues_data
+        ):
+            description_html = issue_data.get("description_html")
+            issues.append(
+                Issue(
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                    state_id=issue_data.get("state")
+                    if issue_data.get("state", False)
+                    else default_state.id,
+                    name=issue_data.get("name", "Issue Created through Bulk"),
+                    description_html=issue_data.get("description_html", "<p></p>"),
+                    description_stripped=(
+                        None
+                        if (description_html == "" or description_html is None)
+                        else extract_text(description_html)
+                    ),
+                    sequence_id=sequence_id,
+                    sort_order=sort_order,
+                    start_date=issue_data.get("start_date", None),
+                    target_date=issue_data.get("target_date", None),
+                    priority=issue_data.get("priority", None),
+                    # Bulk inserts skip the signals, every issue gets the
+                    # link to the original issue below
+                    link_count=1,
+                    created_by=actor,
+                )
+            )
+
+        Issue.objects.bulk_create(issues, batch_size=1000, ignore_conflicts=True)
+
+        bulk_sequences = []
+        bulk_issue_labels = []
+        bulk_issue_assignees = []
+        bulk_issue_activities = []
+        bulk_issue_comments = []
+        bulk_issue_links = []
+        for issue, issue_data in zip(issues, issues_data):
+            bulk_sequences.append(
+                IssueSequence(
+                    issue=issue,
+                    sequence=issue.sequence_id,
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                )
+            )
+            bulk_issue_labels.extend(
+                IssueLabel(
+                    issue=issue,
+                    label_id=label_id,
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                    created_by=actor,
+                )
+                for label_id in issue_data.get("labels_list", [])
+            )
+            bulk_issue_assignees.extend(
+                IssueAssignee(
+                    issue=issue,
+                    assignee_id=assignee_id,
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                    created_by=actor,
+                )
+                for assignee_id in issue_data.get("assignees_list", [])
+            )
+            bulk_issue_activities.append(
+                IssueActivity(
+                    issue=issue,
+                    actor=actor,
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                    comment=f"{actor.email} importer the issue from {service}",
+                    verb="created",
+                    created_by=actor,
+                )
+            )
+            bulk_issue_comments.extend(
+                IssueComment(
+                    issue=issue,
+                    comment_html=comment.get("comment_html", "<p></p>"),
+                    actor=actor,
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                    created_by=actor,
+                )
+                for comment in issue_data.get("comments_list", [])
+            )
+            bulk_issue_links.append(
+                IssueLink(
+                    issue=issue,
+                    url=issue_data.get("link", {}).get("url", "https://github.com"),
+                    title=issue_data.get("link", {}).get("title", "Original Issue"),
+                    project_id=project.id,
+                    workspace_id=workspace_id,
+                    created_by=actor,
+                )
+            )
+
+        IssueSequence.objects.bulk_create(bulk_sequences, batch_size=1000)
+        IssueLabel.objects.bulk_create(
+            bulk_issue_labels, batch_size=1000, ignore_conflicts=True
+        )
+        IssueAssignee.objects.bulk_create(
+            bulk_issue_assignees, batch_size=1000, ignore_conflicts=True
+        )
+        IssueActivity.objects.bulk_create(bulk_issue_activities, batch_size=1000)
+        IssueComment.objects.bulk_create(bulk_issue_comments, batch_size=1000)
+        IssueLink.objects.bulk_create(bulk_issue_links, batch_size=1000)
+
+    return issues
+
+
+def import_issues(
+    project, default_state, actor, service, issues_data, importer_id=None, chunk_size=1000
+):
+    """
+    Import an iterable of issues chunk by chunk, every chunk is committed
+    on its own and counted on the importer. When a chunk fails the chunks
+    before it stay imported.
+    """
+    try:
+        for chunk in chunked(issues_data, chunk_size):
+            issues = import_issue_chunk(project, default_state, actor, service, chunk)
+            if importer_id is not None:
+                Importer.objects.filter(pk=importer_id, project_id=project.id).update(
+                    imported_issues=F("imported_issues") + len(issues)
+                )
+            yield from issues
+    finally:
+        # Bulk inserts do not send the signals refreshing the analytics
+        invalidate_analytics(project.workspace_id, [project.id])
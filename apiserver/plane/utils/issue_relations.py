@@ -0,0 +1,119 @@
+# Python imports
+from collections import defaultdict
+
+# Django imports
+from django.db.models import Q
+
+# Module imports
+from plane.db.models import Issue, IssueAssignee, IssueBlocker, IssueLabel
+
+# Relation lists of the issue write serializers, with the relation model,
+# the field pointing to the issue and the field pointing to the related row
+RELATION_FIELDS = {
+    "assignees_list": (IssueAssignee, "issue", "assignee"),
+    "labels_list": (IssueLabel, "issue", "label"),
+    "blockers_list": (IssueBlocker, "block", "blocked_by"),
+    "blocks_list": (IssueBlocker, "blocked_by", "block"),
+}
+
+
+def set_issue_relations(
+    relations, project_id, workspace_id, created_by_id=None, updated_by_id=None
+):
+    """
+    Replace the related rows of many issues, relations maps a relation list
+    to the related ids of every issue. Only the rows which were removed are
+    deleted and only the new ones are inserted.
+    """
+    for field, issue_targets in relations.items():
+        model, issue_field, target_field = RELATION_FIELDS[field]
+
+        wanted = {
+            (str(issue_id), str(target_id))
+            for issue_id, target_ids in issue_targets.items()
+            for target_id in target_ids
+        }
+        existing = {
+            (str(issue_id), str(target_id)): pk
+            for pk, issue_id, target_id in model.objects.filter(
+                **{f"{issue_field}_id__in": list(issue_targets)}
+            ).values_list("pk", f"{issue_field}_id", f"{target_field}_id")
+        }
+
+        removed = [pk for pair, pk in existing.items() if pair not in wanted]
+        if removed:
+            model.objects.filter(pk__in=removed).delete()
+
+        model.objects.bulk_create(
+            [
+                model(
+                    **{
+                        f"{issue_field}_id": issue_id,
+                        f"{target_field}_id": target_id,
+                    },
+                    project_id=project_id,
+                    workspace_id=workspace_id,
+                    created_by_id=created_by_id,
+                    updated_by_id=updated_by_id,
+                )
+                for issue_id, target_id in wanted
+                if (issue_id, target_id) not in existing
+            ],
+            batch_size=100,
+            ignore_conflicts=True,
+        )
+
+
+def get_activity_instances(issue_ids):
+    """
+    Current values of the issues in the shape of IssueSerializer, limited
+    to the fields the activity tracking compares
+    """
+    instances = {
+        str(issue["id"]): {
+            "name": issue["name"],
+            "parent": str(issue["parent_id"]) if issue["parent_id"] else None,
+            "priority": issue["priority"],
+            "state": str(issue["state_id"]) if issue["state_id"] else None,
+            "description_html": issue["description_html"],
+            "start_date": issue["start_date"],
+            "target_date": issue["target_date"],
+            "estimate_point": issue["estimate_point"],
+            "labels": [],
+            "assignees": [],
+            "blocked_issues": [],
+            "blocker_issues": [],
+        }
+        for issue in Issue.objects.filter(pk__in=issue_ids).values(
+            "id",
+            "name",
+            "parent_id",
+            "priority",
+            "state_id",
+            "description_html",
+            "start_date",
+            "target_date",
+            "estimate_point",
+        )
+    }
+
+    related = defaultdict(list)
+    for issue_id, label_id in IssueLabel.objects.filter(
+        issue_id__in=issue_ids
+    ).values_list("issue_id", "label_id"):
+        related[(str(issue_id), "labels")].append(str(label_id))
+    for issue_id, assignee_id in IssueAssignee.objects.filter(
+        issue_id__in=issue_ids
+    ).values_list("issue_id", "assignee_id"):
+        related[(str(issue_id), "assignees")].append(str(assignee_id))
+    for block_id, blocked_by_id in IssueBlocker.objects.filter(
+        Q(block_id__in=issue_ids) | Q(blocked_by_id__in=issue_ids)
+    ).values_list("block_id", "blocked_by_id"):
+        blocker = {"block": str(block_id), "blocked_by": str(blocked_by_id)}
+        related[(str(blocked_by_id), "blocked_issues")].append(blocker)
+        related[(str(block_id), "blocker_issues")].append(blocker)
+
+    for (issue_id, field), values in related.items():
+        if issue_id in instances:
+            instances[issue_id][field] = values
+    return instances
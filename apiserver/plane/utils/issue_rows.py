@@ -0,0 +1,247 @@
+# Django imports
+from django.utils import timezone
+
+# Module imports
+from plane.utils.grouper import group_results
+from plane.db.models import (
+    IssueAssignee,
+    IssueLabel,
+    Label,
+    Project,
+    State,
+    User,
+    Workspace,
+)
+
+# Issue columns of the list rows, in the order of IssueLiteSerializer
+ISSUE_FIELDS = [
+    "id",
+    "created_at",
+    "updated_at",
+    "estimate_point",
+    "name",
+    "description",
+    "description_html",
+    "description_stripped",
+    "priority",
+    "start_date",
+    "target_date",
+    "sequence_id",
+    "sort_order",
+    "completed_at",
+    "archived_at",
+    "change_sequence",
+    "is_visible",
+    "created_by_id",
+    "updated_by_id",
+    "project_id",
+    "workspace_id",
+    "parent_id",
+    "state_id",
+]
+
+# Counter columns of the issue, listed before the other columns
+ISSUE_COUNTERS = [
+    "sub_issues_count",
+    "attachment_count",
+    "link_count",
+]
+
+# Annotations of the list querysets passed through when present
+ISSUE_ANNOTATIONS = [
+    "cycle_id",
+    "module_id",
+]
+
+# Counters and annotations in the order IssueLiteSerializer declares them
+DECLARED_FIELDS = [
+    "sub_issues_count",
+    "cycle_id",
+    "module_id",
+    "attachment_count",
+    "link_count",
+]
+
+# Foreign keys are rendered under the name of the relation
+FOREIGN_KEYS = {
+    "created_by_id": "created_by",
+    "updated_by_id": "updated_by",
+    "project_id": "project",
+    "workspace_id": "workspace",
+    "parent_id": "parent",
+    "state_id": "state",
+}
+
+
+def format_datetime(value):
+    # Same output as the rest framework DateTimeField
+    value = timezone.localtime(value).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def format_date(value):
+    return value.isoformat()
+
+
+# Values which are not json types, None is passed through
+FORMATTERS = {
+    "id": str,
+    "created_at": format_datetime,
+    "updated_at": format_datetime,
+    "start_date": format_date,
+    "target_date": format_date,
+    "completed_at": format_datetime,
+    "archived_at": format_date,
+    "cycle_id": str,
+    "module_id": str,
+    **{field: str for field in FOREIGN_KEYS},
+}
+
+# Labels and assignees are listed in the default ordering of their model
+ORDERINGS = {
+    "label": Label._meta.ordering,
+    "assignee": User._meta.ordering,
+}
+
+
+def issue_list_values(queryset, *fields):
+    """Values of the issue list, the joins and prefetches are left out"""
+    annotations = [
+        name for name in ISSUE_ANNOTATIONS if name in queryset.query.annotations
+    ]
+    fields = [
+        field
+        for field in fields
+        if field not in ISSUE_FIELDS
+        and field not in ISSUE_COUNTERS
+        and field not in annotations
+    ]
+    return (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .values(*ISSUE_FIELDS, *ISSUE_COUNTERS, *annotations, *fields)
+    )
+
+
+def side_table(queryset, fields):
+    return {
+        str(row["id"]): {
+            field: str(row[field]) if field == "id" else row[field]
+            for field in fields
+        }
+        for row in queryset.values(*fields)
+    }
+
+
+def related_ids(model, field, issue_ids):
+    """Related ids of every issue in the default ordering of the related model"""
+    ids = {}
+    for issue_id, related_id in (
+        model.objects.filter(issue_id__in=issue_ids)
+        .order_by(
+            *[
+                ("-" if ordering.startswith("-") else "")
+                + f"{field}__{ordering.lstrip('-')}"
+                for ordering in ORDERINGS[field]
+            ]
+        )
+        .values_list("issue_id", f"{field}_id")
+    ):
+        ids.setdefault(str(issue_id), []).append(str(related_id))
+    return ids
+
+
+def serialize_issue_rows(rows, normalized=False):
+    """
+    Issue list rows as IssueLiteSerializer renders them. The normalized
+    format keeps the ids on the issues and returns every state, project,
+    workspace, label and user once beside them.
+    """
+    issues = []
+    for row in rows:
+        issue = dict(row)
+        for field, formatter in FORMATTERS.items():
+            value = issue.get(field)
+            if value is not None:
+                issue[field] = formatter(value)
+        issues.append(issue)
+
+    issue_ids = [issue["id"] for issue in issues]
+    label_ids = related_ids(IssueLabel, "label", issue_ids)
+    assignee_ids = related_ids(IssueAssignee, "assignee", issue_ids)
+
+    states = side_table(
+        State.objects.filter(pk__in={issue["state_id"] for issue in issues}),
+        ["id", "name", "color", "group"],
+    )
+    projects = side_table(
+        Project.objects.filter(pk__in={issue["project_id"] for issue in issues}),
+        ["id", "identifier", "name"],
+    )
+    workspaces = side_table(
+        Workspace.objects.filter(pk__in={issue["workspace_id"] for issue in issues}),
+        ["name", "slug", "id"],
+    )
+    labels = side_table(
+        Label.objects.filter(
+            pk__in={label_id for ids in label_ids.values() for label_id in ids}
+        ),
+        ["id", "name", "color"],
+    )
+    users = side_table(
+        User.objects.filter(
+            pk__in={user_id for ids in assignee_ids.values() for user_id in ids}
+        ),
+        ["id", "first_name", "last_name", "email", "avatar", "is_bot"],
+    )
+
+    results = []
+    for issue in issues:
+        issue_labels = label_ids.get(issue["id"], [])
+        issue_assignees = assignee_ids.get(issue["id"], [])
+
+        result = {"id": issue["id"]}
+        if not normalized:
+            result["workspace_detail"] = workspaces.get(issue["workspace_id"])
+            result["project_detail"] = projects.get(issue["project_id"])
+            result["state_detail"] = states.get(issue["state_id"])
+            result["label_details"] = [labels[pk] for pk in issue_labels]
+            result["assignee_details"] = [users[pk] for pk in issue_assignees]
+        for field in DECLARED_FIELDS:
+            if field in issue:
+                result[field] = issue[field]
+        for field in ISSUE_FIELDS[1:]:
+            result[FOREIGN_KEYS.get(field, field)] = issue[field]
+        result["assignees"] = issue_assignees
+        result["labels"] = issue_labels
+        results.append(result)
+
+    if not normalized:
+        return results
+
+    return {
+        "issues": results,
+        "states": states,
+        "projects": projects,
+        "workspaces": workspaces,
+        "labels": labels,
+        "users": users,
+    }
+
+
+def is_normalized(request):
+    """Whether the client asked for the normalized issue list format"""
+    return request.GET.get("normalized", "false") == "true"
+
+
+def issue_list_data(request, queryset, group_by=False):
+    """Issue list of the request, grouped by the given key when asked"""
+    data = serialize_issue_rows(issue_list_values(queryset), is_normalized(request))
+    if not group_by:
+        return data
+    if is_normalized(request):
+        data["issues"] = group_results(data["issues"], group_by)
+        return data
+    return group_results(data, group_by)
@@ -2,22 +2,45 @@
 import re
 
 # Django imports
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import FloatField, Q, Value
 
 # Module imports
-from plane.db.models import Issue
+from plane.db.models.search import SEARCH_CONFIG, search_vector
+
+
+def search_query(query):
+    """Prefix query matching every word of the search text"""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    return SearchQuery(
+        " & ".join(f"{term}:*" for term in terms),
+        config=SEARCH_CONFIG,
+        search_type="raw",
+    )
+
+
+def search_queryset(query, queryset, extra_filters=Q()):
+    """
+    Rows whose name or content match the search text, best ranked first.
+    Substring matches on the name are served by the trigram index.
+    """
+    vector = search_vector("name", queryset.model.search_content_field)
+    ts_query = search_query(query)
+
+    q = Q(name__icontains=query) | extra_filters
+    if ts_query is not None:
+        queryset = queryset.annotate(
+            search=vector, rank=SearchRank(vector, ts_query)
+        )
+        q |= Q(search=ts_query)
+    else:
+        queryset = queryset.annotate(rank=Value(0, output_field=FloatField()))
+
+    return queryset.filter(q).order_by("-rank", "-created_at")
 
 
 def search_issues(query, queryset):
-    fields = ["name", "sequence_id"]
-    q = Q()
-    for field in fields:
-        if field == "sequence_id":
-            sequences = re.findall(r"\d+\.\d+|\d+", query)
-            for sequence_id in sequences:
-                q |= Q(**{"sequence_id": sequence_id})
-        else:
-            q |= Q(**{f"{field}__icontains": query})
-    return queryset.filter(
-        q,
-    ).distinct()
+    sequences = re.findall(r"\d+", query)
+    return search_queryset(query, queryset, Q(sequence_id__in=sequences))
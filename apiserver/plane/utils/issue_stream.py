@@ -0,0 +1,96 @@
+# Python imports
+import json
+
+# Django imports
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+# Third party imports
+from asgiref.sync import sync_to_async
+from sentry_sdk import capture_exception
+
+# Module imports
+from plane.api.serializers import IssueSerializer
+from plane.db.models import IssueBlocker, IssueLink, Label
+from plane.utils.issue_import import chunked
+
+# Issues fetched from the server side cursor and serialized at once
+STREAM_CHUNK_SIZE = 500
+
+
+def with_issue_details(queryset):
+    """Joins and prefetches of every relation IssueSerializer renders"""
+    return queryset.select_related(
+        "project",
+        "state__workspace",
+        "state__project",
+        "parent__state",
+        "parent__project",
+        "issue_cycle__cycle",
+        "issue_module__module",
+    ).prefetch_related(
+        Prefetch(
+            "labels", queryset=Label.objects.select_related("workspace", "project")
+        ),
+        "assignees",
+        Prefetch(
+            "blocked_issues",
+            queryset=IssueBlocker.objects.select_related("block__project"),
+        ),
+        Prefetch(
+            "blocker_issues",
+            queryset=IssueBlocker.objects.select_related("blocked_by__project"),
+        ),
+        Prefetch("issue_link", queryset=IssueLink.objects.select_related("created_by")),
+        "issue_attachment",
+    )
+
+
+def render_chunk(chunks):
+    """Next chunk of issues as JSON documents, None once the cursor is drained"""
+    chunk = next(chunks, None)
+    if chunk is None:
+        return None
+    return [
+        json.dumps(issue, cls=DjangoJSONEncoder)
+        for issue in IssueSerializer(chunk, many=True).data
+    ]
+
+
+async def stream_issues(queryset, ndjson=False):
+    """
+    Issues rendered by IssueSerializer as a JSON array, or one issue per
+    line. Rows are read through a server side cursor and the relations are
+    prefetched per chunk, so the number of queries grows with the chunks.
+    The database and serializer work of every chunk runs in the sync
+    thread, only one chunk is held in memory at a time.
+
+    The status is sent before the first chunk, a failure afterwards ends
+    the body with an error document instead of truncating it.
+    """
+    issues = with_issue_details(queryset).iterator(chunk_size=STREAM_CHUNK_SIZE)
+    chunks = chunked(issues, STREAM_CHUNK_SIZE)
+    separator = "\n" if ndjson else ","
+
+    if not ndjson:
+        yield "["
+    first = True
+    try:
+        while True:
+            lines = await sync_to_async(render_chunk)(chunks)
+            if lines is None:
+                break
+            if ndjson:
+                yield separator.join(lines) + separator
+            else:
+                yield ("" if first else separator) + separator.join(lines)
+            first = False
+    except Exception as e:
+        capture_exception(e)
+        error = json.dumps({"error": "Something went wrong please try again later"})
+        yield error + separator if ndjson else ("" if first else separator) + error
+    finally:
+        # Releases the server side cursor when the client goes away early
+        await sync_to_async(issues.close)()
+    if not ndjson:
+        yield "]"
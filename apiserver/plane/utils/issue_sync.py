@@ -0,0 +1,101 @@
+# Django imports
+from django.db.models import Q
+
+# Module imports
+from plane.db.models import Issue
+from plane.db.models.issue import change_horizon
+from plane.utils.issue_rows import (
+    issue_list_values,
+    is_normalized,
+    serialize_issue_rows,
+)
+from plane.utils.paginator import KeysetCursor
+
+SYNC_PER_PAGE = 500
+SYNC_MAX_PER_PAGE = 1000
+
+
+def get_sync_limit(request):
+    try:
+        per_page = int(request.GET.get("per_page", SYNC_PER_PAGE))
+    except ValueError:
+        per_page = SYNC_PER_PAGE
+    return max(1, min(per_page, SYNC_MAX_PER_PAGE))
+
+
+def get_watermark(request):
+    """Change sequence and issue id the client has seen last, None for a full sync"""
+    watermark = request.GET.get("watermark", False)
+    if not watermark:
+        return None
+    position = KeysetCursor.from_string(watermark).value
+    if position is None or not isinstance(position[0], int):
+        raise ValueError
+    return position
+
+
+def sync_issues(request, changes, visible, tombstones):
+    """
+    Issues changed after the watermark of the request. changes holds every
+    issue of the scope, visible the ones the client lists and tombstones the
+    deleted issues of the scope. Changed issues which are not visible anymore
+    are returned as deleted together with the tombstones.
+
+    Only the changes of finished transactions are returned, the next
+    watermark never skips a change committed after the page was read.
+    """
+    limit = get_sync_limit(request)
+    position = get_watermark(request)
+    horizon = change_horizon()
+
+    changed = changes.filter(change_sequence__lt=horizon)
+    if position is not None:
+        sequence, pk = position
+        seek = Q(change_sequence__gt=sequence)
+        if pk is not None:
+            seek |= Q(change_sequence=sequence, id__gt=pk)
+        changed = changed.filter(seek)
+
+    changed = list(
+        changed.order_by("change_sequence", "id").values_list(
+            "change_sequence", "id"
+        )[: limit + 1]
+    )
+    has_more = len(changed) > limit
+    changed = changed[:limit]
+
+    if has_more:
+        last_sequence, last_pk = changed[-1]
+        next_position = [last_sequence, str(last_pk)]
+    else:
+        # Everything below the horizon was read
+        last_sequence = horizon - 1
+        next_position = [last_sequence, None]
+
+    changed_ids = [pk for _, pk in changed]
+    visible_ids = set(
+        visible.filter(pk__in=changed_ids).values_list("id", flat=True).distinct()
+    )
+
+    deleted = [str(pk) for pk in changed_ids if pk not in visible_ids]
+    # A first sync has nothing to delete
+    if position is not None:
+        deleted += [
+            str(pk)
+            for pk in tombstones.filter(
+                change_sequence__gt=position[0],
+                change_sequence__lte=last_sequence,
+            ).values_list("issue_id", flat=True)
+        ]
+
+    issues = serialize_issue_rows(
+        issue_list_values(Issue.objects.filter(pk__in=visible_ids)),
+        is_normalized(request),
+    )
+
+    return {
+        "issues": issues,
+        "deleted": deleted,
+        "watermark": str(KeysetCursor(next_position, 0, False)),
+        "has_more": has_more,
+    }
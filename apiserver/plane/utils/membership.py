@@ -0,0 +1,68 @@
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models import WorkspaceMember, ProjectMember
+from plane.db.models.workspace import get_membership_version
+
+# Cached roles expire even without membership changes
+MEMBERSHIP_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def load_memberships(user_id):
+    return {
+        "workspaces": dict(
+            WorkspaceMember.objects.filter(member_id=user_id).values_list(
+                "workspace__slug", "role"
+            )
+        ),
+        "projects": {
+            str(project_id): (slug, role)
+            for project_id, slug, role in ProjectMember.objects.filter(
+                member_id=user_id
+            ).values_list("project_id", "workspace__slug", "role")
+        },
+    }
+
+
+def get_user_memberships(user_id):
+    """Workspace and project roles, cached until a membership of the user changes"""
+    key = f"memberships:{user_id}:{get_membership_version(user_id)}"
+    memberships = cache.get(key)
+    if memberships is None:
+        memberships = load_memberships(user_id)
+        cache.set(key, memberships, MEMBERSHIP_CACHE_TIMEOUT)
+    return memberships
+
+
+def get_memberships(request):
+    """Workspace and project roles of the user, loaded once per request"""
+    memberships = getattr(request, "_memberships", None)
+    if memberships is None:
+        memberships = get_user_memberships(request.user.id)
+        request._memberships = memberships
+    return memberships
+
+
+def get_workspace_role(request, slug):
+    return get_memberships(request)["workspaces"].get(slug)
+
+
+def get_project_role(request, slug, project_id):
+    slug_role = get_memberships(request)["projects"].get(str(project_id))
+    if slug_role is None or slug_role[0] != slug:
+        return None
+    return slug_role[1]
+
+
+def is_project_member(request, slug):
+    """Whether the user is a member of any project of the workspace"""
+    return any(
+        project_slug == slug
+        for project_slug, _ in get_memberships(request)["projects"].values()
+    )
+
+
+def get_member_project_ids(request):
+    """Projects of the user, replaces joins through the project members"""
+    return list(get_memberships(request)["projects"].keys())
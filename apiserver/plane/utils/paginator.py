@@ -1,6 +1,14 @@
 from rest_framework.response import Response
 from rest_framework.exceptions import ParseError
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
 from collections.abc import Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+import base64
+import binascii
+import json
 import math
 
 
@@ -44,6 +52,49 @@ class Cursor:
         return cls(*bits)
 
 
+def _encode_keyset_value(value):
+    # Keep the full precision of the ordering key, the django json encoder
+    # truncates the microseconds of datetime values
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+class KeysetCursor(Cursor):
+    """
+    Opaque cursor for the keyset paginator
+    value holds the ordering key and the primary key of the last seen row
+    """
+
+    def __str__(self):
+        payload = json.dumps(
+            [self.value, self.offset, int(self.is_prev)],
+            default=_encode_keyset_value,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @classmethod
+    def from_string(cls, value):
+        try:
+            bits = json.loads(base64.urlsafe_b64decode(value.encode()))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise ValueError
+        if not isinstance(bits, list) or len(bits) != 3:
+            raise ValueError
+        position, offset, is_prev = bits
+        if position is not None and (
+            not isinstance(position, list) or len(position) != 2
+        ):
+            raise ValueError
+        try:
+            return cls(position, int(offset), int(is_prev))
+        except (TypeError, ValueError):
+            raise ValueError
+
+
 class CursorResult(Sequence):
     def __init__(self, results, next, prev, hits=None, max_hits=None):
         self.results = results
@@ -141,6 +192,219 @@ class OffsetPaginator:
         )
 
 
+class KeysetPaginator:
+    """
+    The Keyset paginator seeks past the last seen row instead of
+    skipping rows with an offset, the primary key breaks the ties of the
+    ordering key so the cursors stay stable while rows are added
+    http://example.com/api/issues/?per_page=50&cursor=<opaque cursor>
+    """
+
+    def __init__(
+        self,
+        queryset,
+        order_by="-created_at",
+        max_limit=MAX_LIMIT,
+        on_results=None,
+    ):
+        self.desc = order_by.startswith("-")
+        self.key = order_by.lstrip("-")
+        self.queryset = queryset
+        self.max_limit = max_limit
+        self.on_results = on_results
+
+    def get_ordering(self, desc):
+        # Postgres puts nulls last while ascending and first while descending
+        if desc:
+            return (f"-{self.key}", "-pk")
+        return (self.key, "pk")
+
+    def get_seek_filter(self, position, desc):
+        value, pk = position
+        key = self.key
+        if desc:
+            if value is None:
+                return Q(**{f"{key}__isnull": True, "pk__lt": pk}) | Q(
+                    **{f"{key}__isnull": False}
+                )
+            return Q(**{f"{key}__lt": value}) | Q(**{key: value, "pk__lt": pk})
+
+        if value is None:
+            return Q(**{f"{key}__isnull": True, "pk__gt": pk})
+        return (
+            Q(**{f"{key}__gt": value})
+            | Q(**{key: value, "pk__gt": pk})
+            | Q(**{f"{key}__isnull": True})
+        )
+
+    def get_position(self, result):
+        # Rows of values querysets carry the ordering key under its lookup
+        if isinstance(result, dict):
+            value, pk = result.get(self.key), result["id"]
+        else:
+            value, pk = result, result.pk
+            for attribute in self.key.split("__"):
+                value = getattr(value, attribute, None)
+        if isinstance(value, (datetime, date, UUID, Decimal)):
+            value = _encode_keyset_value(value)
+        return [value, str(pk)]
+
+    def get_results(self, position, desc, limit):
+        queryset = self.queryset.order_by(*self.get_ordering(desc))
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position, desc))
+        return list(queryset[:limit])
+
+    def get_result(self, limit=100, cursor=None):
+        if cursor is None:
+            cursor = KeysetCursor(None, 0, 0)
+
+        limit = min(limit, self.max_limit)
+
+        # Going backwards reverses the ordering, the page is flipped back below
+        desc = self.desc != cursor.is_prev
+        results = self.get_results(cursor.value, desc, limit + 1)
+        has_more = len(results) > limit
+        results = results[:limit]
+        if cursor.is_prev:
+            results.reverse()
+
+        if results:
+            first_position = self.get_position(results[0])
+            last_position = self.get_position(results[-1])
+        else:
+            first_position = last_position = cursor.value
+
+        if cursor.is_prev:
+            next_cursor = KeysetCursor(
+                last_position, 0, False, cursor.value is not None
+            )
+            prev_cursor = KeysetCursor(first_position, 0, True, has_more)
+        else:
+            next_cursor = KeysetCursor(last_position, 0, False, has_more)
+            prev_cursor = KeysetCursor(
+                first_position, 0, True, cursor.value is not None
+            )
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=None,
+            max_hits=None,
+        )
+
+
+class UnionKeysetPaginator(KeysetPaginator):
+    """
+    Keyset paginator over the union of values querysets selecting the same
+    columns, every queryset is seeked and limited on its own so each one
+    reads its index and the database merges the pages with UNION ALL
+    """
+
+    def __init__(
+        self,
+        querysets,
+        order_by="-created_at",
+        max_limit=MAX_LIMIT,
+        on_results=None,
+    ):
+        super().__init__(
+            None, order_by=order_by, max_limit=max_limit, on_results=on_results
+        )
+        self.querysets = querysets
+
+    def get_ordering(self, desc):
+        # The union can only be ordered by the selected columns
+        if desc:
+            return (f"-{self.key}", "-id")
+        return (self.key, "id")
+
+    def get_results(self, position, desc, limit):
+        ordering = self.get_ordering(desc)
+        pages = []
+        for queryset in self.querysets:
+            queryset = queryset.order_by(*ordering)
+            if position is not None:
+                queryset = queryset.filter(self.get_seek_filter(position, desc))
+            pages.append(queryset[:limit])
+        return list(pages[0].union(*pages[1:], all=True).order_by(*ordering)[:limit])
+
+
+class GroupedKeysetPaginator(KeysetPaginator):
+    """
+    Returns the first page of every group from a single query, the rows
+    are ranked inside their group with a window function and the next
+    cursor of every group continues with the keyset paginator
+    """
+
+    def __init__(
+        self,
+        queryset,
+        group_field,
+        group_counts,
+        order_by="-created_at",
+        max_limit=MAX_LIMIT,
+        on_results=None,
+    ):
+        super().__init__(
+            queryset, order_by=order_by, max_limit=max_limit, on_results=on_results
+        )
+        self.group_field = group_field
+        self.group_counts = group_counts
+
+    def get_window_ordering(self):
+        if self.desc:
+            return [F(self.key).desc(nulls_first=True), F("pk").desc()]
+        return [F(self.key).asc(nulls_last=True), F("pk").asc()]
+
+    def get_result(self, limit=100, cursor=None):
+        limit = min(limit, self.max_limit)
+
+        queryset = (
+            self.queryset.annotate(
+                group_value=F(self.group_field),
+                group_rank=Window(
+                    expression=RowNumber(),
+                    partition_by=[F(self.group_field)],
+                    order_by=self.get_window_ordering(),
+                ),
+            )
+            .filter(group_rank__lte=limit)
+            .order_by("group_value", "group_rank")
+        )
+
+        grouped_results = {str(group_key): [] for group_key in self.group_counts}
+        for result in queryset:
+            group_value = (
+                result["group_value"]
+                if isinstance(result, dict)
+                else result.group_value
+            )
+            grouped_results.setdefault(str(group_value), []).append(result)
+
+        cursor_results = {}
+        for group_key, results in grouped_results.items():
+            hits = self.group_counts.get(group_key, len(results))
+            position = self.get_position(results[-1]) if results else None
+
+            if self.on_results:
+                results = self.on_results(results)
+
+            cursor_results[group_key] = CursorResult(
+                results=results,
+                next=KeysetCursor(position, 0, False, hits > len(results)),
+                prev=KeysetCursor(None, 0, True, False),
+                hits=hits,
+                max_hits=None,
+            )
+
+        return cursor_results
+
+
 class BasePaginator:
     """BasePaginator class can be inherited by any View to return a paginated view"""
 
@@ -198,6 +462,48 @@ class BasePaginator:
         except BadPaginationError as e:
             raise ParseError(detail=str(e))
 
+        # Return the response
+        response = Response(
+            self.get_paginated_data(
+                cursor_result,
+                on_results=on_results,
+                extra_stats=extra_stats,
+                controller=controller,
+            )
+        )
+
+        return response
+
+    def paginate_groups(
+        self,
+        request,
+        on_results=None,
+        paginator_cls=GroupedKeysetPaginator,
+        default_per_page=100,
+        max_per_page=100,
+        **paginator_kwargs,
+    ):
+        """Paginate the first page of every group on its own"""
+        per_page = self.get_per_page(request, default_per_page, max_per_page)
+
+        paginator = paginator_cls(**paginator_kwargs)
+        try:
+            cursor_results = paginator.get_result(limit=per_page)
+        except BadPaginationError as e:
+            raise ParseError(detail=str(e))
+
+        grouped_results = {}
+        for group_key, cursor_result in cursor_results.items():
+            grouped_results[group_key] = self.get_paginated_data(
+                cursor_result, on_results=on_results
+            )
+            grouped_results[group_key]["total_count"] = cursor_result.hits
+
+        return Response(grouped_results)
+
+    def get_paginated_data(
+        self, cursor_result, on_results=None, extra_stats=None, controller=None
+    ):
         # Serialize result according to the on_result function
         if on_results:
             results = on_results(cursor_result.results)
@@ -210,18 +516,13 @@ class BasePaginator:
         else:
             results = results
 
-        # Return the response
-        response = Response(
-            {
-                "next_cursor": str(cursor_result.next),
-                "prev_cursor": str(cursor_result.prev),
-                "next_page_results": cursor_result.next.has_results,
-                "prev_page_results": cursor_result.prev.has_results,
-                "count": cursor_result.__len__(),
-                "total_pages": cursor_result.max_hits,
-                "extra_stats": extra_stats,
-                "results": results,
-            }
-        )
-
-        return response
+        return {
+            "next_cursor": str(cursor_result.next),
+            "prev_cursor": str(cursor_result.prev),
+            "next_page_results": cursor_result.next.has_results,
+            "prev_page_results": cursor_result.prev.has_results,
+            "count": cursor_result.__len__(),
+            "total_pages": cursor_result.max_hits,
+            "extra_stats": extra_stats,
+            "results": results,
+        }
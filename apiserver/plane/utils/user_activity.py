@@ -0,0 +1,115 @@
+# Python imports
+import time
+from datetime import datetime, timezone as dt_timezone
+from uuid import uuid4
+
+# Django imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, DateTimeField, Value, When
+from django.db.models.functions import Greatest
+
+# Third party imports
+from redis.exceptions import ResponseError
+
+# Module imports
+from plane.db.models import User
+from plane.settings.redis import redis_instance
+
+# Redis hash of user id to the last request timestamp, waiting to be flushed
+LAST_ACTIVE_KEY = "user_last_active"
+# Seconds after which the buffer of an unfinished flush is taken over
+FLUSH_TIMEOUT = 5 * 60
+
+# Last time every user was written to the buffer by this process
+_recorded_at = {}
+
+
+def record_user_activity(user_id):
+    """Buffer the request time of the user, at most once per granularity"""
+    now = time.time()
+    if now - _recorded_at.get(user_id, 0) < settings.LAST_ACTIVE_GRANULARITY:
+        return
+
+    if len(_recorded_at) > 10000:
+        _recorded_at.clear()
+    _recorded_at[user_id] = now
+
+    redis_instance().hset(LAST_ACTIVE_KEY, str(user_id), now)
+
+
+def get_stale_flushes(ri, now):
+    """Buffers of flushes which failed or died, merged into the next flush"""
+    stale_keys = []
+    for key in ri.scan_iter(match=f"{LAST_ACTIVE_KEY}:flushing:*"):
+        started_at = int(key.decode().split(":")[2])
+        if now - started_at > FLUSH_TIMEOUT:
+            stale_keys.append(key)
+    return stale_keys
+
+
+def flush_user_activity(batch_size=500):
+    """
+    Write the buffered last active times in bulk and empty the buffer. A
+    failed flush leaves its buffer behind for the next flushes.
+    """
+    ri = redis_instance()
+    now = int(time.time())
+    keys = get_stale_flushes(ri, now)
+
+    # Requests arriving during the flush go to a fresh buffer
+    flushing_key = f"{LAST_ACTIVE_KEY}:flushing:{now}:{uuid4().hex}"
+    try:
+        ri.rename(LAST_ACTIVE_KEY, flushing_key)
+        keys.append(flushing_key)
+    except ResponseError as e:
+        # Nothing was buffered since the last flush
+        if "no such key" not in str(e).lower():
+            raise
+
+    last_active = {}
+    for key in keys:
+        for user_id, timestamp in ri.hgetall(key).items():
+            user_id = user_id.decode()
+            last_active[user_id] = max(float(timestamp), last_active.get(user_id, 0))
+
+    # Merged buffers may be older than the stored time, it never goes back
+    users = list(last_active.items())
+    for start in range(0, len(users), batch_size):
+        batch = users[start : start + batch_size]
+        User.objects.filter(pk__in=[user_id for user_id, _ in batch]).update(
+            last_active=Greatest(
+                "last_active",
+                Case(
+                    *[
+                        When(
+                            pk=user_id,
+                            then=Value(
+                                datetime.fromtimestamp(timestamp, tz=dt_timezone.utc)
+                            ),
+                        )
+                        for user_id, timestamp in batch
+                    ],
+                    output_field=DateTimeField(),
+                ),
+            ),
+            token_updated_at=None,
+        )
+
+    if keys:
+        ri.delete(*keys)
+    return len(users)
+
+
+def get_user_timezone(user_id):
+    """Timezone of the user, cached until the user is saved again"""
+    key = f"user_timezone:{user_id}"
+    user_timezone = cache.get(key)
+    if user_timezone is None:
+        user_timezone = (
+            User.objects.filter(pk=user_id)
+            .values_list("user_timezone", flat=True)
+            .first()
+        )
+        cache.set(key, user_timezone, 60 * 60)
+    return user_timezone
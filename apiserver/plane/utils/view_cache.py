@@ -0,0 +1,37 @@
+# Python imports
+import hashlib
+import json
+
+# Django imports
+from django.core.cache import cache
+
+# Module imports
+from plane.db.models.view import get_view_data_version
+from plane.utils.issue_filters import filter_columns
+
+VIEW_CACHE_TIMEOUT = 60 * 60
+
+
+def get_cached_view_issues(view, filters, compute):
+    """
+    Ids of the issues of a saved view and the filters of the request,
+    cached until the project data the filters read changes. The issues are
+    rendered from their ids on every request so the cached entry only
+    holds which issues match.
+    """
+    version = get_view_data_version(
+        view.project_id, set(view.query_columns) | set(filter_columns(filters))
+    )
+    if version is None:
+        return compute()
+
+    digest = hashlib.md5(
+        json.dumps(filters, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    key = f"view_issues:{view.id}:{view.updated_at.timestamp()}:{version}:{digest}"
+
+    issue_ids = cache.get(key)
+    if issue_ids is None:
+        issue_ids = compute()
+        cache.set(key, issue_ids, VIEW_CACHE_TIMEOUT)
+    return issue_ids